@@ -1,11 +1,14 @@
 from django.utils import timezone
 from datetime import timedelta
 
-from api.analytics.utils import get_ip_address
+from api.analytics.fingerprint import get_fingerprint
 from .models import FraudIncident
 from api.url.models import UrlStatus
+from django.contrib.auth import get_user_model
 from django.db.models import Count
 
+User = get_user_model()
+
 
 class FraudService:
     """Service for detecting, logging, and aggregating fraud-related activities."""
@@ -40,7 +43,7 @@ class FraudService:
                 "suspicious_ua",
                 {
                     "user_agent": user_agent,
-                    "ip": get_ip_address(request),
+                    "ip": get_fingerprint(request).ip,
                     "url": url_instance.short_url,
                 },
                 severity="low",
@@ -54,7 +57,7 @@ class FraudService:
                 "suspicious_ua",
                 {
                     "user_agent": user_agent,
-                    "ip": get_ip_address(request),
+                    "ip": get_fingerprint(request).ip,
                     "url": url_instance.short_url,
                     "pattern": "scripting",
                 },
@@ -97,7 +100,7 @@ class FraudService:
         FraudService.log_incident(
             "throttle",
             {
-                "ip": get_ip_address(request),
+                "ip": get_fingerprint(request).ip,
                 "user_id": user.id if user else None,
                 "rate": rate,
                 "endpoint": request.path,
@@ -157,7 +160,7 @@ class FraudService:
                 "suspicious_ua",
                 {
                     "user_agent": user_agent,
-                    "ip": get_ip_address(request),
+                    "ip": get_fingerprint(request).ip,
                     "url": url_instance.short_url,
                 },
                 severity="low",
@@ -171,7 +174,7 @@ class FraudService:
                 "suspicious_ua",
                 {
                     "user_agent": user_agent,
-                    "ip": get_ip_address(request),
+                    "ip": get_fingerprint(request).ip,
                     "url": url_instance.short_url,
                     "pattern": "scripting",
                 },
@@ -201,6 +204,115 @@ class FraudService:
             url=url_instance,
         )
 
+    @staticmethod
+    def record_burst_violations(url_instance, violations: dict, window: int) -> object:
+        """Add coalesced burst violations to the URL's current burst incident.
+
+        Violations extend the incident opened for the URL within the last
+        ``window`` seconds instead of opening a new one, so an attack yields
+        one incident carrying its total hit count.
+
+        Args:
+            url_instance: The URL instance.
+            violations (dict): ``hits``, ``ip``, ``last_ip``, ``first_seen``
+                and ``last_seen`` of the coalesced violations.
+            window (int): Seconds an incident keeps absorbing new violations.
+
+        Returns:
+            FraudIncident: The created or extended incident.
+        """
+        since = timezone.now() - timedelta(seconds=window)
+        incident = FraudIncident.objects.filter(
+            url=url_instance, incident_type="burst", created_at__gte=since
+        ).first()
+        if incident is None:
+            return FraudIncident.objects.create(
+                incident_type="burst",
+                details={
+                    "ip": violations["ip"],
+                    "url": url_instance.short_url,
+                    "reason": "Excessive requests detected",
+                    "hits": violations["hits"],
+                    "first_seen": violations["first_seen"],
+                    "last_seen": violations["last_seen"],
+                    "last_ip": violations["last_ip"],
+                },
+                severity="high",
+                url=url_instance,
+            )
+
+        incident.details["hits"] = incident.details.get("hits", 1) + violations["hits"]
+        incident.details["last_seen"] = violations["last_seen"]
+        incident.details["last_ip"] = violations["last_ip"]
+        incident.save(update_fields=["details"])
+        return incident
+
+    @staticmethod
+    def record_throttle_violations(violations: dict, window: int) -> int:
+        """Log aggregated throttle violations, one incident per window.
+
+        A window drained more than once extends the incident its first drain
+        created, found through the ``violation_key`` stored in its details.
+
+        Args:
+            violations (dict): Aggregated violations keyed by window member,
+                each with ``hits``, ``ip``, ``last_ip``, ``user_id``, ``rate``,
+                ``endpoint``, ``first_seen`` and ``last_seen``.
+            window (int): Length of an aggregation window in seconds.
+
+        Returns:
+            int: Number of incidents created.
+        """
+        # A window started at most one window ago and may be drained late
+        since = timezone.now() - timedelta(seconds=2 * window)
+        existing = {
+            incident.details["violation_key"]: incident
+            for incident in FraudIncident.objects.filter(
+                incident_type="throttle",
+                created_at__gte=since,
+                details__violation_key__in=list(violations),
+            )
+        }
+        user_ids = User.objects.filter(
+            id__in=[int(v["user_id"]) for v in violations.values() if v["user_id"]]
+        ).values_list("id", flat=True)
+        user_ids = set(user_ids)
+
+        created, updated = [], []
+        for key, violation in violations.items():
+            incident = existing.get(key)
+            if incident is not None:
+                details = incident.details
+                details["hits"] = details.get("hits", 1) + violation["hits"]
+                details["last_seen"] = violation["last_seen"]
+                details["last_ip"] = violation["last_ip"]
+                updated.append(incident)
+                continue
+            user_id = int(violation["user_id"]) if violation["user_id"] else None
+            created.append(
+                FraudIncident(
+                    incident_type="throttle",
+                    details={
+                        "ip": violation["ip"],
+                        "user_id": user_id,
+                        "rate": violation["rate"],
+                        "endpoint": violation["endpoint"],
+                        "hits": violation["hits"],
+                        "first_seen": violation["first_seen"],
+                        "last_seen": violation["last_seen"],
+                        "last_ip": violation["last_ip"],
+                        "violation_key": key,
+                    },
+                    severity="medium",
+                    # Users deleted since the violation keep their id in details
+                    user_id=user_id if user_id in user_ids else None,
+                )
+            )
+
+        FraudIncident.objects.bulk_create(created)
+        FraudIncident.objects.bulk_update(updated, ["details"])
+        return len(created)
+
     @staticmethod
     def flag_throttle_violation(request, view, rate) -> None:
         """Log throttle violations.
@@ -214,7 +326,7 @@ class FraudService:
         FraudService.log_incident(
             "throttle",
             {
-                "ip": get_ip_address(request),
+                "ip": get_fingerprint(request).ip,
                 "user_id": user.id if user else None,
                 "rate": rate,
                 "endpoint": request.path,
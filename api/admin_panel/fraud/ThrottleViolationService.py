@@ -0,0 +1,156 @@
+import logging
+
+from django.conf import settings
+from django.utils import timezone
+from redis.exceptions import NoScriptError
+
+from api.admin_panel.fraud.FraudService import FraudService
+from api.analytics.fingerprint import get_fingerprint
+from config.redis_utils import get_async_redis_client, get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# KEYS: violations hash, pending set
+# ARGV: pending member, ip, user id, rate, endpoint, now iso, ttl
+# Counts the violation and queues the hash when it is created, so a drained
+# hash is queued again by its next violation.
+RECORD_VIOLATION_LUA = """
+local hits = redis.call('HINCRBY', KEYS[1], 'hits', 1)
+if hits == 1 then
+    redis.call('HSET', KEYS[1], 'ip', ARGV[2], 'user_id', ARGV[3],
+        'rate', ARGV[4], 'endpoint', ARGV[5], 'first_seen', ARGV[6])
+    redis.call('EXPIRE', KEYS[1], ARGV[7])
+    redis.call('SADD', KEYS[2], ARGV[1])
+end
+redis.call('HSET', KEYS[1], 'last_ip', ARGV[2], 'last_seen', ARGV[6])
+return hits
+"""
+
+
+class ThrottleViolationService:
+    """Aggregates throttle violations in Redis and logs them as incidents in bulk.
+
+    A rejected request only counts itself in a hash per client, endpoint and
+    ``THROTTLE_INCIDENT_WINDOW``, in one Redis call. A periodic worker drains
+    the hashes into one fraud incident per window carrying the hit count and
+    the first and last violation, so a throttled client costs the database
+    one row per window however many requests it sends.
+    """
+
+    PENDING_KEY = "throttle_violations:pending"
+    KEY_PREFIX = "throttle_violations"
+
+    # Hashes left behind by a stopped worker expire instead of piling up
+    KEY_TTL = 86400
+
+    _script = None
+
+    def __init__(self) -> None:
+        """Initialize the ThrottleViolationService with Redis client."""
+        self.redis_client = get_redis_client()
+
+    @classmethod
+    def _key(cls, member: str) -> str:
+        return f"{cls.KEY_PREFIX}:{member}"
+
+    def _get_script(self):
+        if ThrottleViolationService._script is None:
+            ThrottleViolationService._script = self.redis_client.register_script(
+                RECORD_VIOLATION_LUA
+            )
+        return ThrottleViolationService._script
+
+    def _script_params(self, request, rate: str) -> tuple[list, list]:
+        user = request.user if request.user.is_authenticated else None
+        ip = get_fingerprint(request).ip
+        subject = f"user:{user.id}" if user else f"ip:{ip}"
+        now = timezone.now()
+        window = int(now.timestamp()) // settings.THROTTLE_INCIDENT_WINDOW
+        member = f"{window}:{subject}:{request.path}"
+        keys = [self._key(member), self.PENDING_KEY]
+        args = [
+            member,
+            ip,
+            user.id if user else "",
+            rate,
+            request.path,
+            now.isoformat(),
+            self.KEY_TTL,
+        ]
+        return keys, args
+
+    def record(self, request, rate: str) -> None:
+        """Count a throttled request.
+
+        Args:
+            request: The rejected request.
+            rate (str): The rate limit exceeded.
+        """
+        try:
+            keys, args = self._script_params(request, rate)
+            self._get_script()(keys=keys, args=args)
+        except Exception as e:
+            logger.error(
+                f"error happened while recording throttle violation: {str(e)}"
+            )
+
+    async def arecord(self, request, rate: str) -> None:
+        """Async variant of ``record`` built on ``redis.asyncio``.
+
+        Args:
+            request: The rejected request.
+            rate (str): The rate limit exceeded.
+        """
+        try:
+            keys, args = self._script_params(request, rate)
+            redis_client = get_async_redis_client()
+            try:
+                await redis_client.evalsha(
+                    self._get_script().sha, len(keys), *keys, *args
+                )
+            except NoScriptError:
+                await redis_client.eval(RECORD_VIOLATION_LUA, len(keys), *keys, *args)
+        except Exception as e:
+            logger.error(
+                f"error happened while recording throttle violation: {str(e)}"
+            )
+
+    def _drain(self, batch_size: int) -> dict[str, dict]:
+        members = self.redis_client.spop(self.PENDING_KEY, batch_size)
+        if not members:
+            return {}
+        # Read and delete together, so violations counted meanwhile are never
+        # lost: they land in a new hash and queue it again
+        pipe = self.redis_client.pipeline()
+        for member in members:
+            pipe.hgetall(self._key(member))
+            pipe.delete(self._key(member))
+        results = pipe.execute()
+        violations = {}
+        for member, data in zip(members, results[::2]):
+            if data:
+                violations[member] = {**data, "hits": int(data["hits"])}
+        return violations
+
+    def process(self, batch_size: int | None = None) -> dict:
+        """Log queued violations, one incident per client, endpoint and window.
+
+        Args:
+            batch_size (int, optional): Maximum windows to handle. Defaults to
+                ``THROTTLE_VIOLATION_BATCH_SIZE``.
+
+        Returns:
+            dict: Number of windows handled, incidents created, and violations.
+        """
+        violations = self._drain(batch_size or settings.THROTTLE_VIOLATION_BATCH_SIZE)
+        if not violations:
+            return {"windows": 0, "created": 0, "hits": 0}
+
+        created = FraudService.record_throttle_violations(
+            violations, window=settings.THROTTLE_INCIDENT_WINDOW
+        )
+        return {
+            "windows": len(violations),
+            "created": created,
+            "hits": sum(v["hits"] for v in violations.values()),
+        }
@@ -0,0 +1,180 @@
+import logging
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.db import transaction
+
+from api.admin_panel.system.models import SystemConfiguration
+from config.redis_utils import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+TRUE_VALUES = ("true", "1", "yes", "on")
+FALSE_VALUES = ("false", "0", "no", "off")
+
+
+class ConfigCacheService:
+    """Per-process snapshot of the system configuration.
+
+    Every key of ``ALLOWED_CONFIGS_SCHEMA`` is loaded in one query and
+    converted to its schema type, so reading a config on the request path is
+    a dictionary lookup. Writes through ``ConfigService`` bump a version in
+    Redis and publish it; a listener thread marks the snapshot stale when a
+    new version arrives, and the next read reloads it. Missed messages are
+    caught by comparing versions every ``CONFIG_SNAPSHOT_RECHECK_INTERVAL``
+    seconds.
+    """
+
+    VERSION_KEY = "system_config:version"
+    CHANNEL = "system_config:changed"
+
+    _lock = threading.Lock()
+    _snapshot = None
+    _version = None
+    _stale = False
+    _next_check = 0.0
+    _pid = None
+    _listener = None
+
+    @classmethod
+    def get(cls, key: str):
+        """Get the typed value of a configuration key.
+
+        Args:
+            key (str): A key of ``ALLOWED_CONFIGS_SCHEMA``.
+
+        Returns:
+            The stored value converted to the schema type, or the schema
+                default when the key is unset or its value is invalid.
+
+        Raises:
+            KeyError: If the key is not in ``ALLOWED_CONFIGS_SCHEMA``.
+        """
+        snapshot = cls._snapshot
+        if (
+            snapshot is None
+            or cls._stale
+            or time.monotonic() >= cls._next_check
+            or cls._pid != os.getpid()
+        ):
+            snapshot = cls._refresh()
+        return snapshot[key]
+
+    @classmethod
+    def _refresh(cls) -> dict:
+        with cls._lock:
+            if cls._pid != os.getpid():
+                # Threads do not survive a fork, the child needs its own listener
+                cls._pid = os.getpid()
+                cls._listener = None
+                cls._snapshot = None
+            cls._ensure_listener()
+
+            cls._stale = False
+            cls._next_check = (
+                time.monotonic() + settings.CONFIG_SNAPSHOT_RECHECK_INTERVAL
+            )
+            version = cls._read_version()
+            if (
+                cls._snapshot is not None
+                and version is not None
+                and version == cls._version
+            ):
+                return cls._snapshot
+
+            cls._snapshot = cls._load()
+            cls._version = version
+            return cls._snapshot
+
+    @staticmethod
+    def _read_version() -> int | None:
+        try:
+            return int(get_redis_client().get(ConfigCacheService.VERSION_KEY) or 0)
+        except Exception as e:
+            logger.error(f"error happened while reading config version: {str(e)}")
+            return None
+
+    @staticmethod
+    def _load() -> dict:
+        schema = settings.ALLOWED_CONFIGS_SCHEMA
+        snapshot = {key: spec["default"] for key, spec in schema.items()}
+        stored = SystemConfiguration.objects.filter(key__in=schema).values_list(
+            "key", "value"
+        )
+        for key, value in stored:
+            try:
+                snapshot[key] = ConfigCacheService._convert(value, schema[key]["type"])
+            except (TypeError, ValueError):
+                logger.warning(f"ignoring invalid value of config {key}: {value!r}")
+        return snapshot
+
+    @staticmethod
+    def _convert(value: str, expected_type: type):
+        if expected_type is bool:
+            lowered = str(value).lower()
+            if lowered in TRUE_VALUES:
+                return True
+            if lowered in FALSE_VALUES:
+                return False
+            raise ValueError(f"invalid boolean value: {value}")
+        return expected_type(value)
+
+    @classmethod
+    def _ensure_listener(cls) -> None:
+        if cls._listener is not None and cls._listener.is_alive():
+            return
+        cls._listener = threading.Thread(
+            target=cls._listen, name="config-snapshot-listener", daemon=True
+        )
+        cls._listener.start()
+
+    @classmethod
+    def _listen(cls) -> None:
+        while True:
+            try:
+                pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(cls.CHANNEL)
+                # Changes published while we were disconnected were missed,
+                # compare versions on the next read
+                cls._next_check = 0.0
+                while True:
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        cls._handle_message(message)
+            except Exception as e:
+                logger.error(f"error happened while listening for config: {str(e)}")
+                time.sleep(1.0)
+
+    @classmethod
+    def _handle_message(cls, message: dict) -> None:
+        try:
+            version = int(message["data"])
+        except (KeyError, TypeError, ValueError):
+            version = None
+        if version is None or version != cls._version:
+            cls._stale = True
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Reload this process's snapshot and notify the others after commit."""
+        cls._stale = True
+        transaction.on_commit(cls._publish)
+
+    @classmethod
+    def _publish(cls) -> None:
+        try:
+            redis_client = get_redis_client()
+            version = redis_client.incr(cls.VERSION_KEY)
+            redis_client.publish(cls.CHANNEL, version)
+        except Exception as e:
+            logger.error(f"error happened while publishing config change: {str(e)}")
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop the snapshot so the next read loads it again."""
+        with cls._lock:
+            cls._snapshot = None
+            cls._version = None
+            cls._stale = False
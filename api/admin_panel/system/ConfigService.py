@@ -1,3 +1,4 @@
+from api.admin_panel.system.ConfigCacheService import ConfigCacheService
 from api.admin_panel.system.models import SystemConfiguration
 
 
@@ -51,6 +52,7 @@ class ConfigService:
         config, created = SystemConfiguration.objects.get_or_create(key=key)
         config.value = value
         config.save()
+        ConfigCacheService.invalidate()
         return config
 
     @staticmethod
@@ -76,4 +78,6 @@ class ConfigService:
             except Exception as e:
                 errors[key] = str(e)
 
+        if results:
+            ConfigCacheService.invalidate()
         return {"results": results, "errors": errors}
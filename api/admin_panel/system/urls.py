@@ -4,10 +4,34 @@ from api.admin_panel.system.views import (
     ListSystemConfigurationView,
     SpecificSystemConfigurationView,
     BatchCreateSystemConfigurationView,
+    UrlBloomFilterStatsView,
+    RuleContextStatsView,
+    UserAgentCacheStatsView,
+    BurstPreFilterStatsView,
 )
 
 urlpatterns = [
     path("health/", HealthView.as_view(), name="system-health"),
+    path(
+        "bloom-filter/",
+        UrlBloomFilterStatsView.as_view(),
+        name="system-bloom-filter",
+    ),
+    path(
+        "rule-context/",
+        RuleContextStatsView.as_view(),
+        name="system-rule-context",
+    ),
+    path(
+        "user-agent-cache/",
+        UserAgentCacheStatsView.as_view(),
+        name="system-user-agent-cache",
+    ),
+    path(
+        "burst-prefilter/",
+        BurstPreFilterStatsView.as_view(),
+        name="system-burst-prefilter",
+    ),
     path("config/", ListSystemConfigurationView.as_view(), name="system-config-list"),
     path(
         "config/batch/",
@@ -9,6 +9,10 @@ from api.throttling import UserRateThrottle, IPRateThrottle
 from api.custom_auth.permissions import IsAdmin
 from rest_framework.permissions import IsAuthenticated
 from api.admin_panel.system.ConfigService import ConfigService
+from api.analytics.utils import user_agent_cache_stats
+from api.url.redirection.context import ContextLookupStats
+from api.url.services.BurstProtectionService import PreFilterStats
+from api.url.services.UrlBloomFilterService import UrlBloomFilterService
 from .serializers import SystemConfigurationSerializer
 
 
@@ -30,6 +34,82 @@ class HealthView(GenericAPIView):
         )
 
 
+class UrlBloomFilterStatsView(GenericAPIView):
+    authentication_classes = [CookieJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsAdmin]
+    throttle_classes = [UserRateThrottle, IPRateThrottle]
+
+    def get(self, request):
+        try:
+            stats = UrlBloomFilterService().stats()
+            return SuccessResponse(
+                data=stats,
+                message="Bloom filter stats retrieved successfully",
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            return ErrorResponse(
+                message=str(e), status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class RuleContextStatsView(GenericAPIView):
+    authentication_classes = [CookieJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsAdmin]
+    throttle_classes = [UserRateThrottle, IPRateThrottle]
+
+    def get(self, request):
+        try:
+            stats = ContextLookupStats.stats()
+            return SuccessResponse(
+                data=stats,
+                message="Rule context lookup stats retrieved successfully",
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            return ErrorResponse(
+                message=str(e), status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class UserAgentCacheStatsView(GenericAPIView):
+    authentication_classes = [CookieJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsAdmin]
+    throttle_classes = [UserRateThrottle, IPRateThrottle]
+
+    def get(self, request):
+        try:
+            stats = user_agent_cache_stats()
+            return SuccessResponse(
+                data=stats,
+                message="User agent cache stats retrieved successfully",
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            return ErrorResponse(
+                message=str(e), status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class BurstPreFilterStatsView(GenericAPIView):
+    authentication_classes = [CookieJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsAdmin]
+    throttle_classes = [UserRateThrottle, IPRateThrottle]
+
+    def get(self, request):
+        try:
+            stats = PreFilterStats.stats()
+            return SuccessResponse(
+                data=stats,
+                message="Burst pre-filter stats retrieved successfully",
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            return ErrorResponse(
+                message=str(e), status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
 class ListSystemConfigurationView(GenericAPIView):
     authentication_classes = [CookieJWTAuthentication]
     permission_classes = [IsAuthenticated, IsAdmin]
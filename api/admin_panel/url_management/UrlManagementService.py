@@ -1,5 +1,8 @@
 from api.analytics.models import Visit
 from api.url.models import Url, UrlStatus
+from api.url.services.RedirectCachePolicyService import RedirectCachePolicyService
+from api.url.services.UrlBloomFilterService import UrlBloomFilterService
+from api.url.services.UrlCacheService import UrlCacheService
 from django.contrib.auth import get_user_model
 from typing import Dict, List, Any
 from django.db import transaction
@@ -58,7 +61,9 @@ class UrlManagementService:
         Returns:
             dict: URLs list and pagination info.
         """
-        queryset = Url.objects.select_related("url_status", "user").all()
+        queryset = RedirectCachePolicyService.with_rule_flags(
+            Url.objects.select_related("url_status", "user")
+        )
         if url_status:
             queryset = queryset.filter(url_status__state=url_status)
         if date_order:
@@ -97,7 +102,9 @@ class UrlManagementService:
         Returns:
             dict: Contains 'urls' (QuerySet) and 'pagination' details.
         """
-        urls = Url.objects.select_related("url_status", "user").filter(user__id=user_id)
+        urls = RedirectCachePolicyService.with_rule_flags(
+            Url.objects.select_related("url_status", "user").filter(user__id=user_id)
+        )
 
         paginator = Paginator(urls, limit)
         page_obj = paginator.get_page(page)
@@ -125,7 +132,10 @@ class UrlManagementService:
             int: Number of URLs deleted.
         """
         urls_to_delete = Url.objects.filter(id__in=url_ids)
+        short_urls = list(urls_to_delete.values_list("short_url", flat=True))
         count, _ = urls_to_delete.delete()
+        UrlCacheService().invalidate(*short_urls)
+        UrlBloomFilterService().remove(*short_urls)
         return count
 
     @staticmethod
@@ -138,6 +148,7 @@ class UrlManagementService:
         Returns:
             dict: Results with success_count and failed_items.
         """
+        flagged_short_urls = []
         with transaction.atomic():
             success_count = 0
             failed_items = []
@@ -150,6 +161,7 @@ class UrlManagementService:
                     url.url_status.state = item["state"]
                     url.url_status.reason = item.get("reason", "")
                     url.url_status.save()
+                    flagged_short_urls.append(url.short_url)
                     success_count += 1
 
                 except Url.DoesNotExist:
@@ -158,7 +170,8 @@ class UrlManagementService:
                     )
                 except Exception as e:
                     failed_items.append({"url_id": item["url_id"], "error": str(e)})
-            return {"success_count": success_count, "failed_items": failed_items}
+        UrlCacheService().invalidate(*flagged_short_urls)
+        return {"success_count": success_count, "failed_items": failed_items}
 
     @staticmethod
     def get_url_details(url_id: str) -> dict:
@@ -194,4 +207,5 @@ class UrlManagementService:
         url_instance = Url.objects.get(short_url=short_url)
         url_instance.long_url = new_destination
         url_instance.save()
+        UrlCacheService().invalidate(url_instance.short_url)
         return url_instance
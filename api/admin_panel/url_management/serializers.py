@@ -0,0 +1,15 @@
+from rest_framework import serializers
+
+from api.url.models import BurstThreshold
+
+
+class BurstThresholdSerializer(serializers.ModelSerializer):
+    """Validates burst threshold overrides; omitted fields inherit."""
+
+    class Meta:
+        model = BurstThreshold
+        fields = BurstThreshold.FIELDS
+        extra_kwargs = {
+            field: {"required": False, "allow_null": True, "min_value": 1}
+            for field in BurstThreshold.FIELDS
+        }
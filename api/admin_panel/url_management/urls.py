@@ -6,6 +6,9 @@ from .views import (
     ListUrlsView,
     UpdateUrlDestinationView,
     GetUrlDetailsView,
+    ListBurstThresholdsView,
+    UrlBurstThresholdView,
+    RoleBurstThresholdView,
 )
 from django.urls import path
 
@@ -21,4 +24,19 @@ urlpatterns = [
     ),
     path("details/<int:url_id>/", GetUrlDetailsView.as_view(), name="get-url-details"),
     path("user/<int:user_id>/", GetUserUrlsView.as_view(), name="get-user-urls"),
+    path(
+        "burst-thresholds/",
+        ListBurstThresholdsView.as_view(),
+        name="list-burst-thresholds",
+    ),
+    path(
+        "burst-thresholds/url/<int:url_id>/",
+        UrlBurstThresholdView.as_view(),
+        name="url-burst-thresholds",
+    ),
+    path(
+        "burst-thresholds/role/<str:role>/",
+        RoleBurstThresholdView.as_view(),
+        name="role-burst-thresholds",
+    ),
 ]
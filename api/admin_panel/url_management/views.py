@@ -5,9 +5,11 @@ from rest_framework.permissions import IsAuthenticated
 from api.custom_auth.authentication import CookieJWTAuthentication
 from api.throttling import IPRateThrottle, UserRateThrottle
 from api.admin_panel.url_management.UrlManagementService import UrlManagementService
+from api.admin_panel.url_management.serializers import BurstThresholdSerializer
+from api.url.services.BurstThresholdService import BurstThresholdService
 from api.url.serializers.UrlStatusSerializer import UrlStatusSerializer
 from api.url.serializers.UrlSerializer import ResponseUrlSerializer
-from api.custom_auth.permissions import IsAdminOrStaff
+from api.custom_auth.permissions import IsAdmin, IsAdminOrStaff
 from api.url.models import Url
 from config.utils.responses import SuccessResponse, ErrorResponse
 from api.analytics.serializers.VisitSerializer import VisitSerializer
@@ -218,3 +220,135 @@ class UpdateUrlDestinationView(APIView):
             return ErrorResponse(
                 message=str(e), status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class ListBurstThresholdsView(APIView):
+    throttle_classes = [IPRateThrottle, UserRateThrottle]
+    authentication_classes = [CookieJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsAdmin]
+
+    def get(self, request):
+        try:
+            result = BurstThresholdService.list_thresholds()
+            return SuccessResponse(
+                data=result,
+                message="Burst thresholds retrieved successfully",
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            return ErrorResponse(
+                message=str(e), status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class UrlBurstThresholdView(APIView):
+    throttle_classes = [IPRateThrottle, UserRateThrottle]
+    authentication_classes = [CookieJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsAdmin]
+
+    def get(self, request, url_id):
+        try:
+            result = BurstThresholdService.get_url_thresholds(url_id)
+            return SuccessResponse(
+                data=result,
+                message="URL burst thresholds retrieved successfully",
+                status=status.HTTP_200_OK,
+            )
+        except Url.DoesNotExist:
+            return ErrorResponse(
+                message="URL not found", status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            return ErrorResponse(
+                message=str(e), status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    def put(self, request, url_id):
+        serializer = BurstThresholdSerializer(data=request.data)
+        if not serializer.is_valid():
+            return ErrorResponse(
+                errors=serializer.errors,
+                message="Validation failed",
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            result = BurstThresholdService.set_url_thresholds(
+                url_id, serializer.validated_data
+            )
+            return SuccessResponse(
+                data=result,
+                message="URL burst thresholds updated successfully",
+                status=status.HTTP_200_OK,
+            )
+        except Url.DoesNotExist:
+            return ErrorResponse(
+                message="URL not found", status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            return ErrorResponse(
+                message=str(e), status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    def delete(self, request, url_id):
+        try:
+            BurstThresholdService.delete_url_thresholds(url_id)
+            return SuccessResponse(
+                message="URL burst thresholds reset to defaults",
+                status=status.HTTP_200_OK,
+            )
+        except Url.DoesNotExist:
+            return ErrorResponse(
+                message="URL not found", status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            return ErrorResponse(
+                message=str(e), status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class RoleBurstThresholdView(APIView):
+    throttle_classes = [IPRateThrottle, UserRateThrottle]
+    authentication_classes = [CookieJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsAdmin]
+
+    def put(self, request, role):
+        if role not in User.Role.values:
+            return ErrorResponse(
+                message="Role not found", status=status.HTTP_404_NOT_FOUND
+            )
+        serializer = BurstThresholdSerializer(data=request.data)
+        if not serializer.is_valid():
+            return ErrorResponse(
+                errors=serializer.errors,
+                message="Validation failed",
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            result = BurstThresholdService.set_role_thresholds(
+                role, serializer.validated_data
+            )
+            return SuccessResponse(
+                data=result,
+                message="Role burst thresholds updated successfully",
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            return ErrorResponse(
+                message=str(e), status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    def delete(self, request, role):
+        if role not in User.Role.values:
+            return ErrorResponse(
+                message="Role not found", status=status.HTTP_404_NOT_FOUND
+            )
+        try:
+            BurstThresholdService.delete_role_thresholds(role)
+            return SuccessResponse(
+                message="Role burst thresholds reset to defaults",
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            return ErrorResponse(
+                message=str(e), status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
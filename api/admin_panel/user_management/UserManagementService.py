@@ -5,6 +5,9 @@ from django.core.paginator import Paginator
 from typing import List
 
 from api.url.models import Url
+from api.url.services.RedirectCachePolicyService import RedirectCachePolicyService
+from api.url.services.UrlBloomFilterService import UrlBloomFilterService
+from api.url.services.UrlCacheService import UrlCacheService
 User = get_user_model()
 
 
@@ -98,7 +101,15 @@ class UserManagementService:
             int: Number of users deleted.
         """
         users_to_delete = User.objects.filter(id__in=user_ids)
+        # Their links are deleted by cascade and must stop resolving from cache
+        short_urls = list(
+            Url.objects.filter(user__in=users_to_delete).values_list(
+                "short_url", flat=True
+            )
+        )
         count, _ = users_to_delete.delete()
+        UrlCacheService().invalidate(*short_urls)
+        UrlBloomFilterService().remove(*short_urls)
         return count
 
     @staticmethod
@@ -111,7 +122,7 @@ class UserManagementService:
         Returns:
             dict: User details with associated URLs.
         """
-        url_instances = Url.objects.select_related("user", "url_status").filter(
-            user__id=user_id
+        url_instances = RedirectCachePolicyService.with_rule_flags(
+            Url.objects.select_related("user", "url_status").filter(user__id=user_id)
         )
         return {"user": url_instances[0].user, "urls": url_instances}
@@ -0,0 +1,116 @@
+from api.analytics.utils import (
+    ParsedUserAgent,
+    convert_ip_to_location,
+    get_ip_address,
+    hash_ip,
+    parse_user_agent,
+)
+
+SUSPICIOUS_UA_PATTERNS = ["curl", "wget", "python-urllib", "go-http-client"]
+
+_UNSET = object()
+
+
+class ClientFingerprint:
+    """Client attributes of one request, each derived at most once.
+
+    The IP is read up front; hashing, geolocation, user agent parsing and
+    language parsing run on first access and are memoized, so burst
+    protection, rule evaluation, visit recording and fraud detection share
+    one result instead of repeating the work. Use ``get_fingerprint`` to
+    get the instance attached to a request.
+    """
+
+    __slots__ = (
+        "ip",
+        "user_agent_string",
+        "referer",
+        "accept_language",
+        "_hashed_ip",
+        "_country",
+        "_user_agent",
+        "_language",
+    )
+
+    def __init__(self, request) -> None:
+        self.ip = get_ip_address(request)
+        self.user_agent_string = request.META.get("HTTP_USER_AGENT", "")
+        self.referer = request.META.get("HTTP_REFERER", "")
+        self.accept_language = request.META.get("HTTP_ACCEPT_LANGUAGE", "")
+        self._hashed_ip = _UNSET
+        self._country = _UNSET
+        self._user_agent = _UNSET
+        self._language = _UNSET
+
+    @property
+    def hashed_ip(self) -> str:
+        if self._hashed_ip is _UNSET:
+            self._hashed_ip = hash_ip(self.ip)
+        return self._hashed_ip
+
+    @property
+    def country(self) -> str:
+        """Country code of the IP, or "Unknown"."""
+        if self._country is _UNSET:
+            self._country = convert_ip_to_location(self.ip)
+        return self._country
+
+    @property
+    def country_resolved(self) -> bool:
+        return self._country is not _UNSET
+
+    @property
+    def user_agent(self) -> ParsedUserAgent:
+        """Parsed user agent with os, browser, device and is_mobile."""
+        if self._user_agent is _UNSET:
+            self._user_agent = parse_user_agent(self.user_agent_string)
+        return self._user_agent
+
+    @property
+    def user_agent_parsed(self) -> bool:
+        return self._user_agent is not _UNSET
+
+    @property
+    def language(self) -> str | None:
+        """Primary language from the Accept-Language header."""
+        if self._language is _UNSET:
+            self._language = parse_accept_language(self.accept_language)
+        return self._language
+
+    @property
+    def suspicious_ua_pattern(self) -> str | None:
+        """Why the user agent looks automated: "empty", "scripting" or None."""
+        if not self.user_agent_string or self.user_agent_string.strip() == "":
+            return "empty"
+        lowered = self.user_agent_string.lower()
+        if any(pattern in lowered for pattern in SUSPICIOUS_UA_PATTERNS):
+            return "scripting"
+        return None
+
+
+def parse_accept_language(accept_language) -> str | None:
+    """Parse Accept-Language header to get primary language."""
+    if not accept_language:
+        return None
+    # Parse "en-US,en;q=0.9" -> "en"
+    primary = accept_language.split(",")[0].split("-")[0].split(";")[0].strip()
+    return primary.lower()
+
+
+def get_fingerprint(request) -> ClientFingerprint:
+    """Get the fingerprint of a request, creating it on first use.
+
+    Args:
+        request: A Django ``HttpRequest`` or a DRF ``Request`` wrapping one.
+
+    Returns:
+        ClientFingerprint: The fingerprint shared by everything handling the request.
+    """
+    # DRF requests wrap the Django request; attach to the inner one so both
+    # views of the same request share a fingerprint
+    http_request = getattr(request, "_request", request)
+    fingerprint = getattr(http_request, "client_fingerprint", None)
+    if fingerprint is None:
+        fingerprint = ClientFingerprint(http_request)
+        http_request.client_fingerprint = fingerprint
+    return fingerprint
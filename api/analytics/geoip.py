@@ -0,0 +1,212 @@
+import ipaddress
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"IPCC"
+FORMAT_VERSION = 1
+# magic, version, IPv4 range count, IPv6 range count
+HEADER = struct.Struct(">4sHII")
+COUNTRY_WIDTH = 2
+# Address width in bytes per IP version; records are start, end, country
+WIDTHS = {4: 4, 6: 16}
+
+# How often a worker checks whether the database file was replaced
+RELOAD_CHECK_INTERVAL = 60
+
+_database = None
+_database_lock = threading.Lock()
+_next_check = 0.0
+
+
+class IpCountryDatabase:
+    """Read-only IP range to country table backed by a memory-mapped file.
+
+    The file holds the IPv4 and IPv6 ranges as fixed-width big-endian
+    records sorted by range start, so a lookup is a binary search comparing
+    raw bytes and never parses the file. The mapping is shared, which lets
+    every worker on a host use the same page cache copy.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Map the database file.
+
+        Args:
+            path (str): Path of a file written by ``write_database``.
+
+        Raises:
+            ValueError: If the file is not an IP country database.
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            self.mtime = os.fstat(file.fileno()).st_mtime
+            self._mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, v4_count, v6_count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mm.close()
+            raise ValueError(f"{path} is not an IP country database")
+
+        self._sections = {}
+        offset = HEADER.size
+        for ip_version, count in ((4, v4_count), (6, v6_count)):
+            width = WIDTHS[ip_version]
+            record_size = 2 * width + COUNTRY_WIDTH
+            self._sections[ip_version] = (offset, count, width, record_size)
+            offset += count * record_size
+
+        if len(self._mm) < offset:
+            self._mm.close()
+            raise ValueError(f"{path} is truncated")
+
+    def __len__(self) -> int:
+        return sum(section[1] for section in self._sections.values())
+
+    def lookup(self, ip: str) -> str | None:
+        """Find the country of an IP address.
+
+        Args:
+            ip (str): IPv4 or IPv6 address.
+
+        Returns:
+            str | None: Two-letter country code, or None if the address is
+                invalid or not covered by any range.
+        """
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return None
+        if address.version == 6 and address.ipv4_mapped is not None:
+            address = address.ipv4_mapped
+
+        base, count, width, record_size = self._sections[address.version]
+        key = address.packed
+        mm = self._mm
+
+        # Last record whose start is <= key
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            position = base + middle * record_size
+            if mm[position : position + width] <= key:
+                low = middle + 1
+            else:
+                high = middle
+        if low == 0:
+            return None
+
+        position = base + (low - 1) * record_size
+        if key > mm[position + width : position + 2 * width]:
+            return None
+        country = mm[position + 2 * width : position + record_size]
+        return country.decode("ascii")
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+def write_database(ranges, path: str) -> dict:
+    """Write IP ranges to a database file, replacing it atomically.
+
+    Args:
+        ranges: Iterable of (start, end, country) with ``ipaddress`` addresses
+            of the same version and a two-letter country code.
+        path (str): Destination file.
+
+    Returns:
+        dict: Number of IPv4 and IPv6 ranges written and overlapping ranges dropped.
+    """
+    by_version = {4: [], 6: []}
+    for start, end, country in ranges:
+        by_version[start.version].append((start.packed, end.packed, country))
+
+    sections = {}
+    dropped = 0
+    for ip_version, records in by_version.items():
+        records.sort()
+        kept = []
+        for record in records:
+            # Overlaps would break the binary search, keep the earlier range
+            if kept and record[0] <= kept[-1][1]:
+                dropped += 1
+                continue
+            kept.append(record)
+        sections[ip_version] = kept
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(
+                HEADER.pack(
+                    MAGIC, FORMAT_VERSION, len(sections[4]), len(sections[6])
+                )
+            )
+            for ip_version in (4, 6):
+                for start, end, country in sections[ip_version]:
+                    file.write(start + end + country.upper().encode("ascii"))
+        # Replacing rather than rewriting keeps workers' existing mappings valid
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    return {"ipv4": len(sections[4]), "ipv6": len(sections[6]), "dropped": dropped}
+
+
+def get_ip_country_database() -> IpCountryDatabase | None:
+    """Get this process's database, opening or reopening it when needed.
+
+    The file is mapped on first use, after any fork, and remapped when the
+    import command replaces it.
+
+    Returns:
+        IpCountryDatabase | None: The database, or None if ``GEOIP_DB_PATH``
+            is unset or the file does not exist.
+    """
+    global _database, _next_check
+
+    now = time.monotonic()
+    if now < _next_check:
+        return _database
+
+    with _database_lock:
+        if now < _next_check:
+            return _database
+        _next_check = now + RELOAD_CHECK_INTERVAL
+
+        path = settings.GEOIP_DB_PATH
+        try:
+            mtime = os.stat(path).st_mtime if path else None
+        except OSError:
+            mtime = None
+
+        if mtime is None:
+            _database = None
+        elif _database is None or _database.path != path or _database.mtime != mtime:
+            try:
+                _database = IpCountryDatabase(path)
+            except (OSError, ValueError, struct.error) as e:
+                logger.error(
+                    f"error happened while loading ip country database: {str(e)}"
+                )
+                _database = None
+        return _database
+
+
+def reset_ip_country_database() -> None:
+    """Forget the mapped database so the next lookup reads the settings again."""
+    global _database, _next_check
+
+    with _database_lock:
+        _database = None
+        _next_check = 0.0
@@ -1,13 +1,9 @@
 import json
 import logging
+from asgiref.sync import sync_to_async
 from api.analytics.models import Visit
-from config.redis_utils import get_redis_client
-from api.analytics.utils import (
-    convert_ip_to_location,
-    get_ip_address,
-    hash_ip,
-    parse_user_agent,
-)
+from config.redis_utils import get_async_redis_client, get_redis_client
+from api.analytics.fingerprint import get_fingerprint
 from config.settings_utils import get_analytics_track_ip
 from datetime import timedelta
 from django.utils import timezone
@@ -20,47 +16,47 @@ class AnalyticsService:
     """Service for recording and analyzing URL visit data."""
 
     @staticmethod
-    def record_visit(request, url_instance) -> None:
-        """Record a visit to a URL with analytics data using redis.
+    def build_visit(request, url_instance) -> dict:
+        """Collect the analytics data for a visit without touching Redis.
 
         Args:
             request: The HTTP request object.
             url_instance (Url): The URL instance being visited.
+
+        Returns:
+            dict: 'hashed_ip' (None when IP tracking is disabled), the 'visit'
+                payload for the analytics buffer and an optional 'fraud' payload.
         """
+        fingerprint = get_fingerprint(request)
         track_ip = get_analytics_track_ip()
         if track_ip:
-            ip = get_ip_address(request)
-            country = convert_ip_to_location(ip)
-            hashed_ip = hash_ip(ip)
+            country = fingerprint.country
+            hashed_ip = fingerprint.hashed_ip
         else:
-            ip = None
             country = None
             hashed_ip = None
 
-        raw_ua = request.META.get("HTTP_USER_AGENT", "")
-        user_agent = parse_user_agent(raw_ua)
+        user_agent = fingerprint.user_agent
 
         fraud_data = None
-        if not raw_ua or raw_ua.strip() == "":
+        pattern = fingerprint.suspicious_ua_pattern
+        if pattern == "empty":
             fraud_data = {
                 "incident_type": "suspicious_ua",
                 "details": {
-                    "user_agent": raw_ua,
-                    "ip": get_ip_address(request),
+                    "user_agent": fingerprint.user_agent_string,
+                    "ip": fingerprint.ip,
                     "url": url_instance.short_url,
                 },
                 "severity": "low",
                 "url_id": url_instance.id,
             }
-        elif any(
-            pattern in raw_ua.lower()
-            for pattern in ["curl", "wget", "python-urllib", "go-http-client"]
-        ):
+        elif pattern == "scripting":
             fraud_data = {
                 "incident_type": "suspicious_ua",
                 "details": {
-                    "user_agent": raw_ua,
-                    "ip": get_ip_address(request),
+                    "user_agent": fingerprint.user_agent_string,
+                    "ip": fingerprint.ip,
                     "url": url_instance.short_url,
                     "pattern": "scripting",
                 },
@@ -68,40 +64,98 @@ class AnalyticsService:
                 "url_id": url_instance.id,
             }
 
+        return {
+            "hashed_ip": hashed_ip,
+            "fraud": fraud_data,
+            "visit": {
+                "url_id": url_instance.id,
+                "hashed_ip": hashed_ip,
+                "geolocation": country,
+                "operating_system": user_agent.os,
+                "browser": user_agent.browser,
+                "device": user_agent.device,
+                "referer": fingerprint.referer,
+                "new_visitor": False,
+                "timestamp": timezone.now().isoformat(),
+            },
+        }
+
+    @staticmethod
+    def record_visit(request, url_instance) -> None:
+        """Record a visit to a URL with analytics data using redis.
+
+        Args:
+            request: The HTTP request object.
+            url_instance (Url): The URL instance being visited.
+        """
+        visit = AnalyticsService.build_visit(request, url_instance)
+        hashed_ip = visit["hashed_ip"]
+        visit_data = visit["visit"]
+
         try:
             redis_conn = get_redis_client()
 
             redis_conn.incr(f"url:{url_instance.id}:visits")
-            is_new_visitor = False
-            if track_ip:
+            if hashed_ip:
 
                 is_new = redis_conn.sadd(f"url:{url_instance.id}:unique_ips", hashed_ip)
-                is_new_visitor = bool(is_new)
+                visit_data["new_visitor"] = bool(is_new)
                 if is_new:
                     redis_conn.incr(f"url:{url_instance.id}:unique_visits")
 
-            current_time = timezone.now().isoformat()
-            redis_conn.set(f"url:{url_instance.id}:last_accessed", current_time)
+            redis_conn.set(
+                f"url:{url_instance.id}:last_accessed", visit_data["timestamp"]
+            )
 
-            if fraud_data:
-                redis_conn.rpush("analytics:fraud", json.dumps(fraud_data))
+            if visit["fraud"]:
+                redis_conn.rpush("analytics:fraud", json.dumps(visit["fraud"]))
 
-            visit_data = {
-                "url_id": url_instance.id,
-                "hashed_ip": hashed_ip,
-                "geolocation": country,
-                "operating_system": user_agent["os"],
-                "browser": user_agent["browser"],
-                "device": user_agent["device"],
-                "referer": request.META.get("HTTP_REFERER", ""),
-                "new_visitor": is_new_visitor,
-                "timestamp": current_time,
-            }
             redis_conn.rpush("analytics:visits", json.dumps(visit_data))
 
         except Exception as e:
             logger.error(f"error happened while recording a visit: {str(e)}")
 
+    @staticmethod
+    async def arecord_visit(request, url_instance) -> None:
+        """Async variant of ``record_visit`` built on ``redis.asyncio``.
+
+        Building the visit reads system configuration and may geolocate the
+        IP, so it runs in the sync thread; the Redis writes are pipelined.
+
+        Args:
+            request: The HTTP request object.
+            url_instance (Url): The URL instance being visited.
+        """
+        visit = await sync_to_async(AnalyticsService.build_visit)(
+            request, url_instance
+        )
+        hashed_ip = visit["hashed_ip"]
+        visit_data = visit["visit"]
+
+        try:
+            redis_conn = get_async_redis_client()
+
+            pipe = redis_conn.pipeline()
+            pipe.incr(f"url:{url_instance.id}:visits")
+            pipe.set(f"url:{url_instance.id}:last_accessed", visit_data["timestamp"])
+            if visit["fraud"]:
+                pipe.rpush("analytics:fraud", json.dumps(visit["fraud"]))
+            if hashed_ip:
+                pipe.sadd(f"url:{url_instance.id}:unique_ips", hashed_ip)
+            results = await pipe.execute()
+
+            pipe = redis_conn.pipeline()
+            if hashed_ip:
+                is_new = results[-1]
+                visit_data["new_visitor"] = bool(is_new)
+                if is_new:
+                    pipe.incr(f"url:{url_instance.id}:unique_visits")
+            pipe.rpush("analytics:visits", json.dumps(visit_data))
+            await pipe.execute()
+
+        except Exception as e:
+            logger.error(f"error happened while recording a visit: {str(e)}")
+
     @staticmethod
     def get_top_visited_urls(user_id: int, num: int) -> object:
         """Get the top visited URLs for a user.
@@ -114,13 +168,14 @@ class AnalyticsService:
             QuerySet: Top visited URLs ordered by visit count.
         """
         from api.url.models import Url
-
-        return (
-            Url.objects.select_related("url_status", "user")
-            .filter(user_id=user_id)
-            .order_by("-visits")[:num]
+        from api.url.services.RedirectCachePolicyService import (
+            RedirectCachePolicyService,
         )
 
+        return RedirectCachePolicyService.with_rule_flags(
+            Url.objects.select_related("url_status", "user").filter(user_id=user_id)
+        ).order_by("-visits")[:num]
+
     @staticmethod
     def get_url_summary(url_instance: object, range_days: int = 7) -> dict:
         """Get detailed analytics summary for a URL.
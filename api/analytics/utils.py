@@ -1,9 +1,14 @@
 import hashlib
+import json
+import threading
 from api.analytics.models import Visit
 from django.conf import settings
 import geocoder
 import ipaddress
+from user_agents import parse
+from api.analytics.geoip import get_ip_country_database
 from config.redis_utils import get_redis_client
+from config.utils.lru import LRUCache
 
 
 def hash_ip(ip: str) -> str:
@@ -23,6 +28,10 @@ def ip_address_match(hashed_ip: str) -> bool:
 
 
 def convert_ip_to_location(ip: str) -> str:
+    database = get_ip_country_database()
+    if database is not None:
+        return database.lookup(ip) or "Unknown"
+
     try:
         client = get_redis_client()
         key = f"ip_country:{ip}"
@@ -42,31 +51,144 @@ def convert_ip_to_location(ip: str) -> str:
         return geo.country if geo.country else "Unknown"
 
 
-def parse_user_agent(user_agent: str) -> dict[str, str]:
-    from user_agents import parse
+class ParsedUserAgent:
+    """Parsed user agent fields, shared by every request with the same UA."""
 
-    if not user_agent:
+    __slots__ = ("os", "browser", "device", "is_mobile")
+
+    def __init__(self, os: str, browser: str, device: str, is_mobile: bool) -> None:
+        self.os = os
+        self.browser = browser
+        self.device = device
+        self.is_mobile = is_mobile
+
+    def __getitem__(self, key: str):
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ParsedUserAgent):
+            return NotImplemented
+        return self.to_list() == other.to_list()
+
+    def to_list(self) -> list:
+        return [self.os, self.browser, self.device, self.is_mobile]
+
+    def to_dict(self) -> dict:
         return {
-            "os": "unknown",
-            "browser": "unknown",
-            "device": "unknown",
-            "is_mobile": False,
+            "os": self.os,
+            "browser": self.browser,
+            "device": self.device,
+            "is_mobile": self.is_mobile,
         }
+
+
+UNKNOWN_USER_AGENT = ParsedUserAgent("unknown", "unknown", "unknown", False)
+
+USER_AGENT_CACHE_KEY = "user_agent_cache"
+USER_AGENT_CACHE_TTL = 86400
+
+_user_agent_cache = LRUCache(maxsize=settings.USER_AGENT_CACHE_SIZE)
+_user_agent_stats_lock = threading.Lock()
+_user_agent_stats = {"redis_hits": 0, "parsed": 0}
+
+
+def _count_user_agent(field: str) -> None:
+    with _user_agent_stats_lock:
+        _user_agent_stats[field] += 1
+
+
+def _user_agent_digest(user_agent: str) -> str:
+    return hashlib.blake2b(user_agent.encode(), digest_size=16).hexdigest()
+
+
+def _parse_user_agent_uncached(user_agent: str) -> ParsedUserAgent:
     try:
         ua = parse(user_agent)
-        return {
-            "os": ua.os.family.lower(),
-            "browser": ua.browser.family.lower(),
-            "device": ua.device.family.lower(),
-            "is_mobile": ua.is_mobile,
-        }
+        return ParsedUserAgent(
+            os=ua.os.family.lower(),
+            browser=ua.browser.family.lower(),
+            device=ua.device.family.lower(),
+            is_mobile=ua.is_mobile,
+        )
     except Exception:
-        return {
-            "os": "unknown",
-            "browser": "unknown",
-            "device": "unknown",
-            "is_mobile": False,
-        }
+        return UNKNOWN_USER_AGENT
+
+
+def _get_shared_user_agent(digest: str) -> ParsedUserAgent | None:
+    try:
+        cached = get_redis_client().hget(USER_AGENT_CACHE_KEY, digest)
+        return ParsedUserAgent(*json.loads(cached)) if cached else None
+    except Exception:
+        return None
+
+
+def _set_shared_user_agent(digest: str, parsed: ParsedUserAgent) -> None:
+    try:
+        pipe = get_redis_client().pipeline()
+        pipe.hset(USER_AGENT_CACHE_KEY, digest, json.dumps(parsed.to_list()))
+        # The whole hash expires daily, which bounds it against UA churn
+        pipe.expire(USER_AGENT_CACHE_KEY, USER_AGENT_CACHE_TTL, nx=True)
+        pipe.execute()
+    except Exception:
+        pass
+
+
+def parse_user_agent(user_agent: str) -> ParsedUserAgent:
+    """Parse a user agent string, caching results by UA.
+
+    Traffic repeats a small set of user agents, so parsed results are kept
+    in a per-process LRU and, when ``USER_AGENT_CACHE_REDIS`` is on, in a
+    Redis hash keyed by UA digest shared by all workers. The returned record
+    is shared between callers and must not be modified.
+    """
+    if not user_agent:
+        return UNKNOWN_USER_AGENT
+
+    parsed = _user_agent_cache.get(user_agent)
+    if parsed is not None:
+        return parsed
+
+    shared = settings.USER_AGENT_CACHE_REDIS
+    digest = _user_agent_digest(user_agent) if shared else None
+    if shared:
+        parsed = _get_shared_user_agent(digest)
+        if parsed is not None:
+            _count_user_agent("redis_hits")
+
+    if parsed is None:
+        parsed = _parse_user_agent_uncached(user_agent)
+        _count_user_agent("parsed")
+        if shared:
+            _set_shared_user_agent(digest, parsed)
+
+    _user_agent_cache.set(user_agent, parsed)
+    return parsed
+
+
+def user_agent_cache_stats() -> dict:
+    """Hit/miss counters of the user agent cache in this process.
+
+    Returns:
+        dict: Local LRU stats plus Redis hits and actual parses.
+    """
+    with _user_agent_stats_lock:
+        counters = dict(_user_agent_stats)
+    return {
+        "local": _user_agent_cache.stats(),
+        "redis_enabled": settings.USER_AGENT_CACHE_REDIS,
+        **counters,
+    }
+
+
+def clear_user_agent_cache() -> None:
+    """Empty the local user agent cache and reset its counters."""
+    _user_agent_cache.clear()
+    with _user_agent_stats_lock:
+        for field in _user_agent_stats:
+            _user_agent_stats[field] = 0
 
 
 def anonymize_ip(ip_address: str) -> str:
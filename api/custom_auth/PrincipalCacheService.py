@@ -0,0 +1,123 @@
+import json
+import logging
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import DEFERRED
+
+from config.redis_utils import get_redis_client
+from config.utils.lru import LRUCache
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+class PrincipalCacheService:
+    """Two-tier cache of authenticated users, keyed by user id and token ``jti``.
+
+    Authentication reads the principal from a per-process LRU, then from a
+    Redis hash per user holding one entry per access token, and only loads
+    the user row on a miss in both. Cached principals are rebuilt as user
+    instances whose other fields are deferred, so views can use them like
+    the loaded user and only pay a query for a field that is not cached.
+    Saving or deleting a user drops its entries from both tiers.
+    """
+
+    KEY_PREFIX = "auth_principal"
+    FIELDS = (
+        "id",
+        "username",
+        "email",
+        "role",
+        "is_active",
+        "is_staff",
+        "is_superuser",
+    )
+
+    # One token per user is kept locally, a request with another token
+    # falls through to Redis
+    _local = LRUCache(
+        maxsize=settings.AUTH_PRINCIPAL_LOCAL_SIZE,
+        ttl=settings.AUTH_PRINCIPAL_LOCAL_TTL,
+    )
+
+    def __init__(self) -> None:
+        """Initialize the PrincipalCacheService with Redis client."""
+        self.redis_client = get_redis_client()
+
+    @classmethod
+    def _key(cls, user_id) -> str:
+        return f"{cls.KEY_PREFIX}:{user_id}"
+
+    def get(self, user_id, jti: str):
+        """Get the cached user of an access token.
+
+        Args:
+            user_id: The token's user id.
+            jti (str): The token's unique identifier.
+
+        Returns:
+            User | None: The user with only the cached fields loaded, or None
+                on a miss.
+        """
+        entry = self._local.get(str(user_id))
+        if entry is not None and entry[0] == jti:
+            return self._build(entry[1])
+        try:
+            cached = self.redis_client.hget(self._key(user_id), jti)
+        except Exception as e:
+            logger.error(f"error happened while reading principal cache: {str(e)}")
+            return None
+        if cached is None:
+            return None
+        data = json.loads(cached)
+        self._local.set(str(user_id), (jti, data))
+        return self._build(data)
+
+    def set(self, user, jti: str, ttl: int) -> None:
+        """Cache the user of an access token.
+
+        Args:
+            user (User): The user loaded from the database.
+            jti (str): The token's unique identifier.
+            ttl (int): Seconds the entry may be used, at most the token's
+                remaining lifetime.
+        """
+        data = {field: getattr(user, field) for field in self.FIELDS}
+        ttl = max(1, min(ttl, settings.AUTH_PRINCIPAL_CACHE_TTL))
+        try:
+            pipe = self.redis_client.pipeline()
+            pipe.hset(self._key(user.pk), jti, json.dumps(data))
+            pipe.expire(self._key(user.pk), ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"error happened while writing principal cache: {str(e)}")
+            return
+        self._local.set(str(user.pk), (jti, data))
+
+    def invalidate(self, *user_ids) -> None:
+        """Drop every cached token of the given users from both tiers.
+
+        Args:
+            *user_ids: IDs of users whose role, status or existence changed.
+        """
+        if not user_ids:
+            return
+        for user_id in user_ids:
+            self._local.delete(str(user_id))
+        try:
+            self.redis_client.delete(*[self._key(user_id) for user_id in user_ids])
+        except Exception as e:
+            logger.error(
+                f"error happened while invalidating principal cache: {str(e)}"
+            )
+
+    @classmethod
+    def _build(cls, data: dict):
+        fields = User._meta.concrete_fields
+        values = [data.get(field.attname, DEFERRED) for field in fields]
+        return User.from_db(
+            DEFAULT_DB_ALIAS, [field.attname for field in fields], values
+        )
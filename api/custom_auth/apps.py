@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CustomAuthConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "api.custom_auth"
+
+    def ready(self):
+        from api.custom_auth import signals  # noqa: F401
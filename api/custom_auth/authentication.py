@@ -1,5 +1,11 @@
+import time
+
+from django.utils.translation import gettext_lazy as _
 from rest_framework_simplejwt.authentication import JWTAuthentication
-from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from api.custom_auth.PrincipalCacheService import PrincipalCacheService
 
 
 class CookieJWTAuthentication(JWTAuthentication):
@@ -15,3 +21,27 @@ class CookieJWTAuthentication(JWTAuthentication):
             return self.get_user(validated_token), validated_token
         except InvalidToken:
             return None
+
+    def get_user(self, validated_token):
+        """Get the token's user from the principal cache, loading it on a miss.
+
+        Args:
+            validated_token: The validated access token.
+
+        Returns:
+            User: The authenticated user.
+        """
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        jti = validated_token.get(api_settings.JTI_CLAIM)
+        if user_id is None or jti is None or api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+
+        cache = PrincipalCacheService()
+        user = cache.get(user_id, jti)
+        if user is None:
+            user = super().get_user(validated_token)
+            expires_at = validated_token.get("exp", 0)
+            cache.set(user, jti, ttl=int(expires_at - time.time()))
+        elif api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
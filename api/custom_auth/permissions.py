@@ -5,13 +5,19 @@ from api.custom_auth.models import CustomUser
 User = get_user_model()
 
 
+# request.user comes from PrincipalCacheService, so no lookup is needed here.
+# Saving or deleting a user drops its cached entries, but other workers can keep
+# serving the old role or active flag for up to AUTH_PRINCIPAL_LOCAL_TTL seconds
+
+
 class IsAdmin(BasePermission):
     def has_permission(self, request, view):
-        user = User.objects.get(pk=request.user.id)
-        return user.role == CustomUser.Role.ADMIN
+        return getattr(request.user, "role", None) == CustomUser.Role.ADMIN
 
 
 class IsAdminOrStaff(BasePermission):
     def has_permission(self, request, view):
-        user = User.objects.get(pk=request.user.id)
-        return user.role == CustomUser.Role.STAFF or user.role == CustomUser.Role.ADMIN
+        return getattr(request.user, "role", None) in (
+            CustomUser.Role.STAFF,
+            CustomUser.Role.ADMIN,
+        )
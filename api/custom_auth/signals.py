@@ -0,0 +1,45 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from api.custom_auth.PrincipalCacheService import PrincipalCacheService
+from api.url.services.BurstThresholdService import BurstThresholdService
+
+User = get_user_model()
+
+
+# Role edits, bans and deletions go through the model from the admin panel,
+# Django admin and djoser alike; queryset updates bypass these and must call
+# PrincipalCacheService.invalidate themselves
+
+
+@receiver(post_save, sender=User)
+def invalidate_principal_on_save(sender, instance, **kwargs):
+    PrincipalCacheService().invalidate(instance.pk)
+
+
+# Cached links carry the burst overrides of their owner's role, so a role
+# change drops them. Saves limited to other fields, like last_login on every
+# login, skip the lookup of the previous role
+
+
+@receiver(pre_save, sender=User)
+def remember_previous_role(sender, instance, update_fields=None, **kwargs):
+    if instance.pk is None or (update_fields and "role" not in update_fields):
+        instance._previous_role = instance.role
+        return
+    instance._previous_role = (
+        User.objects.filter(pk=instance.pk).values_list("role", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=User)
+def invalidate_links_on_role_change(sender, instance, created, **kwargs):
+    previous_role = getattr(instance, "_previous_role", instance.role)
+    if not created and previous_role != instance.role:
+        BurstThresholdService.invalidate_user_links(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def invalidate_principal_on_delete(sender, instance, **kwargs):
+    PrincipalCacheService().invalidate(instance.pk)
@@ -1,4 +1,5 @@
 import json
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.utils.deprecation import MiddlewareMixin
 from api.admin_panel.audit.AuditService import AuditService
 from api.admin_panel.audit.models import AuditLog
@@ -9,10 +10,31 @@ from django.http import JsonResponse
 
 
 class JsonValidationMiddleware:
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        error = self.validate(request)
+        if error:
+            return error
+        response = self.get_response(request)
+        return response
+
+    async def __acall__(self, request):
+        error = self.validate(request)
+        if error:
+            return error
+        return await self.get_response(request)
+
+    def validate(self, request):
         if (
             request.content_type == "application/json"
             or request.content_type.startswith("application/json;")
@@ -21,16 +43,30 @@ class JsonValidationMiddleware:
                 json.loads(request.body.decode("utf-8"))
             except json.JSONDecodeError:
                 return JsonResponse({"error": "Invalid JSON format"}, status=400)
-        response = self.get_response(request)
-        return response
+        return None
 
 
 class RateLimitHeaderMiddleware:
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
         response = self.get_response(request)
+        return self.add_headers(request, response)
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        return self.add_headers(request, response)
+
+    def add_headers(self, request, response):
         if hasattr(request, "throttle_metadata"):
             metadata = request.throttle_metadata
             response["X-RateLimit-Limit"] = str(metadata["limit"])
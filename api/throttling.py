@@ -1,15 +1,74 @@
 from config.settings_utils import get_throttle_rates
-from config.redis_utils import get_redis_client
+from config.redis_utils import get_async_redis_client, get_redis_client
+import math
 import time
+from django.conf import settings
+from redis.exceptions import NoScriptError
 from rest_framework.throttling import SimpleRateThrottle
-from api.admin_panel.fraud.FraudService import FraudService
+from api.admin_panel.fraud.ThrottleViolationService import ThrottleViolationService
+from config.utils.lazy import ProcessLocal
+
+
+# GCRA: the key holds the theoretical arrival time (TAT) of the next request in
+# milliseconds. Each request moves it forward by window / limit, and a request
+# is rejected when that would put the TAT more than one window ahead of now.
+# Uses the Redis clock so workers with drifting clocks share one timeline.
+# KEYS[1] = TAT key
+# ARGV = limit, window in milliseconds
+# Returns {allowed, remaining, milliseconds until reset}
+GCRA_LUA = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local interval = window / limit
+
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+local tat = tonumber(redis.call('GET', KEYS[1]) or 0)
+if tat < now then
+    tat = now
+end
+
+local new_tat = tat + interval
+if new_tat - now > window then
+    return {0, 0, math.ceil(new_tat - window - now)}
+end
+
+local ttl = math.ceil(new_tat - now)
+redis.call('SET', KEYS[1], string.format('%.3f', new_tat), 'PX', ttl)
+local remaining = math.floor((window - (new_tat - now)) / interval)
+return {1, remaining, ttl}
+"""
 
 
 class RedisRateLimiter:
+    """Per-key request limits shared by every worker through Redis.
+
+    ``RATE_LIMITER_ENGINE`` picks the algorithm: "sliding" keeps one sorted set
+    member per request in the window, "gcra" keeps a single timestamp per key
+    and decides in one atomic script call.
+    """
+
+    _script = None
+
     def __init__(self) -> None:
         self.redis_client = get_redis_client()
 
     def is_allowed(self, key: str, limit: int, window: int) -> tuple[bool, dict]:
+        """Count a request against a key's limit.
+
+        Args:
+            key (str): The throttled subject, e.g. ``throttle_ip:{ip}``.
+            limit (int): Requests allowed per window.
+            window (int): Window length in seconds.
+
+        Returns:
+            tuple[bool, dict]: Whether the request is allowed, and the
+                remaining requests, reset timestamp and limit for the headers.
+        """
+        if settings.RATE_LIMITER_ENGINE == "gcra":
+            return self.is_allowed_gcra(key, limit, window)
+
         now = time.time()
         window_key = f"rate_limit:{key}"
 
@@ -38,9 +97,92 @@ class RedisRateLimiter:
 
         return is_allowed, metadata
 
+    async def ais_allowed(self, key: str, limit: int, window: int) -> tuple[bool, dict]:
+        """Async variant of ``is_allowed`` built on ``redis.asyncio``."""
+        if settings.RATE_LIMITER_ENGINE == "gcra":
+            return await self.ais_allowed_gcra(key, limit, window)
+
+        now = time.time()
+        window_key = f"rate_limit:{key}"
+        redis_client = get_async_redis_client()
+
+        pipe = redis_client.pipeline()
+        pipe.zremrangebyscore(window_key, "-inf", now - window)
+        pipe.zcard(window_key)
+        results = await pipe.execute()
+
+        current_count = results[1]
+
+        is_allowed = current_count < limit
+
+        if is_allowed:
+            pipe = redis_client.pipeline()
+            pipe.zadd(window_key, {f"{now}": now})
+            pipe.expire(window_key, window)
+            await pipe.execute()
+
+        remaining = max(0, limit - current_count - (1 if is_allowed else 0))
+        reset_time = int(now + window)
+        metadata = {
+            "remaining": remaining,
+            "reset": reset_time,
+            "limit": limit,
+        }
+
+        return is_allowed, metadata
+
+    def _get_script(self):
+        if RedisRateLimiter._script is None:
+            RedisRateLimiter._script = self.redis_client.register_script(GCRA_LUA)
+        return RedisRateLimiter._script
+
+    @staticmethod
+    def _gcra_result(result, limit: int) -> tuple[bool, dict]:
+        allowed, remaining, reset_ms = result
+        # Denied requests reset when the next one fits, allowed ones when the
+        # key is back to a full allowance
+        metadata = {
+            "remaining": int(remaining),
+            "reset": math.ceil(time.time() + int(reset_ms) / 1000),
+            "limit": limit,
+        }
+        return bool(allowed), metadata
+
+    def is_allowed_gcra(self, key: str, limit: int, window: int) -> tuple[bool, dict]:
+        """Count a request with GCRA in a single script call.
+
+        Args:
+            key (str): The throttled subject.
+            limit (int): Requests allowed per window, also the burst size.
+            window (int): Window length in seconds.
+
+        Returns:
+            tuple[bool, dict]: Same shape as ``is_allowed``.
+        """
+        result = self._get_script()(
+            keys=[f"rate_limit:gcra:{key}"], args=[limit, window * 1000]
+        )
+        return self._gcra_result(result, limit)
+
+    async def ais_allowed_gcra(
+        self, key: str, limit: int, window: int
+    ) -> tuple[bool, dict]:
+        """Async variant of ``is_allowed_gcra`` built on ``redis.asyncio``."""
+        redis_client = get_async_redis_client()
+        gcra_key = f"rate_limit:gcra:{key}"
+        try:
+            result = await redis_client.evalsha(
+                self._get_script().sha, 1, gcra_key, limit, window * 1000
+            )
+        except NoScriptError:
+            result = await redis_client.eval(
+                GCRA_LUA, 1, gcra_key, limit, window * 1000
+            )
+        return self._gcra_result(result, limit)
+
 
 class BaseRedisThrottle(SimpleRateThrottle):
-    redis_limiter = RedisRateLimiter()
+    redis_limiter = ProcessLocal(RedisRateLimiter)
 
     def allow_request(self, request, view) -> bool:
         if self.rate is None:
@@ -62,7 +204,31 @@ class BaseRedisThrottle(SimpleRateThrottle):
         request.throttle_metadata = metadata
 
         if not is_allowed:
-            FraudService.flag_throttle_violation(request, view, self.rate)
+            ThrottleViolationService().record(request, self.rate)
+
+        return is_allowed
+
+    async def aallow_request(self, request, view) -> bool:
+        if self.rate is None:
+            return True
+
+        key = self.get_cache_key(request, view)
+
+        if key is None:
+            return True
+
+        self.key = key
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        is_allowed, metadata = await self.redis_limiter.ais_allowed(
+            key, self.num_requests, self.duration
+        )
+
+        self.metadata = metadata
+
+        request.throttle_metadata = metadata
+
+        if not is_allowed:
+            await ThrottleViolationService().arecord(request, self.rate)
 
         return is_allowed
 
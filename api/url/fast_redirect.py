@@ -0,0 +1,277 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.http import JsonResponse
+from django.shortcuts import redirect
+from django.views.decorators.http import require_safe
+from rest_framework.exceptions import AuthenticationFailed
+
+from api.analytics.service import AnalyticsService
+from api.analytics.fingerprint import get_fingerprint
+from api.custom_auth.authentication import CookieJWTAuthentication
+from api.throttling import IPRateThrottle, UserRateThrottle
+from api.url.redirection.RedirectionService import RedirectionService
+from api.url.services.BurstProtectionService import BurstProtectionService
+from api.url.services.RedirectCachePolicyService import RedirectCachePolicyService
+from api.url.services.RedirectPipelineService import RedirectPipelineService
+from api.url.services.UrlCacheService import UrlCacheService
+
+_handler = None
+
+
+def error_response(message: str, status: int) -> JsonResponse:
+    """Build an error body matching ``ErrorResponse`` without DRF rendering."""
+    return JsonResponse({"success": False, "message": message}, status=status)
+
+
+class RedirectHandler:
+    """Serves public short-link redirects outside of DRF.
+
+    One instance is shared by every request in the process, so the services
+    and their Redis clients are built once instead of per click.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the handler with the services used on every redirect."""
+        self.protection_service = BurstProtectionService()
+        self.rules_service = RedirectionService()
+        self.cache_service = UrlCacheService()
+        self.pipeline_service = RedirectPipelineService(self.protection_service)
+        self.authentication = CookieJWTAuthentication()
+
+    @staticmethod
+    def redirect_to(resolved, target_url: str):
+        """Redirect with the status code and caching headers of the link's policy.
+
+        Args:
+            resolved (ResolvedUrl): The resolved URL being visited.
+            target_url (str): The long URL or a matched rule's target.
+
+        Returns:
+            HttpResponseRedirect: The redirect response.
+        """
+        return RedirectCachePolicyService.apply(
+            redirect(target_url), resolved.cache_policy
+        )
+
+    def throttle_for(self, request):
+        """Authenticate the visitor as the DRF views do and pick its rate limit.
+
+        Visitors with a valid access token are limited per user, so users
+        behind a shared NAT do not share one bucket; everyone else per IP.
+        An invalid token is treated as no token rather than rejected.
+
+        Args:
+            request: The Django HTTP request.
+
+        Returns:
+            BaseRedisThrottle: The throttle to apply to the request.
+        """
+        try:
+            result = self.authentication.authenticate(request)
+        except AuthenticationFailed:
+            result = None
+        if result is None:
+            request.user = AnonymousUser()
+            return IPRateThrottle()
+        request.user = result[0]
+        return UserRateThrottle()
+
+    def handle(self, request, short_url: str):
+        """Apply the visitor's rate limit, then serve the redirect.
+
+        Args:
+            request: The Django HTTP request.
+            short_url (str): The short URL identifier.
+
+        Returns:
+            HttpResponse: A redirect, or a JSON error response.
+        """
+        throttle = self.throttle_for(request)
+        if not throttle.allow_request(request, None):
+            response = error_response("Request was throttled", status=429)
+            wait = throttle.wait()
+            if wait is not None:
+                response["Retry-After"] = str(int(wait))
+            return response
+        if settings.REDIRECT_ATOMIC_SIDE_EFFECTS:
+            return self.serve_atomic(request, short_url)
+        return self.serve(request, short_url)
+
+    def serve(self, request, short_url: str):
+        """Serve a redirect with separate burst check and visit recording.
+
+        Args:
+            request: The Django HTTP request.
+            short_url (str): The short URL identifier.
+
+        Returns:
+            HttpResponse: A redirect, or a JSON error response.
+        """
+        try:
+            resolved = self.cache_service.resolve(short_url)
+            if resolved is None:
+                return error_response("URL not found", status=404)
+            if resolved.is_expired:
+                return error_response("URL is inactive or expired", status=410)
+            ip = get_fingerprint(request).ip
+            if not self.protection_service.check_burst(
+                ip, short_url, resolved.burst_thresholds
+            ):
+                return error_response("Too many requests on this URL", status=429)
+
+            matched_rule = None
+            if resolved.has_rules:
+                matched_rule = self.rules_service.evaluate_redirection_rules(
+                    request, resolved
+                )
+            AnalyticsService.record_visit(request, resolved)
+            if matched_rule:
+                return self.redirect_to(resolved, matched_rule.target_url)
+            return self.redirect_to(resolved, resolved.long_url)
+        except Exception as e:
+            return error_response(str(e), status=404)
+
+    def serve_atomic(self, request, short_url: str):
+        """Serve a redirect with burst checks and analytics in one Redis call.
+
+        Args:
+            request: The Django HTTP request.
+            short_url (str): The short URL identifier.
+
+        Returns:
+            HttpResponse: A redirect, or a JSON error response.
+        """
+        try:
+            resolved = self.cache_service.resolve(short_url)
+            if resolved is None:
+                return error_response("URL not found", status=404)
+            if resolved.is_expired:
+                return error_response("URL is inactive or expired", status=410)
+            ip = get_fingerprint(request).ip
+            if not self.pipeline_service.process_click(request, ip, resolved):
+                return error_response("Too many requests on this URL", status=429)
+
+            matched_rule = None
+            if resolved.has_rules:
+                matched_rule = self.rules_service.evaluate_redirection_rules(
+                    request, resolved
+                )
+            if matched_rule:
+                return self.redirect_to(resolved, matched_rule.target_url)
+            return self.redirect_to(resolved, resolved.long_url)
+        except Exception as e:
+            return error_response(str(e), status=404)
+
+    async def ahandle(self, request, short_url: str):
+        """Async variant of ``handle`` for ASGI deployments.
+
+        Redis calls go through ``redis.asyncio``; the remaining ORM and
+        configuration lookups are pushed to the sync thread.
+
+        Args:
+            request: The Django HTTP request.
+            short_url (str): The short URL identifier.
+
+        Returns:
+            HttpResponse: A redirect, or a JSON error response.
+        """
+        throttle = await sync_to_async(self.throttle_for)(request)
+        if not await throttle.aallow_request(request, None):
+            response = error_response("Request was throttled", status=429)
+            wait = throttle.wait()
+            if wait is not None:
+                response["Retry-After"] = str(int(wait))
+            return response
+        if settings.REDIRECT_ATOMIC_SIDE_EFFECTS:
+            return await self.aserve_atomic(request, short_url)
+        return await self.aserve(request, short_url)
+
+    async def aserve(self, request, short_url: str):
+        """Async variant of ``serve``.
+
+        Args:
+            request: The Django HTTP request.
+            short_url (str): The short URL identifier.
+
+        Returns:
+            HttpResponse: A redirect, or a JSON error response.
+        """
+        try:
+            resolved = await self.cache_service.aresolve(short_url)
+            if resolved is None:
+                return error_response("URL not found", status=404)
+            if resolved.is_expired:
+                return error_response("URL is inactive or expired", status=410)
+            ip = get_fingerprint(request).ip
+            if not await self.protection_service.acheck_burst(
+                ip, short_url, resolved.burst_thresholds
+            ):
+                return error_response("Too many requests on this URL", status=429)
+
+            matched_rule = None
+            if resolved.has_rules:
+                matched_rule = await sync_to_async(
+                    self.rules_service.evaluate_redirection_rules
+                )(request, resolved)
+            await AnalyticsService.arecord_visit(request, resolved)
+            if matched_rule:
+                return self.redirect_to(resolved, matched_rule.target_url)
+            return self.redirect_to(resolved, resolved.long_url)
+        except Exception as e:
+            return error_response(str(e), status=404)
+
+    async def aserve_atomic(self, request, short_url: str):
+        """Async variant of ``serve_atomic``.
+
+        Args:
+            request: The Django HTTP request.
+            short_url (str): The short URL identifier.
+
+        Returns:
+            HttpResponse: A redirect, or a JSON error response.
+        """
+        try:
+            resolved = await self.cache_service.aresolve(short_url)
+            if resolved is None:
+                return error_response("URL not found", status=404)
+            if resolved.is_expired:
+                return error_response("URL is inactive or expired", status=410)
+            ip = get_fingerprint(request).ip
+            if not await self.pipeline_service.aprocess_click(request, ip, resolved):
+                return error_response("Too many requests on this URL", status=429)
+
+            matched_rule = None
+            if resolved.has_rules:
+                matched_rule = await sync_to_async(
+                    self.rules_service.evaluate_redirection_rules
+                )(request, resolved)
+            if matched_rule:
+                return self.redirect_to(resolved, matched_rule.target_url)
+            return self.redirect_to(resolved, resolved.long_url)
+        except Exception as e:
+            return error_response(str(e), status=404)
+
+
+def get_redirect_handler() -> RedirectHandler:
+    """Get the process-wide redirect handler, creating it on first use.
+
+    Returns:
+        RedirectHandler: The shared handler instance.
+    """
+    global _handler
+    if _handler is None:
+        _handler = RedirectHandler()
+    return _handler
+
+
+@require_safe
+def redirect_view(request, short_url: str):
+    """Plain Django view for ``GET /api/url/redirect/<short_url>/``."""
+    return get_redirect_handler().handle(request, short_url)
+
+
+@require_safe
+async def aredirect_view(request, short_url: str):
+    """Async Django view for ``GET /api/url/redirect/<short_url>/`` under ASGI."""
+    return await get_redirect_handler().ahandle(request, short_url)
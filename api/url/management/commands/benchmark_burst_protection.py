@@ -0,0 +1,82 @@
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from api.url.services.BurstProtectionService import BurstProtectionService
+from config.redis_utils import get_redis_client
+
+BENCH_SHORT_URL = "benchburst"
+BENCH_IP = "10.3.0.1"
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare burst protection latency and spurious rejections between the "
+        "lock-based engine and the Lua engines"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=2000,
+            help="Number of simulated clicks per engine",
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=16,
+            help="Concurrent clicks on the same link and IP",
+        )
+
+    def handle(self, *args, **options):
+        redis_client = get_redis_client()
+        service = BurstProtectionService()
+        # Never trip the limits, so every rejection is caused by the engine
+        service.default_thresholds.update(
+            short_term_limit=10**9, medium_term_limit=10**9, long_term_limit=10**9
+        )
+        service._flag_url = lambda short_url, ip: None
+
+        try:
+            for threads in (1, options["threads"]):
+                for engine in ("lock", "atomic", "bucket"):
+                    self._cleanup(redis_client)
+                    with override_settings(BURST_PROTECTION_ENGINE=engine):
+                        timings, rejected = self._run(
+                            service.check_burst, options["iterations"], threads
+                        )
+                    self._report(f"{engine}/{threads}t", timings, rejected)
+        finally:
+            self._cleanup(redis_client)
+
+    def _run(self, check_burst, iterations, threads):
+        def click(_):
+            start = time.perf_counter()
+            allowed = check_burst(BENCH_IP, BENCH_SHORT_URL)
+            return (time.perf_counter() - start) * 1000, allowed
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(click, range(iterations)))
+        timings = [timing for timing, _ in results]
+        rejected = sum(1 for _, allowed in results if not allowed)
+        return timings, rejected
+
+    def _report(self, name, timings, rejected):
+        percentiles = statistics.quantiles(timings, n=100)
+        self.stdout.write(
+            f"{name:<12} n={len(timings)} "
+            f"p50={percentiles[49]:.3f}ms "
+            f"p99={percentiles[98]:.3f}ms "
+            f"mean={statistics.fmean(timings):.3f}ms "
+            f"rejected={rejected}"
+        )
+
+    def _cleanup(self, redis_client):
+        keys = list(redis_client.scan_iter(f"burst_protection:*{BENCH_SHORT_URL}*"))
+        keys += list(redis_client.scan_iter(f"burst_protection:*ip:{BENCH_IP}"))
+        if keys:
+            redis_client.delete(*keys)
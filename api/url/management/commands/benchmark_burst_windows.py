@@ -0,0 +1,111 @@
+import random
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.url.services.BurstProtectionService import BurstProtectionService
+from config.redis_utils import scratch_redis
+
+BENCH_SHORT_URL = "benchwindows"
+BENCH_IP_PREFIX = "10.4"
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay simulated traffic through the exact sorted-set windows and the "
+        "bucketed windows, comparing their decisions and Redis memory"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--duration",
+            type=int,
+            default=1800,
+            help="Simulated traffic duration in seconds",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=0.5,
+            help="Average clicks per second outside bursts",
+        )
+        parser.add_argument(
+            "--burst-rate",
+            type=float,
+            default=4.0,
+            help="Average clicks per second during the first 10s of each minute",
+        )
+        parser.add_argument(
+            "--ips",
+            type=int,
+            default=50,
+            help="Number of distinct client IPs",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--redis-db",
+            type=int,
+            default=15,
+            help="Scratch Redis database, flushed before and after; not REDIS_DB",
+        )
+
+    def handle(self, *args, **options):
+        if options["redis_db"] == settings.REDIS_DB:
+            raise CommandError("--redis-db must not be the live REDIS_DB")
+        with scratch_redis(options["redis_db"]) as redis_client:
+            self._benchmark(redis_client, options)
+
+    def _benchmark(self, redis_client, options):
+        service = BurstProtectionService()
+        service._flag_url = lambda short_url, ip: None
+
+        clicks = self._trace(options)
+        exact = []
+        bucketed = []
+        for timestamp, ip in clicks:
+            exact.append(
+                service.check_burst_atomic(ip, BENCH_SHORT_URL, timestamp=timestamp)
+            )
+            bucketed.append(
+                service.check_burst_buckets(ip, BENCH_SHORT_URL, timestamp=timestamp)
+            )
+
+        false_blocks = sum(1 for e, b in zip(exact, bucketed) if e and not b)
+        false_allows = sum(1 for e, b in zip(exact, bucketed) if b and not e)
+        self.stdout.write(
+            f"clicks={len(clicks)} "
+            f"exact_blocked={exact.count(False)} "
+            f"bucket_blocked={bucketed.count(False)} "
+            f"false_blocks={false_blocks} "
+            f"false_allows={false_allows} "
+            f"agreement={1 - (false_blocks + false_allows) / len(clicks):.4%}"
+        )
+
+        ips = {ip for _, ip in clicks}
+        for name, key_for in (
+            ("sorted set", service._burst_keys),
+            ("buckets", service._bucket_keys),
+        ):
+            url_key = key_for("", BENCH_SHORT_URL)[0]
+            ip_keys = [key_for(ip, BENCH_SHORT_URL)[1] for ip in ips]
+            url_bytes = redis_client.memory_usage(url_key) or 0
+            ip_bytes = sum(redis_client.memory_usage(key) or 0 for key in ip_keys)
+            self.stdout.write(
+                f"{name:<10} url_key={url_bytes}B "
+                f"ip_keys={ip_bytes}B ({len(ip_keys)} keys)"
+            )
+
+    def _trace(self, options):
+        rng = random.Random(options["seed"])
+        start = time.time()
+        clicks = []
+        elapsed = 0.0
+        while elapsed < options["duration"]:
+            rate = options["burst_rate"] if elapsed % 60 < 10 else options["rate"]
+            elapsed += rng.expovariate(rate)
+            host = rng.randrange(options["ips"])
+            clicks.append(
+                (start + elapsed, f"{BENCH_IP_PREFIX}.{host // 256}.{host % 256}")
+            )
+        return clicks
@@ -0,0 +1,93 @@
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from api.throttling import RedisRateLimiter
+
+BENCH_KEY = "benchlimit"
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare API rate limiter latency, admitted requests and Redis memory "
+        "between the sorted set and GCRA engines"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=2000,
+            help="Number of simulated requests per engine",
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=16,
+            help="Concurrent requests on the same key",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=1000,
+            help="Requests allowed per window",
+        )
+        parser.add_argument(
+            "--window",
+            type=int,
+            default=60,
+            help="Window length in seconds",
+        )
+
+    def handle(self, *args, **options):
+        limiter = RedisRateLimiter()
+        redis_client = limiter.redis_client
+
+        try:
+            for threads in (1, options["threads"]):
+                for engine in ("sliding", "gcra"):
+                    self._cleanup(redis_client)
+                    with override_settings(RATE_LIMITER_ENGINE=engine):
+                        timings, admitted = self._run(limiter, options, threads)
+                    memory = sum(
+                        redis_client.memory_usage(key) or 0
+                        for key in redis_client.scan_iter(f"rate_limit:*{BENCH_KEY}")
+                    )
+                    self._report(
+                        f"{engine}/{threads}t", timings, admitted, memory, options
+                    )
+        finally:
+            self._cleanup(redis_client)
+
+    def _run(self, limiter, options, threads):
+        def request(_):
+            start = time.perf_counter()
+            allowed, _ = limiter.is_allowed(
+                BENCH_KEY, options["limit"], options["window"]
+            )
+            return (time.perf_counter() - start) * 1000, allowed
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(request, range(options["iterations"])))
+        timings = [timing for timing, _ in results]
+        admitted = sum(1 for _, allowed in results if allowed)
+        return timings, admitted
+
+    def _report(self, name, timings, admitted, memory, options):
+        percentiles = statistics.quantiles(timings, n=100)
+        self.stdout.write(
+            f"{name:<12} n={len(timings)} "
+            f"p50={percentiles[49]:.3f}ms "
+            f"p99={percentiles[98]:.3f}ms "
+            f"mean={statistics.fmean(timings):.3f}ms "
+            f"admitted={admitted}/{options['limit']} "
+            f"memory={memory}B"
+        )
+
+    def _cleanup(self, redis_client):
+        keys = list(redis_client.scan_iter(f"rate_limit:*{BENCH_KEY}"))
+        if keys:
+            redis_client.delete(*keys)
@@ -0,0 +1,99 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory, override_settings
+
+from api.analytics.service import AnalyticsService
+from api.url.models import UrlStatus
+from api.url.services.BurstProtectionService import BurstProtectionService
+from api.url.services.RedirectPipelineService import RedirectPipelineService
+from api.url.services.UrlCacheService import ResolvedUrl
+from config.redis_utils import scratch_redis
+
+BENCH_SHORT_URL = "benchredirect"
+BENCH_URL_ID = 0
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare redirect side-effect latency between the lock-based path and "
+        "the single Lua script"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=2000,
+            help="Number of simulated clicks per strategy",
+        )
+        parser.add_argument(
+            "--redis-db",
+            type=int,
+            default=15,
+            help="Scratch Redis database, flushed before and after; not REDIS_DB",
+        )
+
+    def handle(self, *args, **options):
+        if options["redis_db"] == settings.REDIS_DB:
+            raise CommandError("--redis-db must not be the live REDIS_DB")
+        with scratch_redis(options["redis_db"]) as redis_client:
+            self._benchmark(redis_client, options["iterations"])
+
+    def _benchmark(self, redis_client, iterations):
+        factory = RequestFactory()
+        resolved = ResolvedUrl(
+            id=BENCH_URL_ID,
+            short_url=BENCH_SHORT_URL,
+            long_url="https://example.com/benchmark",
+            state=UrlStatus.State.ACTIVE,
+            expiry_date=None,
+            has_rules=False,
+        )
+        protection_service = BurstProtectionService()
+        # Never trip the limits: the benchmark measures the happy path only
+        protection_service.default_thresholds.update(
+            short_term_limit=10**9, medium_term_limit=10**9, long_term_limit=10**9
+        )
+        pipeline_service = RedirectPipelineService(protection_service)
+
+        def legacy(request, ip):
+            protection_service.check_burst(ip, BENCH_SHORT_URL)
+            AnalyticsService.record_visit(request, resolved)
+
+        def atomic(request, ip):
+            pipeline_service.process_click(request, ip, resolved)
+
+        # The single script only replaces the engine's round trip when the
+        # atomic engine is selected, so the lua strategy always runs with it
+        strategies = (("legacy", legacy, "lock"), ("lua", atomic, "atomic"))
+        for name, strategy, engine in strategies:
+            redis_client.flushdb()
+            with override_settings(BURST_PROTECTION_ENGINE=engine):
+                timings = self._run(factory, strategy, iterations)
+            self._report(name, timings)
+
+    def _run(self, factory, strategy, iterations):
+        timings = []
+        for i in range(iterations):
+            ip = f"10.0.{(i // 250) % 250}.{i % 250 + 1}"
+            request = factory.get(
+                f"/api/url/redirect/{BENCH_SHORT_URL}/",
+                REMOTE_ADDR=ip,
+                HTTP_USER_AGENT="Mozilla/5.0 (X11; Linux x86_64) Firefox/120.0",
+            )
+            start = time.perf_counter()
+            strategy(request, ip)
+            timings.append((time.perf_counter() - start) * 1000)
+        return timings
+
+    def _report(self, name, timings):
+        percentiles = statistics.quantiles(timings, n=100)
+        self.stdout.write(
+            f"{name:<8} n={len(timings)} "
+            f"p50={percentiles[49]:.3f}ms "
+            f"p99={percentiles[98]:.3f}ms "
+            f"mean={statistics.fmean(timings):.3f}ms"
+        )
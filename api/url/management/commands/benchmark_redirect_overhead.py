@@ -0,0 +1,108 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.shortcuts import redirect
+from django.test import RequestFactory
+from rest_framework.generics import GenericAPIView
+
+from api.url.fast_redirect import get_redirect_handler, redirect_view
+from api.url.redirection.RedirectionService import RedirectionService
+from api.url.services.BurstProtectionService import BurstProtectionService
+from api.url.services.RedirectPipelineService import RedirectPipelineService
+from api.url.services.UrlCacheService import UrlCacheService
+from config.redis_utils import scratch_redis
+
+BENCH_SHORT_URL = "benchoverhead"
+BENCH_TARGET = "https://example.com/benchmark"
+
+
+class DRFRedirect(GenericAPIView):
+    """The previous redirect view shape: DRF wrapping plus per-request services."""
+
+    def __init__(self, **kwargs):
+        self.protection_service = BurstProtectionService()
+        self.service = RedirectionService()
+        self.cache_service = UrlCacheService()
+        self.pipeline_service = RedirectPipelineService(self.protection_service)
+        super().__init__(**kwargs)
+
+    def get(self, request, short_url):
+        return redirect(BENCH_TARGET)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the per-request overhead of serving redirects through DRF "
+        "compared to the plain Django handler"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=5000,
+            help="Number of simulated requests per view",
+        )
+        parser.add_argument(
+            "--redis-db",
+            type=int,
+            default=15,
+            help="Scratch Redis database, flushed before and after; not REDIS_DB",
+        )
+
+    def handle(self, *args, **options):
+        if options["redis_db"] == settings.REDIS_DB:
+            raise CommandError("--redis-db must not be the live REDIS_DB")
+        with scratch_redis(options["redis_db"]) as redis_client:
+            self._benchmark(redis_client, options["iterations"])
+
+    def _benchmark(self, redis_client, iterations):
+        factory = RequestFactory()
+        handler = get_redirect_handler()
+        drf_view = DRFRedirect.as_view()
+
+        # Both views do the same work once the framework hands over control:
+        # the IP throttle and an immediate redirect, so only overhead differs
+        original_serve = handler.serve
+        handler.serve = lambda request, short_url: redirect(BENCH_TARGET)
+        try:
+            results = {}
+            for name, view in (("drf", drf_view), ("plain", redirect_view)):
+                redis_client.flushdb()
+                results[name] = self._run(factory, view, iterations)
+                self._report(name, results[name])
+        finally:
+            handler.serve = original_serve
+
+        saved = statistics.median(results["drf"]) - statistics.median(results["plain"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Median overhead removed per request: {saved:.3f}ms")
+        )
+
+    def _run(self, factory, view, iterations):
+        timings = []
+        for i in range(iterations):
+            # Rotate IPs so the 100/hour limit never short-circuits a view
+            ip = f"10.1.{(i // 250) % 250}.{i % 250 + 1}"
+            request = factory.get(
+                f"/api/url/redirect/{BENCH_SHORT_URL}/", REMOTE_ADDR=ip
+            )
+            request.user = AnonymousUser()
+            start = time.perf_counter()
+            response = view(request, short_url=BENCH_SHORT_URL)
+            timings.append((time.perf_counter() - start) * 1000)
+            if response.status_code != 302:
+                raise RuntimeError(f"unexpected status {response.status_code}")
+        return timings
+
+    def _report(self, name, timings):
+        percentiles = statistics.quantiles(timings, n=100)
+        self.stdout.write(
+            f"{name:<6} n={len(timings)} "
+            f"p50={percentiles[49]:.3f}ms "
+            f"p99={percentiles[98]:.3f}ms "
+            f"mean={statistics.fmean(timings):.3f}ms"
+        )
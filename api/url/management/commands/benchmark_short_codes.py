@@ -0,0 +1,51 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.url.services.ShortCodeService import ShortCodeService
+
+
+class Command(BaseCommand):
+    help = (
+        "Encode millions of counter values into short codes, checking that "
+        "every code is distinct and scattered and reporting the throughput"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=5_000_000,
+            help="Number of consecutive counter values to encode",
+        )
+        parser.add_argument(
+            "--length",
+            type=int,
+            default=None,
+            help="Code length, defaults to the configured short_code_length",
+        )
+
+    def handle(self, *args, **options):
+        code_length = options["length"] or ShortCodeService.CODE_LENGTH
+        count = options["count"]
+        ShortCodeService.permutation(code_length)
+
+        seen = set()
+        shared_prefix = 0
+        previous = ""
+        start = time.perf_counter()
+        for code_id in range(count):
+            code = ShortCodeService.encode_id(code_id, code_length)
+            seen.add(code)
+            shared_prefix += code[:3] == previous[:3]
+            previous = code
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(
+            f"length={code_length} codes={count} "
+            f"elapsed={elapsed:.2f}s rate={count / elapsed:,.0f}/s "
+            f"shared_prefix={shared_prefix}"
+        )
+        if len(seen) != count:
+            raise CommandError(f"{count - len(seen)} duplicate codes")
+        self.stdout.write(self.style.SUCCESS("All codes are distinct"))
@@ -0,0 +1,22 @@
+import time
+
+from django.core.management.base import BaseCommand
+from api.url.services.UrlBloomFilterService import UrlBloomFilterService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the Bloom filter of existing short codes from the database"
+
+    def handle(self, *args, **options):
+        service = UrlBloomFilterService()
+        start = time.perf_counter()
+        loaded = service.rebuild()
+        elapsed = time.perf_counter() - start
+        stats = service.stats()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Loaded {loaded} short codes into the Bloom filter in {elapsed:.2f}s "
+                f"({stats['memory_bytes']} bytes, "
+                f"estimated false-positive rate {stats['estimated_false_positive_rate']:.6f})."
+            )
+        )
@@ -1,20 +1,38 @@
 from django.core.management.base import BaseCommand
-from datetime import datetime, timezone
+from django.utils import timezone
 from api.url.models import Url, UrlStatus
+from api.url.services.UrlBloomFilterService import UrlBloomFilterService
+from api.url.services.UrlCacheService import UrlCacheService
 
 
 class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--delete",
+            action="store_true",
+            help="Delete expired URLs instead of marking them as expired",
+        )
+
     def handle(self, *args, **options):
-        expired_urls = Url.objects.filter(
-            expiry_date__lte=timezone.now()
-        ).select_related("url_status")
-        from django.utils import timezone
+        now = timezone.now()
+        expiring_statuses = UrlStatus.objects.filter(
+            url__expiry_date__lte=now, state=UrlStatus.State.ACTIVE
+        )
+        short_urls = list(expiring_statuses.values_list("url__short_url", flat=True))
+
+        if options["delete"]:
+            count, _ = Url.objects.filter(short_url__in=short_urls).delete()
+            UrlCacheService().invalidate(*short_urls)
+            UrlBloomFilterService().remove(*short_urls)
+            self.stdout.write(self.style.SUCCESS(f"Deleted {count} expired URLs."))
+            return
 
         count = UrlStatus.objects.filter(
-            url__in=expired_urls, state=UrlStatus.State.ACTIVE
+            url__short_url__in=short_urls, state=UrlStatus.State.ACTIVE
         ).update(
             state=UrlStatus.State.EXPIRED,
-            reason="URL expired on {}".format(timezone.now().isoformat()),
-            last_checked=timezone.now(),
+            reason="URL expired on {}".format(now.isoformat()),
+            last_checked=now,
         )
+        UrlCacheService().invalidate(*short_urls)
         self.stdout.write(self.style.SUCCESS(f"Deactivated {count} expired URLs."))
@@ -0,0 +1,94 @@
+import csv
+import ipaddress
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.analytics.geoip import IpCountryDatabase, write_database
+
+# Placeholders some dumps use for unassigned or reserved ranges
+UNKNOWN_COUNTRIES = {"", "-", "ZZ", "XX"}
+
+
+def parse_address(value: str):
+    """Parse an address written as text or as an integer."""
+    value = value.strip()
+    if value.isdigit():
+        return ipaddress.ip_address(int(value))
+    return ipaddress.ip_address(value)
+
+
+class Command(BaseCommand):
+    help = (
+        "Import a CSV dump of IP ranges (start, end, country code) into the "
+        "memory-mapped IP to country database used for visit geolocation"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "csv_paths",
+            nargs="+",
+            help="CSV files to import, e.g. separate IPv4 and IPv6 dumps",
+        )
+        parser.add_argument(
+            "--output",
+            default=None,
+            help="Database file to write. Defaults to GEOIP_DB_PATH",
+        )
+        parser.add_argument(
+            "--columns",
+            default="0,1,2",
+            help="Zero-based column indexes of range start, range end and country",
+        )
+
+    def handle(self, *args, **options):
+        output = options["output"] or settings.GEOIP_DB_PATH
+        if not output:
+            raise CommandError("no output path given and GEOIP_DB_PATH is not set")
+        try:
+            start_col, end_col, country_col = (
+                int(column) for column in options["columns"].split(",")
+            )
+        except ValueError:
+            raise CommandError("--columns expects three comma separated indexes")
+
+        started = time.perf_counter()
+        ranges = []
+        skipped = 0
+        for csv_path in options["csv_paths"]:
+            try:
+                with open(csv_path, newline="") as file:
+                    for row in csv.reader(file):
+                        try:
+                            start = parse_address(row[start_col])
+                            end = parse_address(row[end_col])
+                            country = row[country_col].strip().upper()
+                        except (IndexError, ValueError):
+                            # Header lines and malformed rows
+                            skipped += 1
+                            continue
+                        if (
+                            country in UNKNOWN_COUNTRIES
+                            or len(country) != 2
+                            or start.version != end.version
+                            or start > end
+                        ):
+                            skipped += 1
+                            continue
+                        ranges.append((start, end, country))
+            except OSError as e:
+                raise CommandError(f"cannot read {csv_path}: {e}")
+
+        counts = write_database(ranges, output)
+        # Make sure the written file maps cleanly before reporting success
+        IpCountryDatabase(output).close()
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote {counts['ipv4']} IPv4 and {counts['ipv6']} IPv6 ranges to "
+                f"{output} in {elapsed:.2f}s ({skipped} rows skipped, "
+                f"{counts['dropped']} overlapping ranges dropped)."
+            )
+        )
@@ -0,0 +1,104 @@
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+import httpx
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Fire concurrent redirect requests at one or more running servers and "
+        "compare throughput and latency, e.g. the WSGI and ASGI deployments"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "short_urls",
+            nargs="+",
+            help=(
+                "Existing short codes to request in rotation; pass enough of "
+                "them to stay under the per-URL burst limits"
+            ),
+        )
+        parser.add_argument(
+            "--target",
+            action="append",
+            required=True,
+            help="Server to test as name=base_url, e.g. sync=http://localhost:8000",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=2000,
+            help="Total requests per target",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=200,
+            help="Requests kept in flight at once",
+        )
+
+    def handle(self, *args, **options):
+        targets = []
+        for target in options["target"]:
+            name, sep, base_url = target.partition("=")
+            if not sep or not base_url:
+                raise CommandError(f"invalid target '{target}', expected name=url")
+            targets.append((name, base_url.rstrip("/")))
+
+        for name, base_url in targets:
+            urls = [
+                f"{base_url}/api/url/redirect/{short_url}/"
+                for short_url in options["short_urls"]
+            ]
+            elapsed, timings, statuses = asyncio.run(
+                self._run(urls, options["requests"], options["concurrency"])
+            )
+            self._report(name, elapsed, timings, statuses)
+
+    async def _run(self, urls, total, concurrency):
+        semaphore = asyncio.Semaphore(concurrency)
+        timings = []
+        statuses = Counter()
+        limits = httpx.Limits(
+            max_connections=concurrency, max_keepalive_connections=concurrency
+        )
+
+        async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+
+            async def click(i):
+                # Spread clicks over many client IPs so the per-IP rate limit
+                # and burst windows measure the server, not the limiter
+                headers = {
+                    "X-Forwarded-For": f"10.2.{(i // 250) % 250}.{i % 250 + 1}",
+                    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) Firefox/120.0",
+                }
+                async with semaphore:
+                    start = time.perf_counter()
+                    try:
+                        response = await client.get(
+                            urls[i % len(urls)], headers=headers
+                        )
+                        statuses[response.status_code] += 1
+                    except httpx.HTTPError as e:
+                        statuses[type(e).__name__] += 1
+                    timings.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            await asyncio.gather(*(click(i) for i in range(total)))
+            elapsed = time.perf_counter() - start
+
+        return elapsed, timings, statuses
+
+    def _report(self, name, elapsed, timings, statuses):
+        percentiles = statistics.quantiles(timings, n=100)
+        self.stdout.write(
+            f"{name:<8} n={len(timings)} "
+            f"rps={len(timings) / elapsed:.1f} "
+            f"p50={percentiles[49]:.1f}ms "
+            f"p99={percentiles[98]:.1f}ms "
+            f"statuses={dict(statuses)}"
+        )
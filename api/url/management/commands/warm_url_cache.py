@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.url.services.UrlCacheService import UrlCacheService
+
+
+class Command(BaseCommand):
+    help = (
+        "Preload the shared redirect cache and rule sets with the most visited "
+        "recently used URLs"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=settings.URL_CACHE_WARM_SIZE,
+            help="Maximum number of URLs to warm",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.URL_CACHE_WARM_DAYS,
+            help="Only warm URLs visited within this many days",
+        )
+
+    def handle(self, *args, **options):
+        result = UrlCacheService().warm(limit=options["limit"], days=options["days"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Warmed {result['warmed']} URLs and {result['rule_sets']} rule sets "
+                f"in {result['duration_ms']:.2f}ms."
+            )
+        )
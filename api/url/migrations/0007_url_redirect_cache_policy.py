@@ -0,0 +1,41 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("url", "0006_alter_url_name"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="url",
+            name="redirect_type",
+            field=models.PositiveSmallIntegerField(
+                choices=[
+                    (302, "302 found (temporary)"),
+                    (307, "307 temporary redirect"),
+                    (301, "301 moved permanently"),
+                ],
+                default=302,
+            ),
+        ),
+        migrations.AddField(
+            model_name="url",
+            name="cache_max_age",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Seconds browsers and CDNs may reuse the redirect"
+            ),
+        ),
+        migrations.AddField(
+            model_name="url",
+            name="allow_cached_redirects",
+            field=models.BooleanField(
+                default=False,
+                help_text=(
+                    "Let browsers and CDNs cache the redirect. Visits answered from "
+                    "their caches never reach the server and are not counted."
+                ),
+            ),
+        ),
+    ]
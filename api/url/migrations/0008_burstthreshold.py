@@ -0,0 +1,68 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("url", "0007_url_redirect_cache_policy"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BurstThreshold",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "role",
+                    models.CharField(blank=True, max_length=32, null=True, unique=True),
+                ),
+                (
+                    "short_term_window",
+                    models.PositiveIntegerField(blank=True, null=True),
+                ),
+                ("short_term_limit", models.PositiveIntegerField(blank=True, null=True)),
+                (
+                    "medium_term_window",
+                    models.PositiveIntegerField(blank=True, null=True),
+                ),
+                (
+                    "medium_term_limit",
+                    models.PositiveIntegerField(blank=True, null=True),
+                ),
+                ("long_term_window", models.PositiveIntegerField(blank=True, null=True)),
+                ("long_term_limit", models.PositiveIntegerField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "url",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="burst_threshold",
+                        to="url.url",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.CheckConstraint(
+                        condition=models.Q(
+                            models.Q(("role__isnull", True), ("url__isnull", False)),
+                            models.Q(("role__isnull", False), ("url__isnull", True)),
+                            _connector="OR",
+                        ),
+                        name="burst_threshold_url_or_role",
+                    )
+                ],
+            },
+        ),
+    ]
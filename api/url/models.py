@@ -5,6 +5,11 @@ from django.utils import timezone
 
 
 class Url(models.Model):
+    class RedirectType(models.IntegerChoices):
+        FOUND = 302, "302 found (temporary)"
+        TEMPORARY = 307, "307 temporary redirect"
+        PERMANENT = 301, "301 moved permanently"
+
     name = models.CharField(max_length=512, null=True, blank=True)
     long_url = models.CharField(max_length=2000)
     short_url = models.CharField(max_length=64, unique=True)
@@ -15,6 +20,19 @@ class Url(models.Model):
     last_accessed = models.DateTimeField(null=True, blank=True, db_index=True)
     expiry_date = models.DateTimeField(null=True, blank=True, db_index=True)
     is_custom_alias = models.BooleanField(default=False)
+    redirect_type = models.PositiveSmallIntegerField(
+        choices=RedirectType.choices, default=RedirectType.FOUND
+    )
+    cache_max_age = models.PositiveIntegerField(
+        default=0, help_text="Seconds browsers and CDNs may reuse the redirect"
+    )
+    allow_cached_redirects = models.BooleanField(
+        default=False,
+        help_text=(
+            "Let browsers and CDNs cache the redirect. Visits answered from "
+            "their caches never reach the server and are not counted."
+        ),
+    )
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -62,3 +80,55 @@ class UrlStatus(models.Model):
             models.Index(fields=["last_checked"]),
             models.Index(fields=["state", "last_checked"]),
         ]
+
+
+class BurstThreshold(models.Model):
+    """Burst protection limits overriding the defaults for one URL or one role.
+
+    Empty fields inherit: a URL override falls back to the override of its
+    owner's role, which falls back to ``BurstProtectionService`` defaults.
+    """
+
+    FIELDS = (
+        "short_term_window",
+        "short_term_limit",
+        "medium_term_window",
+        "medium_term_limit",
+        "long_term_window",
+        "long_term_limit",
+    )
+
+    url = models.OneToOneField(
+        Url,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="burst_threshold",
+    )
+    role = models.CharField(max_length=32, null=True, blank=True, unique=True)
+    short_term_window = models.PositiveIntegerField(null=True, blank=True)
+    short_term_limit = models.PositiveIntegerField(null=True, blank=True)
+    medium_term_window = models.PositiveIntegerField(null=True, blank=True)
+    medium_term_limit = models.PositiveIntegerField(null=True, blank=True)
+    long_term_window = models.PositiveIntegerField(null=True, blank=True)
+    long_term_limit = models.PositiveIntegerField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(
+                condition=(
+                    models.Q(url__isnull=False, role__isnull=True)
+                    | models.Q(url__isnull=True, role__isnull=False)
+                ),
+                name="burst_threshold_url_or_role",
+            ),
+        ]
+
+    def overrides(self) -> dict:
+        """Return the fields this row sets, leaving inherited ones out."""
+        return {
+            field: getattr(self, field)
+            for field in self.FIELDS
+            if getattr(self, field) is not None
+        }
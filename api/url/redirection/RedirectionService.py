@@ -1,5 +1,9 @@
 from .models import RedirectionRule
+from .compiler import compile_rules
+from .context import ContextLookupStats, LazyRequestContext
+from .RuleSetCacheService import RuleSetCacheService
 from api.url.models import Url
+from api.url.services.UrlCacheService import UrlCacheService
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 
@@ -23,6 +27,7 @@ class RedirectionService:
             raise ValueError("Target URL cannot be the same as the original URL")
 
         rule = RedirectionRule.objects.create(**validated_data)
+        RedirectionService._invalidate_rules(url)
         return rule
 
     @staticmethod
@@ -67,16 +72,20 @@ class RedirectionService:
             if target_url == rule.url.long_url:
                 raise ValueError("Target URL cannot be the same as the original URL")
 
+        previous_url = rule.url
         for attr, value in validated_data.items():
             setattr(rule, attr, value)
         rule.save()
+        RedirectionService._invalidate_rules(previous_url, rule.url)
         return rule
 
     @staticmethod
     def delete_rule(rule) -> bool:
         """Delete a redirection rule with cleanup logic."""
 
+        url = rule.url
         rule.delete()
+        RedirectionService._invalidate_rules(url)
 
     @staticmethod
     def batch_create_rules(validated_rules_data, user) -> list:
@@ -90,6 +99,7 @@ class RedirectionService:
             list: Created rule instances
         """
         created_rules = []
+        touched_urls = []
 
         for rule_data in validated_rules_data:
             url = rule_data["url"]
@@ -108,6 +118,7 @@ class RedirectionService:
                 priority=priority,
                 is_active=rule_data.get("is_active", True),
             )
+            touched_urls.append(url)
 
             created_rules.append(
                 {
@@ -122,6 +133,7 @@ class RedirectionService:
                 }
             )
 
+        RedirectionService._invalidate_rules(*touched_urls)
         return created_rules
 
     @staticmethod
@@ -140,6 +152,7 @@ class RedirectionService:
         """
         deleted_count = 0
         failed_rules = []
+        touched_urls = []
 
         for rule_id in rule_ids:
             try:
@@ -152,6 +165,7 @@ class RedirectionService:
                     continue
 
                 rule.delete()
+                touched_urls.append(rule.url)
                 deleted_count += 1
 
             except RedirectionRule.DoesNotExist:
@@ -159,6 +173,7 @@ class RedirectionService:
             except Exception as e:
                 failed_rules.append({"rule_id": rule_id, "error": str(e)})
 
+        RedirectionService._invalidate_rules(*touched_urls)
         return {"deleted_count": deleted_count, "failed_rules": failed_rules}
 
     @staticmethod
@@ -171,6 +186,14 @@ class RedirectionService:
             rule.priority = current_priority
             rule.save()
             current_priority += 1
+        RedirectionService._invalidate_rules(url)
+
+    @staticmethod
+    def _invalidate_rules(*urls) -> None:
+        """Move URLs to a new rules version and drop their cached resolutions."""
+
+        RuleSetCacheService().bump_version(*{url.id for url in urls})
+        UrlCacheService().invalidate(*{url.short_url for url in urls})
 
     @staticmethod
     def get_active_rules_for_url(url_id) -> object:
@@ -187,8 +210,8 @@ class RedirectionService:
 
             Url.objects.get(id=url_id)
 
-            active_rules = self.get_active_rules_for_url(url_id)
-            if not active_rules:
+            rule_set = compile_rules(RuleSetCacheService.load_rows(url_id))
+            if not rule_set:
                 return None
 
             normalized_context = {
@@ -202,7 +225,7 @@ class RedirectionService:
                 "time_range": test_context.get("time_range"),
             }
 
-            matched_rule = self._evaluate_rules(active_rules, normalized_context)
+            matched_rule = rule_set.match(normalized_context)
             return matched_rule
         except Url.DoesNotExist:
             raise ValueError(f"URL with ID {url_id} not found")
@@ -210,118 +233,30 @@ class RedirectionService:
             raise ValueError(f"Error evaluating rules: {str(e)}")
 
     def evaluate_redirection_rules(self, request, url_instance) -> object:
-        """Evaluate active redirection rules for the URL and return redirect URL if match."""
+        """Evaluate active redirection rules for the URL and return redirect URL if match.
+
+        Resolved URLs carry a has-rules flag and the rules version, so URLs
+        without rules return immediately and the rest reuse a compiled rule
+        set. Plain ``Url`` instances fall back to reading the version.
+        """
         try:
-            active_rules = self.get_active_rules_for_url(url_instance.id)
-            if not active_rules:
+            if not getattr(url_instance, "has_rules", True):
+                return None
+            rule_set_cache = RuleSetCacheService()
+            version = getattr(url_instance, "rules_version", None)
+            if version is None:
+                version = rule_set_cache.get_version(url_instance.id)
+            rule_set = rule_set_cache.get_rule_set(url_instance.id, version)
+            if not rule_set:
                 return None
 
             request_context = self._extract_request_context(request)
-            matched_rule = self._evaluate_rules(active_rules, request_context)
+            matched_rule = rule_set.match(request_context)
+            ContextLookupStats.record(request_context)
             return matched_rule
         except Exception:
             return None
 
-    def _extract_request_context(self, request) -> dict:
-        """Extract client context for rule evaluation."""
-        from api.analytics.utils import (
-            get_ip_address,
-            convert_ip_to_location,
-            parse_user_agent,
-        )
-        from datetime import datetime
-
-        ip = get_ip_address(request)
-        user_agent = request.META.get("HTTP_USER_AGENT", "")
-
-        # Get country from IP
-        country = convert_ip_to_location(ip)
-        country = country.upper() if country and country != "Unknown" else None
-
-        # Parse user agent
-        ua_data = parse_user_agent(user_agent)
-
-        # Current time for time_range
-        current_time = timezone.now().strftime("%H:%M")
-
-        mobile = ua_data.get("is_mobile", False) or ua_data.get(
-            "device", ""
-        ).lower() in ["iphone", "android", "ipad"]
-
-        return {
-            "country": country,
-            "device_type": "mobile" if mobile else "desktop",
-            "browser": ua_data.get("browser", ""),
-            "os": ua_data.get("os", ""),
-            "language": self._parse_accept_language(
-                request.META.get("HTTP_ACCEPT_LANGUAGE", "")
-            ),
-            "mobile": mobile,
-            "referer": request.META.get("HTTP_REFERER", ""),
-            "time_range": current_time,
-        }
-
-    def _parse_accept_language(self, accept_language) -> str | None:
-        """Parse Accept-Language header to get primary language."""
-        if not accept_language:
-            return None
-        # Parse "en-US,en;q=0.9" -> "en"
-        primary = accept_language.split(",")[0].split("-")[0].split(";")[0].strip()
-        return primary.lower()
-
-    def _evaluate_rules(self, rules, context) -> object:
-        """Evaluate rules in priority order, return first match."""
-        for rule in rules:
-            if self._rule_matches(rule, context):
-                return rule
-        return None
-
-    def _rule_matches(self, rule, context) -> bool:
-        """Check if rule conditions match request context."""
-        conditions = rule.conditions
-        for key, expected_value in conditions.items():
-            actual_value = context.get(key)
-            if not self._condition_matches(key, expected_value, actual_value):
-                return False
-        return True
-
-    def _condition_matches(self, key, expected, actual) -> bool:
-        """Check individual condition matching."""
-        if actual is None:
-            return False
-
-        if key == "country":
-            return (
-                actual in expected if isinstance(expected, list) else actual == expected
-            )
-        elif key in ["device_type", "browser", "os"]:
-            return actual == expected
-        elif key == "mobile":
-            return actual == expected
-        elif key == "language":
-            return (
-                actual in expected if isinstance(expected, list) else actual == expected
-            )
-        elif key == "time_range":
-            return self._time_in_range(actual, expected)
-        elif key == "referer":
-            return (
-                any(pattern in actual for pattern in expected)
-                if isinstance(expected, list)
-                else expected in actual
-            )
-        return False
-
-    def _time_in_range(self, current_time, time_range) -> bool:
-        """Check if current_time (HH:MM) is within time_range."""
-        if not time_range or "start" not in time_range or "end" not in time_range:
-            return False
-
-        start = time_range["start"]
-        end = time_range["end"]
-
-        # Handle overnight ranges (e.g., 22:00 to 06:00)
-        if start <= end:
-            return start <= current_time <= end
-        else:
-            return current_time >= start or current_time <= end
+    def _extract_request_context(self, request) -> LazyRequestContext:
+        """Build the lazily evaluated client context for rule evaluation."""
+        return LazyRequestContext(request)
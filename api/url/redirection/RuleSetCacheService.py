@@ -0,0 +1,131 @@
+import json
+import logging
+
+from django.conf import settings
+
+from api.url.redirection.compiler import CompiledRuleSet, compile_rules
+from api.url.redirection.models import RedirectionRule
+from config.redis_utils import get_redis_client
+from config.settings_utils import get_url_mapping_cache_timeout
+from config.utils.lru import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class RuleSetCacheService:
+    """Caches compiled redirection rule sets per URL and rules version.
+
+    Every change to a URL's rules bumps its version in Redis. The version is
+    carried in the resolved URL record, so a click finds its compiled rule
+    set in the per-process LRU without any extra round trip; only a new
+    version reads the shared Redis copy of the rules, and only a miss there
+    queries Postgres.
+    """
+
+    KEY_PREFIX = "url_rules"
+    VERSION_PREFIX = "url_rules_version"
+
+    # Entries are immutable per version, the TTL only bounds memory held by
+    # rule sets of URLs that stopped receiving traffic
+    _local = LRUCache(maxsize=settings.URL_CACHE_LOCAL_SIZE, ttl=300)
+
+    def __init__(self) -> None:
+        """Initialize the RuleSetCacheService with Redis client."""
+        self.redis_client = get_redis_client()
+
+    @classmethod
+    def _key(cls, url_id: int, version: int) -> str:
+        return f"{cls.KEY_PREFIX}:{url_id}:{version}"
+
+    @classmethod
+    def _version_key(cls, url_id: int) -> str:
+        return f"{cls.VERSION_PREFIX}:{url_id}"
+
+    def get_version(self, url_id: int) -> int:
+        """Get the current rules version of a URL.
+
+        Args:
+            url_id (int): The URL ID.
+
+        Returns:
+            int: The version, 0 if the rules never changed.
+        """
+        try:
+            return int(self.redis_client.get(self._version_key(url_id)) or 0)
+        except Exception as e:
+            logger.error(f"error happened while reading rules version: {str(e)}")
+            return 0
+
+    def bump_version(self, *url_ids: int) -> None:
+        """Invalidate compiled rule sets by moving URLs to a new version.
+
+        Args:
+            *url_ids (int): IDs of URLs whose rules changed.
+        """
+        if not url_ids:
+            return
+        try:
+            pipe = self.redis_client.pipeline()
+            for url_id in url_ids:
+                pipe.incr(self._version_key(url_id))
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"error happened while bumping rules version: {str(e)}")
+
+    def get_rule_set(self, url_id: int, version: int) -> CompiledRuleSet:
+        """Get the compiled active rules of a URL at a given version.
+
+        Args:
+            url_id (int): The URL ID.
+            version (int): The rules version the caller resolved.
+
+        Returns:
+            CompiledRuleSet: The compiled rules, possibly empty.
+        """
+        local_key = (url_id, version)
+        rule_set = self._local.get(local_key)
+        if rule_set is not None:
+            return rule_set
+
+        rows = self._get_shared(url_id, version)
+        if rows is None:
+            rows = self.load_rows(url_id)
+            self._set_shared(url_id, version, rows)
+
+        rule_set = compile_rules(rows)
+        self._local.set(local_key, rule_set)
+        return rule_set
+
+    @staticmethod
+    def load_rows(url_id: int) -> list[dict]:
+        """Load the active rules of a URL in evaluation order.
+
+        Args:
+            url_id (int): The URL ID.
+
+        Returns:
+            list[dict]: Rule rows ready for ``compile_rules``.
+        """
+        return list(
+            RedirectionRule.objects.filter(url_id=url_id, is_active=True)
+            .order_by("priority")
+            .values("id", "name", "target_url", "priority", "conditions")
+        )
+
+    def _get_shared(self, url_id: int, version: int) -> list[dict] | None:
+        try:
+            data = self.redis_client.get(self._key(url_id, version))
+        except Exception as e:
+            logger.error(f"error happened while reading rules cache: {str(e)}")
+            return None
+        return json.loads(data) if data else None
+
+    def _set_shared(self, url_id: int, version: int, rows: list[dict]) -> None:
+        try:
+            self.redis_client.set(
+                self._key(url_id, version),
+                json.dumps(rows),
+                ex=int(get_url_mapping_cache_timeout()),
+            )
+        except Exception as e:
+            logger.error(f"error happened while writing rules cache: {str(e)}")
@@ -0,0 +1,167 @@
+import re
+
+# Conditions are checked cheapest first, so a rule that fails on the time of
+# day or the referer never pays for user agent parsing or geolocation
+CONDITION_COST = {
+    "time_range": 0,
+    "referer": 1,
+    "language": 2,
+    "device_type": 3,
+    "browser": 3,
+    "os": 3,
+    "mobile": 3,
+    "country": 4,
+}
+
+
+def _never(actual) -> bool:
+    return False
+
+
+def _minute_of_day(value) -> int | None:
+    """Convert ``HH:MM`` to minutes since midnight, or None if malformed."""
+    try:
+        hours, minutes = value.split(":")[:2]
+        return int(hours) * 60 + int(minutes)
+    except (AttributeError, ValueError):
+        return None
+
+
+def _compile_membership(expected):
+    values = expected if isinstance(expected, list) else [expected]
+    try:
+        return frozenset(values).__contains__
+    except TypeError:
+        return lambda actual: actual in values
+
+
+def _compile_equality(expected):
+    return lambda actual: actual == expected
+
+
+def _compile_time_range(expected):
+    if not isinstance(expected, dict) or "start" not in expected or "end" not in expected:
+        return _never
+
+    start = _minute_of_day(expected["start"])
+    end = _minute_of_day(expected["end"])
+    if start is None or end is None:
+        # Keep the lexicographic behaviour for values that are not HH:MM
+        start, end = expected["start"], expected["end"]
+        if start <= end:
+            return lambda actual: start <= actual <= end
+        return lambda actual: actual >= start or actual <= end
+
+    def within(actual) -> bool:
+        minute = _minute_of_day(actual)
+        if minute is None:
+            return False
+        if start <= end:
+            return start <= minute <= end
+        # Overnight ranges (e.g., 22:00 to 06:00)
+        return minute >= start or minute <= end
+
+    return within
+
+
+def _compile_referer(expected):
+    patterns = expected if isinstance(expected, list) else [expected]
+    if not patterns:
+        return _never
+    regex = re.compile("|".join(re.escape(str(pattern)) for pattern in patterns))
+    return lambda actual: regex.search(actual) is not None
+
+
+COMPILERS = {
+    "country": _compile_membership,
+    "language": _compile_membership,
+    "device_type": _compile_equality,
+    "browser": _compile_equality,
+    "os": _compile_equality,
+    "mobile": _compile_equality,
+    "time_range": _compile_time_range,
+    "referer": _compile_referer,
+}
+
+
+class CompiledRule:
+    """A redirection rule with its conditions turned into predicates."""
+
+    __slots__ = ("id", "name", "target_url", "priority", "conditions", "checks")
+
+    def __init__(self, id, name, target_url, priority, conditions) -> None:
+        self.id = id
+        self.name = name
+        self.target_url = target_url
+        self.priority = priority
+        self.conditions = conditions
+        self.checks = tuple(
+            (key, COMPILERS[key](expected) if key in COMPILERS else _never)
+            for key, expected in sorted(
+                conditions.items(), key=lambda item: CONDITION_COST.get(item[0], 0)
+            )
+        )
+
+    def matches(self, context) -> bool:
+        """Check whether every condition holds for the request context.
+
+        Args:
+            context: Mapping of condition keys to request values.
+
+        Returns:
+            bool: True if the rule applies.
+        """
+        for key, check in self.checks:
+            actual = context.get(key)
+            if actual is None or not check(actual):
+                return False
+        return True
+
+
+class CompiledRuleSet:
+    """Active rules of one URL in evaluation order."""
+
+    __slots__ = ("rules",)
+
+    def __init__(self, rules: list[CompiledRule]) -> None:
+        self.rules = tuple(rules)
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    def match(self, context) -> CompiledRule | None:
+        """Return the first rule matching the context.
+
+        Args:
+            context: Mapping of condition keys to request values.
+
+        Returns:
+            CompiledRule | None: The matched rule, if any.
+        """
+        for rule in self.rules:
+            if rule.matches(context):
+                return rule
+        return None
+
+
+def compile_rules(rows: list[dict]) -> CompiledRuleSet:
+    """Compile rule rows, already in evaluation order, into a rule set.
+
+    Args:
+        rows (list[dict]): Rules with id, name, target_url, priority and conditions.
+
+    Returns:
+        CompiledRuleSet: The compiled matcher.
+    """
+    return CompiledRuleSet(
+        [
+            CompiledRule(
+                id=row["id"],
+                name=row["name"],
+                target_url=row["target_url"],
+                priority=row["priority"],
+                conditions=row["conditions"] or {},
+            )
+            for row in rows
+        ]
+    )
@@ -0,0 +1,171 @@
+import logging
+import threading
+
+from django.utils import timezone
+
+from api.analytics.fingerprint import get_fingerprint
+from api.analytics.utils import ParsedUserAgent
+from config.redis_utils import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class LazyRequestContext:
+    """Request context for rule evaluation, computed one dimension at a time.
+
+    Rules only read the keys their conditions reference, so matching rules
+    that test the referer or the time of day triggers no geolocation or user
+    agent parsing of its own. Expensive values come from the request's
+    ``ClientFingerprint``, so they are shared with analytics and fraud
+    detection.
+    """
+
+    __slots__ = ("fingerprint", "_values", "geo_looked_up", "ua_parsed")
+
+    def __init__(self, request) -> None:
+        self.fingerprint = get_fingerprint(request)
+        self._values = {}
+        self.geo_looked_up = False
+        self.ua_parsed = False
+
+    def get(self, key, default=None):
+        """Return the context value for a condition key.
+
+        Args:
+            key (str): Condition key, e.g. ``country`` or ``referer``.
+            default: Returned for unknown keys.
+
+        Returns:
+            The value for the current request.
+        """
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        resolver = getattr(self, f"_resolve_{key}", None)
+        if resolver is None:
+            return default
+        value = resolver()
+        self._values[key] = value
+        return value
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def _parsed_user_agent(self) -> ParsedUserAgent:
+        self.ua_parsed = True
+        return self.fingerprint.user_agent
+
+    def _resolve_country(self):
+        self.geo_looked_up = True
+        country = self.fingerprint.country
+        return country.upper() if country and country != "Unknown" else None
+
+    def _resolve_mobile(self) -> bool:
+        ua_data = self._parsed_user_agent()
+        return ua_data.is_mobile or ua_data.device in ["iphone", "android", "ipad"]
+
+    def _resolve_device_type(self) -> str:
+        return "mobile" if self.get("mobile") else "desktop"
+
+    def _resolve_browser(self) -> str:
+        return self._parsed_user_agent().browser
+
+    def _resolve_os(self) -> str:
+        return self._parsed_user_agent().os
+
+    def _resolve_language(self) -> str | None:
+        return self.fingerprint.language
+
+    def _resolve_referer(self) -> str:
+        return self.fingerprint.referer
+
+    def _resolve_time_range(self) -> str:
+        return timezone.now().strftime("%H:%M")
+
+    def as_dict(self) -> dict:
+        """Resolve every dimension, for callers that need the full context."""
+        return {
+            key: self.get(key)
+            for key in (
+                "country",
+                "device_type",
+                "browser",
+                "os",
+                "language",
+                "mobile",
+                "referer",
+                "time_range",
+            )
+        }
+
+
+class ContextLookupStats:
+    """Counts rule evaluations that needed geolocation or user agent parsing.
+
+    Recorded visits resolve both from the same ``ClientFingerprint`` anyway,
+    so these counters show what rules ask for, not lookups saved per request.
+    Counts are kept in process and added to a shared Redis hash every
+    ``FLUSH_EVERY`` evaluations, so the hot path does not pay a round trip
+    for its own bookkeeping.
+    """
+
+    KEY = "redirect_rules:context_stats"
+    FIELDS = ("evaluations", "geo_lookups", "ua_lookups")
+    FLUSH_EVERY = 100
+
+    _lock = threading.Lock()
+    _pending = dict.fromkeys(FIELDS, 0)
+
+    @classmethod
+    def record(cls, context: LazyRequestContext) -> None:
+        """Record which expensive lookups one evaluation needed.
+
+        Args:
+            context (LazyRequestContext): The context after rule matching.
+        """
+        with cls._lock:
+            pending = cls._pending
+            pending["evaluations"] += 1
+            pending["geo_lookups"] += context.geo_looked_up
+            pending["ua_lookups"] += context.ua_parsed
+            if pending["evaluations"] < cls.FLUSH_EVERY:
+                return
+            cls._pending = dict.fromkeys(cls.FIELDS, 0)
+        cls._flush(pending)
+
+    @classmethod
+    def _flush(cls, counts: dict) -> None:
+        try:
+            pipe = get_redis_client().pipeline()
+            for field, count in counts.items():
+                if count:
+                    pipe.hincrby(cls.KEY, field, count)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"error happened while flushing rule context stats: {str(e)}")
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Combine the shared totals with this process's unflushed counts.
+
+        Returns:
+            dict: Lookup counters keyed by ``FIELDS``.
+        """
+        try:
+            shared = get_redis_client().hgetall(cls.KEY)
+        except Exception as e:
+            logger.error(f"error happened while reading rule context stats: {str(e)}")
+            shared = {}
+        with cls._lock:
+            pending = dict(cls._pending)
+        return {
+            field: int(shared.get(field, 0)) + pending[field] for field in cls.FIELDS
+        }
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop the unflushed counts of this process."""
+        with cls._lock:
+            cls._pending = dict.fromkeys(cls.FIELDS, 0)
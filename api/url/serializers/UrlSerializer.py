@@ -4,10 +4,12 @@ from rest_framework.serializers import (
     CharField,
     ValidationError,
     ReadOnlyField,
+    SerializerMethodField,
 )
 import re
 from api.url.models import Url
 from api.url.serializers.UrlStatusSerializer import UrlStatusSerializer
+from api.url.services.RedirectCachePolicyService import RedirectCachePolicyService
 from api.url.utils import urlChecker
 
 
@@ -25,7 +27,30 @@ class ShortenUrlSerializer(ModelSerializer):
             "short_url",
             "user",
             "expiry_date",
+            "redirect_type",
+            "cache_max_age",
+            "allow_cached_redirects",
         ]
+        extra_kwargs = {"cache_max_age": {"max_value": 31536000}}
+
+    def validate(self, attrs):
+        def current(field):
+            if field in attrs:
+                return attrs[field]
+            if self.instance is not None:
+                return getattr(self.instance, field)
+            return Url._meta.get_field(field).default
+
+        if not current("allow_cached_redirects"):
+            if current("redirect_type") == Url.RedirectType.PERMANENT:
+                raise ValidationError(
+                    detail="permanent redirects are cached by browsers, set allow_cached_redirects to accept uncounted visits"
+                )
+            if current("cache_max_age"):
+                raise ValidationError(
+                    detail="cache_max_age requires allow_cached_redirects, cached visits are not counted"
+                )
+        return attrs
 
     def validate_short_url(self, value):
         if value is None:
@@ -51,6 +76,7 @@ class ShortenUrlSerializer(ModelSerializer):
 class ResponseUrlSerializer(ModelSerializer):
     url_status = UrlStatusSerializer(read_only=True)
     days_until_expiry = ReadOnlyField()
+    cache_policy = SerializerMethodField()
 
     class Meta:
         model = Url
@@ -68,4 +94,11 @@ class ResponseUrlSerializer(ModelSerializer):
             "url_status",
             "last_accessed",
             "days_until_expiry",
+            "redirect_type",
+            "cache_max_age",
+            "allow_cached_redirects",
+            "cache_policy",
         ]
+
+    def get_cache_policy(self, obj):
+        return RedirectCachePolicyService.describe(obj)
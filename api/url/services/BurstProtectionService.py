@@ -1,31 +1,235 @@
+import logging
+import threading
+import uuid
+
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from redis.exceptions import NoScriptError
 from api.url.models import Url, UrlStatus
 from django.utils import timezone
 from api.admin_panel.fraud.FraudService import FraudService
-from config.redis_utils import get_redis_client
+from api.url.services.BurstViolationService import BurstViolationService
+from api.url.services.UrlCacheService import UrlCacheService
+from config.redis_utils import get_async_redis_client, get_redis_client
+from config.utils.token_bucket import TokenBucketCache
+
+logger = logging.getLogger(__name__)
+
+# KEYS: url burst zset, ip burst zset
+# ARGV: now, member, (window, limit) x3 short/medium/long
+# Returns 0 if any window is full, otherwise records the click and falls
+# through, so scripts doing more per click can start with it.
+# Redis runs scripts one at a time, so the check and the record cannot
+# interleave with another click and no lock is needed.
+SLIDING_WINDOW_CHECK_LUA = """
+local now = tonumber(ARGV[1])
+for i = 0, 2 do
+    local window = tonumber(ARGV[3 + i * 2])
+    local limit = tonumber(ARGV[4 + i * 2])
+    if redis.call('ZCOUNT', KEYS[2], now - window, now) >= limit then
+        return 0
+    end
+    if redis.call('ZCOUNT', KEYS[1], now - window, now) >= limit then
+        return 0
+    end
+end
+
+local longest = tonumber(ARGV[7])
+for k = 1, 2 do
+    redis.call('ZADD', KEYS[k], now, ARGV[2])
+    redis.call('ZREMRANGEBYSCORE', KEYS[k], '-inf', now - longest)
+    redis.call('EXPIRE', KEYS[k], math.ceil(longest))
+end
+"""
+
+# Returns 1 if the click was recorded, 0 if any window is full.
+SLIDING_WINDOW_LUA = SLIDING_WINDOW_CHECK_LUA + "return 1\n"
+
+# KEYS: url bucket hash, ip bucket hash
+# ARGV: now, (window, limit, bucket width) x3 short/medium/long
+# Returns 1 if the click was recorded, 0 if any window is full.
+# Each window counts clicks in fixed buckets stored as "<window>:<bucket>"
+# hash fields. The oldest bucket only partly overlaps the sliding window and
+# is weighted by that overlap, assuming its clicks were evenly spread.
+BUCKETED_WINDOW_LUA = """
+local now = tonumber(ARGV[1])
+local windows = {}
+local ttl = 0
+for i = 1, 3 do
+    local window = tonumber(ARGV[i * 3 - 1])
+    local width = tonumber(ARGV[i * 3 + 1])
+    windows[i] = {window, tonumber(ARGV[i * 3]), width}
+    ttl = math.max(ttl, window + width)
+end
+
+for k = 2, 1, -1 do
+    local counts = {0, 0, 0}
+    local stale = {}
+    local fields = redis.call('HGETALL', KEYS[k])
+    for j = 1, #fields, 2 do
+        local i, bucket = string.match(fields[j], '^(%d+):(%d+)$')
+        i = tonumber(i)
+        local window, limit, width = unpack(windows[i])
+        local start = now - window
+        local bucket_start = tonumber(bucket) * width
+        local bucket_end = bucket_start + width
+        if bucket_end <= start then
+            stale[#stale + 1] = fields[j]
+        elseif bucket_start < start then
+            counts[i] = counts[i] + tonumber(fields[j + 1]) * (bucket_end - start) / width
+        else
+            counts[i] = counts[i] + tonumber(fields[j + 1])
+        end
+    end
+    if #stale > 0 then
+        redis.call('HDEL', KEYS[k], unpack(stale))
+    end
+    for i = 1, 3 do
+        if counts[i] >= windows[i][2] then
+            return 0
+        end
+    end
+end
+
+for k = 1, 2 do
+    for i = 1, 3 do
+        local bucket = math.floor(now / windows[i][3])
+        redis.call('HINCRBY', KEYS[k], i .. ':' .. string.format('%d', bucket), 1)
+    end
+    redis.call('EXPIRE', KEYS[k], math.ceil(ttl))
+end
+return 1
+"""
+
+
+class PreFilterStats:
+    """Counts clicks shed by the in-process pre-filter vs checked in Redis.
+
+    Counts are kept in process and added to a shared Redis hash every
+    ``FLUSH_EVERY`` clicks, so shedding a flood stays free of round trips.
+    """
+
+    KEY = "burst_protection:prefilter_stats"
+    FIELDS = ("shed", "checked")
+    FLUSH_EVERY = 100
+
+    _lock = threading.Lock()
+    _pending = dict.fromkeys(FIELDS, 0)
+
+    @classmethod
+    def record(cls, shed: bool) -> None:
+        """Record the pre-filter decision for one click.
+
+        Args:
+            shed (bool): Whether the click was rejected without asking Redis.
+        """
+        with cls._lock:
+            pending = cls._pending
+            pending["shed" if shed else "checked"] += 1
+            if pending["shed"] + pending["checked"] < cls.FLUSH_EVERY:
+                return
+            cls._pending = dict.fromkeys(cls.FIELDS, 0)
+        cls._flush(pending)
+
+    @classmethod
+    def _flush(cls, counts: dict) -> None:
+        try:
+            pipe = get_redis_client().pipeline()
+            for field, count in counts.items():
+                if count:
+                    pipe.hincrby(cls.KEY, field, count)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"error happened while flushing pre-filter stats: {str(e)}")
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Combine the shared totals with this process's unflushed counts.
+
+        Returns:
+            dict: Shed and checked counters.
+        """
+        try:
+            shared = get_redis_client().hgetall(cls.KEY)
+        except Exception as e:
+            logger.error(f"error happened while reading pre-filter stats: {str(e)}")
+            shared = {}
+        with cls._lock:
+            pending = dict(cls._pending)
+        return {
+            field: int(shared.get(field, 0)) + pending[field] for field in cls.FIELDS
+        }
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop the unflushed counts of this process."""
+        with cls._lock:
+            cls._pending = dict.fromkeys(cls.FIELDS, 0)
 
 
 class BurstProtectionService:
-    """Service for detecting and preventing burst traffic on URLs."""
+    """Service for detecting and preventing burst traffic on URLs.
+
+    ``BURST_PROTECTION_ENGINE`` selects how a click is checked: ``lock``
+    serializes clicks per link and IP behind a Redis lock, ``atomic`` runs
+    the same windows in one Lua script without a lock, and ``bucket`` runs
+    them in one Lua script over fixed-size buckets, so a key holds at most
+    a few dozen counters however busy it is.
+
+    Whatever the engine, each worker first runs the click through local
+    token buckets mirroring the Redis keys, one per link and one per IP,
+    holding ``BURST_PREFILTER_FRACTION`` of the short-term limit and
+    refilling at the limit's rate. Above a fraction of 1 a bucket only
+    empties once this worker alone has seen more clicks than the shared
+    windows allow, so Redis has already rejected the link or IP and the
+    remaining flood is shed without a round trip, whether it comes from
+    one IP or is spread across many.
+    """
+
+    # Bucket width in seconds of the short, medium and long windows
+    BUCKET_WIDTHS = (1, 10, 60)
+
+    DEFAULT_THRESHOLDS = {
+        "short_term_window": 10,  # seconds
+        "short_term_limit": 10,
+        "medium_term_window": 60,  # seconds
+        "medium_term_limit": 50,
+        "long_term_window": 3600,  # seconds
+        "long_term_limit": 1000,
+    }
+
+    _scripts = {}
+    _prefilter = TokenBucketCache(maxsize=settings.BURST_PREFILTER_SIZE)
 
     def __init__(self) -> None:
         """Initialize the BurstProtectionService with Redis client."""
         self.redis_client = get_redis_client()
-        self.default_thresholds = {
-            "short_term_window": 10,  # seconds
-            "short_term_limit": 10,
-            "medium_term_window": 60,  # seconds
-            "medium_term_limit": 50,
-            "long_term_window": 3600,  # seconds
-            "long_term_limit": 1000,
-        }
+        self.violation_service = BurstViolationService()
+        self.default_thresholds = dict(self.DEFAULT_THRESHOLDS)
+
+    def thresholds_for(self, overrides: dict | None = None) -> dict:
+        """Apply a link's overrides to the default thresholds.
 
-    def _detect_burst(self, ip: str, short_url: str) -> bool:
+        Args:
+            overrides (dict | None): Overridden fields, usually
+                ``ResolvedUrl.burst_thresholds``.
+
+        Returns:
+            dict: The thresholds to check the link's clicks against.
+        """
+        if not overrides:
+            return self.default_thresholds
+        return {**self.default_thresholds, **overrides}
+
+    def _detect_burst(
+        self, ip: str, short_url: str, thresholds: dict | None = None
+    ) -> bool:
         """Detect if current traffic constitutes a burst.
 
         Args:
             ip (str): The IP address.
             short_url (str): The short URL identifier.
+            thresholds (dict | None): Limits to apply. Defaults to the defaults.
 
         Returns:
             bool: True if burst detected, False otherwise.
@@ -39,9 +243,10 @@ class BurstProtectionService:
             ("long_term_window", "long_term_limit"),
         ]
 
+        thresholds = thresholds or self.default_thresholds
         for window_key, limit_key in windows:
-            window = self.default_thresholds[window_key]
-            limit = self.default_thresholds[limit_key]
+            window = thresholds[window_key]
+            limit = thresholds[limit_key]
 
             if self._check_window_burst(ip_key, timestamp - window, limit):
                 return True
@@ -79,14 +284,47 @@ class BurstProtectionService:
             url_instance.url_status.state = UrlStatus.State.FLAGGED
             url_instance.url_status.reason = "Too many requests on the url"
             url_instance.url_status.save()
+            UrlCacheService().invalidate(short_url)
             FraudService.flag_burst_protection(url_instance, ip)
 
-    def _track_click(self, short_url: str, ip: str) -> None:
+    def flag(self, short_url: str, ip: str) -> None:
+        """Flag a URL after one of its clicks was rejected.
+
+        With ``BURST_FLAG_ASYNC`` the violation is queued for
+        ``BurstViolationService.process`` and only the cached state changes
+        on the request path; otherwise the URL is flagged in the database
+        right away.
+
+        Args:
+            short_url (str): The short URL to flag.
+            ip (str): The IP address triggering the flag.
+        """
+        if settings.BURST_FLAG_ASYNC:
+            self.violation_service.record(short_url, ip)
+        else:
+            self._flag_url(short_url, ip)
+
+    async def aflag(self, short_url: str, ip: str) -> None:
+        """Async variant of ``flag``.
+
+        Args:
+            short_url (str): The short URL to flag.
+            ip (str): The IP address triggering the flag.
+        """
+        if settings.BURST_FLAG_ASYNC:
+            await self.violation_service.arecord(short_url, ip)
+        else:
+            await sync_to_async(self._flag_url)(short_url, ip)
+
+    def _track_click(
+        self, short_url: str, ip: str, thresholds: dict | None = None
+    ) -> None:
         """Track a click for burst protection.
 
         Args:
             short_url (str): The short URL identifier.
             ip (str): The IP address.
+            thresholds (dict | None): Limits to apply. Defaults to the defaults.
         """
         timestamp = timezone.now().timestamp()
         url_key = f"burst_protection:url:{short_url}"
@@ -97,22 +335,286 @@ class BurstProtectionService:
         self.redis_client.zadd(ip_key, {str(timestamp): timestamp})
 
         # Clean up old entries beyond long_term_window
-        cutoff_time = timestamp - self.default_thresholds["long_term_window"]
+        thresholds = thresholds or self.default_thresholds
+        cutoff_time = timestamp - thresholds["long_term_window"]
         self.redis_client.zremrangebyscore(url_key, "-inf", cutoff_time)
         self.redis_client.zremrangebyscore(ip_key, "-inf", cutoff_time)
 
-    def check_burst(self, ip: str, short_url: str) -> bool:
+    def _burst_keys(self, ip: str, short_url: str) -> list[str]:
+        return [f"burst_protection:url:{short_url}", f"burst_protection:ip:{ip}"]
+
+    def _sliding_window_args(
+        self, thresholds: dict, timestamp: float | None = None
+    ) -> list:
+        if timestamp is None:
+            timestamp = timezone.now().timestamp()
+        return [
+            timestamp,
+            # Unique member, so simultaneous clicks are never merged
+            f"{timestamp}:{uuid.uuid4().hex[:8]}",
+            thresholds["short_term_window"],
+            thresholds["short_term_limit"],
+            thresholds["medium_term_window"],
+            thresholds["medium_term_limit"],
+            thresholds["long_term_window"],
+            thresholds["long_term_limit"],
+        ]
+
+    def _bucket_keys(self, ip: str, short_url: str) -> list[str]:
+        return [
+            f"burst_protection:buckets:url:{short_url}",
+            f"burst_protection:buckets:ip:{ip}",
+        ]
+
+    def _bucket_args(self, thresholds: dict, timestamp: float | None = None) -> list:
+        if timestamp is None:
+            timestamp = timezone.now().timestamp()
+        args = [timestamp]
+        for term, width in zip(("short", "medium", "long"), self.BUCKET_WIDTHS):
+            args.extend(
+                [
+                    thresholds[f"{term}_term_window"],
+                    thresholds[f"{term}_term_limit"],
+                    width,
+                ]
+            )
+        return args
+
+    def _get_script(self, source: str):
+        script = BurstProtectionService._scripts.get(source)
+        if script is None:
+            script = self.redis_client.register_script(source)
+            BurstProtectionService._scripts[source] = script
+        return script
+
+    def _flag_blocked(self, short_url: str, ip: str) -> None:
+        try:
+            self.flag(short_url, ip)
+        except Exception as e:
+            logger.error(f"error happened while flagging a url: {str(e)}")
+
+    async def _aflag_blocked(self, short_url: str, ip: str) -> None:
+        try:
+            await self.aflag(short_url, ip)
+        except Exception as e:
+            logger.error(f"error happened while flagging a url: {str(e)}")
+
+    def _run_script(
+        self, source: str, keys: list, args: list, ip: str, short_url: str
+    ) -> bool:
+        """Run a window script, flagging the URL when the click is rejected.
+
+        Redis errors let the click through: a failing limiter should not turn
+        every visitor away.
+
+        Args:
+            source (str): Lua source of the window script.
+            keys (list): The script's url and ip keys.
+            args (list): The script's arguments.
+            ip (str): The IP address.
+            short_url (str): The short URL identifier.
+
+        Returns:
+            bool: True if request allowed, False if blocked.
+        """
+        try:
+            allowed = self._get_script(source)(keys=keys, args=args)
+        except Exception as e:
+            logger.error(f"error happened while checking burst protection: {str(e)}")
+            return True
+        if not allowed:
+            self._flag_blocked(short_url, ip)
+            return False
+        return True
+
+    async def _arun_script(
+        self, source: str, keys: list, args: list, ip: str, short_url: str
+    ) -> bool:
+        """Async variant of ``_run_script`` built on ``redis.asyncio``."""
+        redis_client = get_async_redis_client()
+        try:
+            try:
+                allowed = await redis_client.evalsha(
+                    self._get_script(source).sha, len(keys), *keys, *args
+                )
+            except NoScriptError:
+                allowed = await redis_client.eval(source, len(keys), *keys, *args)
+        except Exception as e:
+            logger.error(f"error happened while checking burst protection: {str(e)}")
+            return True
+        if not allowed:
+            await self._aflag_blocked(short_url, ip)
+            return False
+        return True
+
+    def check_burst_atomic(
+        self,
+        ip: str,
+        short_url: str,
+        overrides: dict | None = None,
+        timestamp: float | None = None,
+    ) -> bool:
+        """Check and record a click in one atomic Lua script, without a lock.
+
+        Args:
+            ip (str): The IP address.
+            short_url (str): The short URL identifier.
+            overrides (dict | None): Per-link overrides of the default thresholds.
+            timestamp (float | None): Click time, now by default; lets
+                benchmarks replay recorded traffic.
+
+        Returns:
+            bool: True if request allowed, False if blocked.
+        """
+        return self._run_script(
+            SLIDING_WINDOW_LUA,
+            self._burst_keys(ip, short_url),
+            self._sliding_window_args(self.thresholds_for(overrides), timestamp),
+            ip,
+            short_url,
+        )
+
+    async def acheck_burst_atomic(
+        self, ip: str, short_url: str, overrides: dict | None = None
+    ) -> bool:
+        """Async variant of ``check_burst_atomic``.
+
+        Args:
+            ip (str): The IP address.
+            short_url (str): The short URL identifier.
+            overrides (dict | None): Per-link overrides of the default thresholds.
+
+        Returns:
+            bool: True if request allowed, False if blocked.
+        """
+        return await self._arun_script(
+            SLIDING_WINDOW_LUA,
+            self._burst_keys(ip, short_url),
+            self._sliding_window_args(self.thresholds_for(overrides)),
+            ip,
+            short_url,
+        )
+
+    def check_burst_buckets(
+        self,
+        ip: str,
+        short_url: str,
+        overrides: dict | None = None,
+        timestamp: float | None = None,
+    ) -> bool:
+        """Check and record a click against bucketed windows in one Lua script.
+
+        Memory per link or IP is bounded by the number of buckets instead of
+        growing with its traffic, at the cost of approximating the oldest
+        bucket of each window.
+
+        Args:
+            ip (str): The IP address.
+            short_url (str): The short URL identifier.
+            overrides (dict | None): Per-link overrides of the default thresholds.
+            timestamp (float | None): Click time, now by default; lets
+                benchmarks replay recorded traffic.
+
+        Returns:
+            bool: True if request allowed, False if blocked.
+        """
+        return self._run_script(
+            BUCKETED_WINDOW_LUA,
+            self._bucket_keys(ip, short_url),
+            self._bucket_args(self.thresholds_for(overrides), timestamp),
+            ip,
+            short_url,
+        )
+
+    async def acheck_burst_buckets(
+        self, ip: str, short_url: str, overrides: dict | None = None
+    ) -> bool:
+        """Async variant of ``check_burst_buckets``.
+
+        Args:
+            ip (str): The IP address.
+            short_url (str): The short URL identifier.
+            overrides (dict | None): Per-link overrides of the default thresholds.
+
+        Returns:
+            bool: True if request allowed, False if blocked.
+        """
+        return await self._arun_script(
+            BUCKETED_WINDOW_LUA,
+            self._bucket_keys(ip, short_url),
+            self._bucket_args(self.thresholds_for(overrides)),
+            ip,
+            short_url,
+        )
+
+    def _prefilter_allows(
+        self, ip: str, short_url: str, thresholds: dict | None = None
+    ) -> bool:
+        """Take a token from the click's local link and IP buckets.
+
+        Args:
+            ip (str): The IP address.
+            short_url (str): The short URL identifier.
+            thresholds (dict | None): Limits to apply. Defaults to the defaults.
+
+        Returns:
+            bool: False if the click should be shed without asking Redis.
+        """
+        fraction = settings.BURST_PREFILTER_FRACTION
+        if not fraction or not settings.BURST_PREFILTER_SIZE:
+            return True
+        thresholds = thresholds or self.default_thresholds
+        limit = thresholds["short_term_limit"]
+        capacity = limit * fraction
+        refill_rate = limit / thresholds["short_term_window"]
+        # Both buckets are charged, as Redis counts the click under both keys
+        url_allowed = self._prefilter.consume(("url", short_url), capacity, refill_rate)
+        ip_allowed = self._prefilter.consume(("ip", ip), capacity, refill_rate)
+        allowed = url_allowed and ip_allowed
+        PreFilterStats.record(shed=not allowed)
+        return allowed
+
+    def check_burst(
+        self, ip: str, short_url: str, overrides: dict | None = None
+    ) -> bool:
         """Check and handle burst protection for a request.
 
         Args:
             ip (str): The IP address.
             short_url (str): The short URL identifier.
+            overrides (dict | None): Per-link overrides of the default thresholds,
+                usually ``ResolvedUrl.burst_thresholds``.
+
+        Returns:
+            bool: True if request allowed, False if blocked.
+        """
+        if not self._prefilter_allows(ip, short_url, self.thresholds_for(overrides)):
+            return False
+        return self._check_engine(ip, short_url, overrides)
+
+    def _check_engine(
+        self, ip: str, short_url: str, overrides: dict | None = None
+    ) -> bool:
+        """Check and record a click with the configured engine alone.
+
+        Callers run the local pre-filter first, as ``check_burst`` does.
+
+        Args:
+            ip (str): The IP address.
+            short_url (str): The short URL identifier.
+            overrides (dict | None): Per-link overrides of the default thresholds.
 
         Returns:
             bool: True if request allowed, False if blocked.
         """
+        if settings.BURST_PROTECTION_ENGINE == "atomic":
+            return self.check_burst_atomic(ip, short_url, overrides)
+        if settings.BURST_PROTECTION_ENGINE == "bucket":
+            return self.check_burst_buckets(ip, short_url, overrides)
+
         from redis.lock import Lock
 
+        thresholds = self.thresholds_for(overrides)
         lock_key = f"burst_protection:lock:{short_url}:{ip}"
         lock = Lock(self.redis_client, lock_key, timeout=3, blocking_timeout=1)
         try:
@@ -120,12 +622,119 @@ class BurstProtectionService:
             if not acquired:
                 return False
             try:
-                if self._detect_burst(ip, short_url):
-                    self._flag_url(short_url, ip)
+                if self._detect_burst(ip, short_url, thresholds):
+                    self.flag(short_url, ip)
                     return False
-                self._track_click(short_url, ip)
+                self._track_click(short_url, ip, thresholds)
                 return True
             finally:
                 lock.release()
         except Exception as e:
             return False
+
+    async def _adetect_burst(
+        self, redis_client, ip: str, short_url: str, thresholds: dict | None = None
+    ) -> bool:
+        """Async variant of ``_detect_burst`` sending every window in one pipeline.
+
+        Args:
+            redis_client: The async Redis client.
+            ip (str): The IP address.
+            short_url (str): The short URL identifier.
+            thresholds (dict | None): Limits to apply. Defaults to the defaults.
+
+        Returns:
+            bool: True if burst detected, False otherwise.
+        """
+        timestamp = timezone.now().timestamp()
+        url_key = f"burst_protection:url:{short_url}"
+        ip_key = f"burst_protection:ip:{ip}"
+        windows = [
+            ("short_term_window", "short_term_limit"),
+            ("medium_term_window", "medium_term_limit"),
+            ("long_term_window", "long_term_limit"),
+        ]
+
+        thresholds = thresholds or self.default_thresholds
+        pipe = redis_client.pipeline()
+        limits = []
+        for window_key, limit_key in windows:
+            start_time = timestamp - thresholds[window_key]
+            pipe.zcount(ip_key, start_time, timestamp)
+            pipe.zcount(url_key, start_time, timestamp)
+            limit = thresholds[limit_key]
+            limits.extend([limit, limit])
+        counts = await pipe.execute()
+        return any(count >= limit for count, limit in zip(counts, limits))
+
+    async def _atrack_click(
+        self, redis_client, short_url: str, ip: str, thresholds: dict | None = None
+    ) -> None:
+        """Async variant of ``_track_click``.
+
+        Args:
+            redis_client: The async Redis client.
+            short_url (str): The short URL identifier.
+            ip (str): The IP address.
+            thresholds (dict | None): Limits to apply. Defaults to the defaults.
+        """
+        timestamp = timezone.now().timestamp()
+        url_key = f"burst_protection:url:{short_url}"
+        ip_key = f"burst_protection:ip:{ip}"
+        thresholds = thresholds or self.default_thresholds
+        cutoff_time = timestamp - thresholds["long_term_window"]
+
+        pipe = redis_client.pipeline()
+        pipe.zadd(url_key, {str(timestamp): timestamp})
+        pipe.zadd(ip_key, {str(timestamp): timestamp})
+        pipe.zremrangebyscore(url_key, "-inf", cutoff_time)
+        pipe.zremrangebyscore(ip_key, "-inf", cutoff_time)
+        await pipe.execute()
+
+    async def acheck_burst(
+        self, ip: str, short_url: str, overrides: dict | None = None
+    ) -> bool:
+        """Async variant of ``check_burst`` built on ``redis.asyncio``.
+
+        Args:
+            ip (str): The IP address.
+            short_url (str): The short URL identifier.
+            overrides (dict | None): Per-link overrides of the default thresholds,
+                usually ``ResolvedUrl.burst_thresholds``.
+
+        Returns:
+            bool: True if request allowed, False if blocked.
+        """
+        if not self._prefilter_allows(ip, short_url, self.thresholds_for(overrides)):
+            return False
+        return await self._acheck_engine(ip, short_url, overrides)
+
+    async def _acheck_engine(
+        self, ip: str, short_url: str, overrides: dict | None = None
+    ) -> bool:
+        """Async variant of ``_check_engine``."""
+        if settings.BURST_PROTECTION_ENGINE == "atomic":
+            return await self.acheck_burst_atomic(ip, short_url, overrides)
+        if settings.BURST_PROTECTION_ENGINE == "bucket":
+            return await self.acheck_burst_buckets(ip, short_url, overrides)
+
+        from redis.asyncio.lock import Lock
+
+        thresholds = self.thresholds_for(overrides)
+        redis_client = get_async_redis_client()
+        lock_key = f"burst_protection:lock:{short_url}:{ip}"
+        lock = Lock(redis_client, lock_key, timeout=3, blocking_timeout=1)
+        try:
+            acquired = await lock.acquire(blocking=True)
+            if not acquired:
+                return False
+            try:
+                if await self._adetect_burst(redis_client, ip, short_url, thresholds):
+                    await self.aflag(short_url, ip)
+                    return False
+                await self._atrack_click(redis_client, short_url, ip, thresholds)
+                return True
+            finally:
+                await lock.release()
+        except Exception as e:
+            return False
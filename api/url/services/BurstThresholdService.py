@@ -0,0 +1,262 @@
+import logging
+
+from api.url.models import BurstThreshold, Url
+from config.redis_utils import get_redis_client
+from config.utils.lru import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Short codes invalidated per Redis call when an owner's role changes
+INVALIDATE_BATCH_SIZE = 1000
+
+
+class BurstThresholdService:
+    """Resolves and edits per-URL and per-role burst protection overrides.
+
+    A link's effective overrides are computed when its ``ResolvedUrl`` is
+    built and cached with it, so a burst check reads them together with
+    the redirect target and never queries them on its own.
+
+    Every change to a role's overrides bumps that role's version in Redis.
+    Role overrides are few and kept in process until a version moves, and
+    cached links carry the version of their owner's role, so an entry built
+    from older overrides is rebuilt instead of served.
+    """
+
+    ROLE_VERSIONS_KEY = "burst_thresholds:role_versions"
+
+    # The TTL only bounds how long a copy survives while Redis is unreachable
+    _roles = LRUCache(maxsize=1, ttl=60)
+
+    @staticmethod
+    def parse_role_versions(data: dict | None) -> dict[str, int]:
+        return {role: int(version) for role, version in (data or {}).items()}
+
+    @classmethod
+    def role_versions(cls) -> dict[str, int]:
+        """Get the current override version of every role that changed.
+
+        Returns:
+            dict[str, int]: Versions keyed by role, empty if Redis fails.
+        """
+        try:
+            data = get_redis_client().hgetall(cls.ROLE_VERSIONS_KEY)
+        except Exception as e:
+            logger.error(f"error happened while reading role versions: {str(e)}")
+            return {}
+        return cls.parse_role_versions(data)
+
+    @classmethod
+    def role_overrides(cls, versions: dict[str, int] | None = None) -> dict[str, dict]:
+        """Get the overrides of every role that has some.
+
+        Args:
+            versions (dict[str, int] | None): Role versions already read from
+                Redis. Read here when left out.
+
+        Returns:
+            dict[str, dict]: Overridden fields keyed by role.
+        """
+        if versions is None:
+            versions = cls.role_versions()
+        cached = cls._roles.get("roles")
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+        overrides = {
+            threshold.role: threshold.overrides()
+            for threshold in BurstThreshold.objects.filter(role__isnull=False)
+        }
+        cls._roles.set("roles", (versions, overrides))
+        return overrides
+
+    @classmethod
+    def effective_overrides(
+        cls, url_instance: Url, versions: dict[str, int] | None = None
+    ) -> dict | None:
+        """Merge a URL's own overrides over those of its owner's role.
+
+        Expects ``user`` and ``burst_threshold`` to be selected with the URL.
+
+        Args:
+            url_instance (Url): The URL instance.
+            versions (dict[str, int] | None): Role versions already read from
+                Redis. Read here when left out.
+
+        Returns:
+            dict | None: The overridden fields, or None if the defaults apply.
+        """
+        overrides = {}
+        if url_instance.user_id:
+            role_overrides = cls.role_overrides(versions)
+            overrides.update(role_overrides.get(url_instance.user.role, {}))
+        try:
+            overrides.update(url_instance.burst_threshold.overrides())
+        except BurstThreshold.DoesNotExist:
+            pass
+        return overrides or None
+
+    @staticmethod
+    def defaults() -> dict:
+        from api.url.services.BurstProtectionService import BurstProtectionService
+
+        return dict(BurstProtectionService.DEFAULT_THRESHOLDS)
+
+    @classmethod
+    def list_thresholds(cls) -> dict:
+        """List the defaults and every role and URL override.
+
+        Returns:
+            dict: Defaults, role overrides and URL overrides.
+        """
+        url_overrides = BurstThreshold.objects.filter(url__isnull=False).values(
+            "url_id", "url__short_url", *BurstThreshold.FIELDS
+        )
+        return {
+            "defaults": cls.defaults(),
+            "roles": [
+                {"role": role, **overrides}
+                for role, overrides in sorted(cls.role_overrides().items())
+            ],
+            "urls": [
+                {
+                    "url_id": row.pop("url_id"),
+                    "short_url": row.pop("url__short_url"),
+                    **row,
+                }
+                for row in url_overrides
+            ],
+        }
+
+    @classmethod
+    def get_url_thresholds(cls, url_id: int) -> dict:
+        """Describe the overrides and effective limits of a URL.
+
+        Args:
+            url_id (int): The URL ID.
+
+        Returns:
+            dict: The URL's own overrides and the limits its clicks get.
+
+        Raises:
+            Url.DoesNotExist: If the URL does not exist.
+        """
+        url_instance = Url.objects.select_related("user", "burst_threshold").get(
+            id=url_id
+        )
+        try:
+            own = url_instance.burst_threshold.overrides()
+        except BurstThreshold.DoesNotExist:
+            own = {}
+        return {
+            "url_id": url_instance.id,
+            "short_url": url_instance.short_url,
+            "overrides": own,
+            "effective": {
+                **cls.defaults(),
+                **(cls.effective_overrides(url_instance) or {}),
+            },
+        }
+
+    @classmethod
+    def set_url_thresholds(cls, url_id: int, values: dict) -> dict:
+        """Replace a URL's overrides; fields left out inherit again.
+
+        Args:
+            url_id (int): The URL ID.
+            values (dict): Overridden fields.
+
+        Returns:
+            dict: The URL's thresholds, as returned by ``get_url_thresholds``.
+
+        Raises:
+            Url.DoesNotExist: If the URL does not exist.
+        """
+        url_instance = Url.objects.get(id=url_id)
+        BurstThreshold.objects.update_or_create(
+            url=url_instance,
+            defaults={field: values.get(field) for field in BurstThreshold.FIELDS},
+        )
+        cls._invalidate(url_instance.short_url)
+        return cls.get_url_thresholds(url_id)
+
+    @classmethod
+    def delete_url_thresholds(cls, url_id: int) -> bool:
+        """Remove a URL's overrides.
+
+        Args:
+            url_id (int): The URL ID.
+
+        Returns:
+            bool: Whether the URL had overrides.
+
+        Raises:
+            Url.DoesNotExist: If the URL does not exist.
+        """
+        url_instance = Url.objects.get(id=url_id)
+        deleted, _ = BurstThreshold.objects.filter(url=url_instance).delete()
+        cls._invalidate(url_instance.short_url)
+        return bool(deleted)
+
+    @classmethod
+    def set_role_thresholds(cls, role: str, values: dict) -> dict:
+        """Replace the overrides shared by links of users with a role.
+
+        Args:
+            role (str): A ``User.Role`` value.
+            values (dict): Overridden fields.
+
+        Returns:
+            dict: The role and its overrides.
+        """
+        threshold, _ = BurstThreshold.objects.update_or_create(
+            role=role,
+            defaults={field: values.get(field) for field in BurstThreshold.FIELDS},
+        )
+        cls._bump_role_version(role)
+        return {"role": role, **threshold.overrides()}
+
+    @classmethod
+    def delete_role_thresholds(cls, role: str) -> bool:
+        """Remove the overrides of a role.
+
+        Args:
+            role (str): A ``User.Role`` value.
+
+        Returns:
+            bool: Whether the role had overrides.
+        """
+        deleted, _ = BurstThreshold.objects.filter(role=role).delete()
+        cls._bump_role_version(role)
+        return bool(deleted)
+
+    @staticmethod
+    def _invalidate(*short_urls: str) -> None:
+        from api.url.services.UrlCacheService import UrlCacheService
+
+        UrlCacheService().invalidate(*short_urls)
+
+    @classmethod
+    def invalidate_user_links(cls, user_id) -> None:
+        """Drop the cached links of a user, e.g. after their role changed.
+
+        Args:
+            user_id: The owner's user ID.
+        """
+        short_urls = Url.objects.filter(user_id=user_id).values_list(
+            "short_url", flat=True
+        )
+        batch = []
+        for short_url in short_urls.iterator(chunk_size=INVALIDATE_BATCH_SIZE):
+            batch.append(short_url)
+            if len(batch) == INVALIDATE_BATCH_SIZE:
+                cls._invalidate(*batch)
+                batch = []
+        cls._invalidate(*batch)
+
+    @classmethod
+    def _bump_role_version(cls, role: str) -> None:
+        cls._roles.clear()
+        try:
+            get_redis_client().hincrby(cls.ROLE_VERSIONS_KEY, role, 1)
+        except Exception as e:
+            logger.error(f"error happened while bumping role version: {str(e)}")
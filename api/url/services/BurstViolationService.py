@@ -0,0 +1,149 @@
+import logging
+
+from django.conf import settings
+from django.utils import timezone
+from redis.exceptions import NoScriptError
+
+from api.admin_panel.fraud.FraudService import FraudService
+from api.url.models import Url, UrlStatus
+from api.url.services.UrlCacheService import UrlCacheService
+from config.redis_utils import get_async_redis_client, get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# KEYS: violations hash of the url, pending urls set, cached url hash
+# ARGV: short url, ip, now iso, flagged state
+# Counts the violation, queues the url once and flips the cached state,
+# without creating the cached hash if the url is not cached.
+RECORD_VIOLATION_LUA = """
+redis.call('HINCRBY', KEYS[1], 'hits', 1)
+redis.call('HSETNX', KEYS[1], 'ip', ARGV[2])
+redis.call('HSETNX', KEYS[1], 'first_seen', ARGV[3])
+redis.call('HSET', KEYS[1], 'last_ip', ARGV[2], 'last_seen', ARGV[3])
+redis.call('SADD', KEYS[2], ARGV[1])
+if redis.call('EXISTS', KEYS[3]) == 1 then
+    redis.call('HSET', KEYS[3], 'state', ARGV[4])
+end
+return 1
+"""
+
+
+class BurstViolationService:
+    """Queues burst violations in Redis and applies them to the database in bulk.
+
+    The redirect path only counts the violation in a per-URL hash and marks
+    the cached URL as flagged, in one Redis call. A periodic worker drains
+    the queue: each URL gets at most one status transition and its hits are
+    added to one aggregated fraud incident, however many clicks were blocked.
+    """
+
+    PENDING_KEY = "burst_violations:pending"
+    KEY_PREFIX = "burst_violations"
+
+    _script = None
+
+    def __init__(self) -> None:
+        """Initialize the BurstViolationService with Redis client."""
+        self.redis_client = get_redis_client()
+
+    @classmethod
+    def _key(cls, short_url: str) -> str:
+        return f"{cls.KEY_PREFIX}:{short_url}"
+
+    def _get_script(self):
+        if BurstViolationService._script is None:
+            BurstViolationService._script = self.redis_client.register_script(
+                RECORD_VIOLATION_LUA
+            )
+        return BurstViolationService._script
+
+    def _script_params(self, short_url: str, ip: str) -> tuple[list, list]:
+        keys = [
+            self._key(short_url),
+            self.PENDING_KEY,
+            UrlCacheService._key(short_url),
+        ]
+        args = [short_url, ip, timezone.now().isoformat(), UrlStatus.State.FLAGGED]
+        return keys, args
+
+    def record(self, short_url: str, ip: str) -> None:
+        """Queue a burst violation.
+
+        Args:
+            short_url (str): The short URL that received too many clicks.
+            ip (str): The IP address of the blocked click.
+        """
+        keys, args = self._script_params(short_url, ip)
+        self._get_script()(keys=keys, args=args)
+        UrlCacheService.set_local_state(short_url, UrlStatus.State.FLAGGED)
+
+    async def arecord(self, short_url: str, ip: str) -> None:
+        """Async variant of ``record`` built on ``redis.asyncio``.
+
+        Args:
+            short_url (str): The short URL that received too many clicks.
+            ip (str): The IP address of the blocked click.
+        """
+        keys, args = self._script_params(short_url, ip)
+        redis_client = get_async_redis_client()
+        try:
+            await redis_client.evalsha(self._get_script().sha, len(keys), *keys, *args)
+        except NoScriptError:
+            await redis_client.eval(RECORD_VIOLATION_LUA, len(keys), *keys, *args)
+        UrlCacheService.set_local_state(short_url, UrlStatus.State.FLAGGED)
+
+    def _drain(self, batch_size: int) -> dict[str, dict]:
+        short_urls = self.redis_client.spop(self.PENDING_KEY, batch_size)
+        if not short_urls:
+            return {}
+        # Read and delete together, so hits counted meanwhile are never lost:
+        # they land in a new hash and queue the url again
+        pipe = self.redis_client.pipeline()
+        for short_url in short_urls:
+            pipe.hgetall(self._key(short_url))
+            pipe.delete(self._key(short_url))
+        results = pipe.execute()
+        violations = {}
+        for short_url, data in zip(short_urls, results[::2]):
+            if data:
+                violations[short_url] = {**data, "hits": int(data["hits"])}
+        return violations
+
+    def process(self, batch_size: int | None = None) -> dict:
+        """Apply queued violations: flag each URL once and aggregate incidents.
+
+        Args:
+            batch_size (int, optional): Maximum URLs to handle. Defaults to
+                ``BURST_VIOLATION_BATCH_SIZE``.
+
+        Returns:
+            dict: Number of URLs handled, newly flagged, and violations applied.
+        """
+        violations = self._drain(batch_size or settings.BURST_VIOLATION_BATCH_SIZE)
+        if not violations:
+            return {"urls": 0, "flagged": 0, "hits": 0}
+
+        url_instances = Url.objects.select_related("url_status").filter(
+            short_url__in=violations
+        )
+        flagged = []
+        for url_instance in url_instances:
+            url_status = getattr(url_instance, "url_status", None)
+            if url_status is not None and url_status.state != UrlStatus.State.FLAGGED:
+                url_status.state = UrlStatus.State.FLAGGED
+                url_status.reason = "Too many requests on the url"
+                url_status.save(update_fields=["state", "reason"])
+                flagged.append(url_instance.short_url)
+            FraudService.record_burst_violations(
+                url_instance,
+                violations[url_instance.short_url],
+                window=settings.BURST_INCIDENT_WINDOW,
+            )
+
+        # Entries cached after the violation was queued still hold the old state
+        UrlCacheService().invalidate(*flagged)
+        return {
+            "urls": len(violations),
+            "flagged": len(flagged),
+            "hits": sum(v["hits"] for v in violations.values()),
+        }
@@ -0,0 +1,190 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db.models import Exists, OuterRef, QuerySet
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+
+from api.url.models import Url
+from api.url.redirection.models import RedirectionRule
+
+# Request headers the redirection rule conditions read; country and time of
+# day cannot be expressed with Vary, which is why ruled links stay private
+RULE_VARY_HEADERS = "User-Agent, Accept-Language, Referer"
+
+
+@dataclass(frozen=True, slots=True)
+class RedirectCachePolicy:
+    """Status code and caching headers of a redirect response."""
+
+    status: int
+    cache_control: str | None
+    vary: str | None
+    max_age: int
+    invalidation: str
+
+    def to_dict(self) -> dict:
+        return {
+            "status": self.status,
+            "cache_control": self.cache_control,
+            "vary": self.vary,
+            "max_age": self.max_age,
+            "invalidation": self.invalidation,
+        }
+
+
+class RedirectCachePolicyService:
+    """Derives the HTTP caching policy of a link's redirect.
+
+    Links keep today's uncached redirects unless their owner opts in with
+    ``allow_cached_redirects``, accepting that clicks answered by browser or
+    CDN caches are missing from analytics. Opted-in links are still capped by
+    what stays correct: expiring links never outlive their expiry, and links
+    with redirection rules are neither permanent nor shared-cacheable.
+    """
+
+    @staticmethod
+    def policy_for(
+        redirect_type: int,
+        cache_max_age: int,
+        allow_cached_redirects: bool,
+        expiry_date: datetime | None,
+        has_rules: bool,
+    ) -> RedirectCachePolicy:
+        """Compute the effective redirect policy of a link.
+
+        Args:
+            redirect_type (int): The configured status code (301, 302 or 307).
+            cache_max_age (int): The configured cache lifetime in seconds.
+            allow_cached_redirects (bool): Whether the owner accepted caching.
+            expiry_date (datetime | None): When the link expires, if ever.
+            has_rules (bool): Whether the link has active redirection rules.
+
+        Returns:
+            RedirectCachePolicy: The status code and headers to send.
+        """
+        if not allow_cached_redirects:
+            status = (
+                Url.RedirectType.FOUND
+                if redirect_type == Url.RedirectType.PERMANENT
+                else redirect_type
+            )
+            return RedirectCachePolicy(
+                status=status,
+                cache_control=None,
+                vary=None,
+                max_age=0,
+                invalidation=(
+                    "Redirects are not cached: every visit reaches the server, "
+                    "changes apply immediately and every visit is counted."
+                ),
+            )
+
+        max_age = cache_max_age
+        status = redirect_type
+        if expiry_date is not None:
+            seconds_left = int((expiry_date - timezone.now()).total_seconds())
+            max_age = max(0, min(max_age, seconds_left))
+        if status == Url.RedirectType.PERMANENT and (expiry_date or has_rules):
+            # A permanent redirect would outlive the expiry or pin one rule's target
+            status = Url.RedirectType.FOUND
+
+        if status == Url.RedirectType.PERMANENT and not max_age:
+            return RedirectCachePolicy(
+                status=status,
+                cache_control=None,
+                vary=None,
+                max_age=0,
+                invalidation=(
+                    "Browsers may cache this permanent redirect indefinitely: "
+                    "edits, deactivation or deletion will not reach visitors who "
+                    "already followed it, and their repeat visits are not counted."
+                ),
+            )
+
+        if not max_age:
+            return RedirectCachePolicy(
+                status=status,
+                cache_control="no-cache",
+                vary=None,
+                max_age=0,
+                invalidation=(
+                    "No cache lifetime is set, so every visit reaches the server "
+                    "and changes apply immediately."
+                ),
+            )
+
+        scope = "private" if has_rules else "public"
+        caches = "browsers" if has_rules else "browsers and CDNs"
+        return RedirectCachePolicy(
+            status=status,
+            cache_control=f"{scope}, max-age={max_age}",
+            vary=RULE_VARY_HEADERS if has_rules else None,
+            max_age=max_age,
+            invalidation=(
+                f"Changes apply to new visitors immediately, but {caches} may "
+                f"reuse a cached redirect for up to {max_age} seconds after a "
+                "change; visits served from those caches are not counted."
+            ),
+        )
+
+    @staticmethod
+    def apply(response, policy: RedirectCachePolicy):
+        """Set the policy's status code and headers on a redirect response.
+
+        Args:
+            response (HttpResponseRedirectBase): The redirect response.
+            policy (RedirectCachePolicy): The policy to apply.
+
+        Returns:
+            HttpResponseRedirectBase: The same response.
+        """
+        response.status_code = policy.status
+        if policy.cache_control:
+            response["Cache-Control"] = policy.cache_control
+        if policy.vary:
+            patch_vary_headers(response, policy.vary.split(", "))
+        return response
+
+    @staticmethod
+    def with_rule_flags(queryset: QuerySet) -> QuerySet:
+        """Annotate whether each link has active redirection rules.
+
+        Lets ``describe`` serialize a list of links without a rules query
+        per link.
+
+        Args:
+            queryset (QuerySet): A queryset of URL instances.
+
+        Returns:
+            QuerySet: The queryset annotated with ``has_rules``.
+        """
+        active_rules = RedirectionRule.objects.filter(
+            url_id=OuterRef("pk"), is_active=True
+        )
+        return queryset.annotate(has_rules=Exists(active_rules))
+
+    @staticmethod
+    def describe(url_instance: Url) -> dict:
+        """Describe a stored link's effective policy for API responses.
+
+        Args:
+            url_instance (Url): The URL instance, ideally annotated by
+                ``with_rule_flags``.
+
+        Returns:
+            dict: The effective status, headers and invalidation semantics.
+        """
+        has_rules = getattr(url_instance, "has_rules", None)
+        if has_rules is None:
+            has_rules = (
+                url_instance.allow_cached_redirects
+                and url_instance.redirection_rules.filter(is_active=True).exists()
+            )
+        return RedirectCachePolicyService.policy_for(
+            redirect_type=url_instance.redirect_type,
+            cache_max_age=url_instance.cache_max_age,
+            allow_cached_redirects=url_instance.allow_cached_redirects,
+            expiry_date=url_instance.expiry_date,
+            has_rules=has_rules,
+        ).to_dict()
@@ -0,0 +1,204 @@
+import json
+import logging
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils import timezone
+from redis.exceptions import NoScriptError
+
+from api.analytics.fingerprint import get_fingerprint
+from api.analytics.service import AnalyticsService
+from api.url.services.BurstProtectionService import (
+    SLIDING_WINDOW_CHECK_LUA,
+    BurstProtectionService,
+)
+from config.redis_utils import get_async_redis_client, get_redis_client
+from config.settings_utils import get_analytics_track_ip
+
+logger = logging.getLogger(__name__)
+
+# KEYS: visits counter, unique ips set, unique visits counter, last accessed
+# ARGV: hashed ip or "", last accessed iso
+# Returns 1 for a returning visitor and 2 for a new one.
+# Indexes are read from key_base and arg_base, so the same body can follow
+# the burst check's keys and arguments.
+COUNTERS_LUA = """
+redis.call('INCR', KEYS[key_base + 1])
+local new_visitor = 0
+local hashed_ip = ARGV[arg_base + 1]
+if hashed_ip ~= '' and redis.call('SADD', KEYS[key_base + 2], hashed_ip) == 1 then
+    new_visitor = 1
+    redis.call('INCR', KEYS[key_base + 3])
+end
+redis.call('SET', KEYS[key_base + 4], ARGV[arg_base + 2])
+return 1 + new_visitor
+"""
+
+REDIRECT_COUNTERS_LUA = "local key_base, arg_base = 0, 0\n" + COUNTERS_LUA
+
+# KEYS: url burst zset, ip burst zset, then the counters' keys
+# ARGV: the sliding window arguments, then the counters' arguments
+# Returns 0 if blocked, otherwise what the counters return.
+# The burst check is the atomic engine's own script.
+REDIRECT_SIDE_EFFECTS_LUA = (
+    SLIDING_WINDOW_CHECK_LUA + "local key_base, arg_base = 2, 8\n" + COUNTERS_LUA
+)
+
+
+class RedirectPipelineService:
+    """Runs burst protection and visit counting in as few Redis calls as it can.
+
+    Clicks first go through the burst service's local pre-filter, so a flood
+    is shed without reaching Redis. With the ``atomic`` engine the burst
+    check and the counters then run as one Lua script, registered once per
+    process and invoked with EVALSHA. Other engines check the click on their
+    own and the counters follow in a second script. The decision only needs
+    the hashed IP; geolocation and user agent parsing for the buffered visit
+    run after it, for allowed clicks only. Redis errors let the click through
+    unrecorded, as the burst engines do.
+    """
+
+    _scripts = {}
+
+    def __init__(self, protection_service: BurstProtectionService = None) -> None:
+        """Initialize the pipeline with Redis client and burst settings.
+
+        Args:
+            protection_service (BurstProtectionService, optional): Service providing
+                thresholds and URL flagging. Defaults to a new instance.
+        """
+        self.redis_client = get_redis_client()
+        self.protection_service = protection_service or BurstProtectionService()
+
+    def _get_script(self, source: str):
+        script = RedirectPipelineService._scripts.get(source)
+        if script is None:
+            script = self.redis_client.register_script(source)
+            RedirectPipelineService._scripts[source] = script
+        return script
+
+    def process_click(self, request, ip: str, url_instance) -> bool:
+        """Check burst limits and, if allowed, record the visit.
+
+        Args:
+            request: The HTTP request object.
+            ip (str): The client IP address.
+            url_instance: The URL (or resolved URL) being visited.
+
+        Returns:
+            bool: True if the click is allowed, False if blocked.
+        """
+        short_url = url_instance.short_url
+        overrides = getattr(url_instance, "burst_thresholds", None)
+        thresholds = self.protection_service.thresholds_for(overrides)
+        if not self.protection_service._prefilter_allows(ip, short_url, thresholds):
+            return False
+        atomic = settings.BURST_PROTECTION_ENGINE == "atomic"
+        if not atomic and not self.protection_service._check_engine(
+            ip, short_url, overrides
+        ):
+            return False
+
+        source, keys, args = self._script_params(
+            ip, url_instance, thresholds, self._hashed_ip(request), atomic
+        )
+        try:
+            result = self._get_script(source)(keys=keys, args=args)
+        except Exception as e:
+            # Like the burst engines, let the click through unrecorded
+            logger.error(f"error happened while processing a click: {str(e)}")
+            return True
+        if not result:
+            self.protection_service._flag_blocked(short_url, ip)
+            return False
+
+        visit = AnalyticsService.build_visit(request, url_instance)
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            self._queue_visit(pipe, visit, result == 2)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"error happened while buffering a visit: {str(e)}")
+        return True
+
+    async def aprocess_click(self, request, ip: str, url_instance) -> bool:
+        """Async variant of ``process_click`` built on ``redis.asyncio``.
+
+        Args:
+            request: The HTTP request object.
+            ip (str): The client IP address.
+            url_instance: The URL (or resolved URL) being visited.
+
+        Returns:
+            bool: True if the click is allowed, False if blocked.
+        """
+        short_url = url_instance.short_url
+        overrides = getattr(url_instance, "burst_thresholds", None)
+        thresholds = self.protection_service.thresholds_for(overrides)
+        if not self.protection_service._prefilter_allows(ip, short_url, thresholds):
+            return False
+        atomic = settings.BURST_PROTECTION_ENGINE == "atomic"
+        if not atomic and not await self.protection_service._acheck_engine(
+            ip, short_url, overrides
+        ):
+            return False
+
+        hashed_ip = await sync_to_async(self._hashed_ip)(request)
+        source, keys, args = self._script_params(
+            ip, url_instance, thresholds, hashed_ip, atomic
+        )
+        redis_client = get_async_redis_client()
+        try:
+            try:
+                result = await redis_client.evalsha(
+                    self._get_script(source).sha, len(keys), *keys, *args
+                )
+            except NoScriptError:
+                result = await redis_client.eval(source, len(keys), *keys, *args)
+        except Exception as e:
+            logger.error(f"error happened while processing a click: {str(e)}")
+            return True
+        if not result:
+            await self.protection_service._aflag_blocked(short_url, ip)
+            return False
+
+        visit = await sync_to_async(AnalyticsService.build_visit)(
+            request, url_instance
+        )
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            self._queue_visit(pipe, visit, result == 2)
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"error happened while buffering a visit: {str(e)}")
+        return True
+
+    @staticmethod
+    def _hashed_ip(request) -> str:
+        if not get_analytics_track_ip():
+            return ""
+        return get_fingerprint(request).hashed_ip
+
+    @staticmethod
+    def _queue_visit(pipe, visit: dict, new_visitor: bool) -> None:
+        visit_data = dict(visit["visit"], new_visitor=new_visitor)
+        if visit["fraud"]:
+            pipe.rpush("analytics:fraud", json.dumps(visit["fraud"]))
+        pipe.rpush("analytics:visits", json.dumps(visit_data))
+
+    def _script_params(
+        self, ip: str, url_instance, thresholds: dict, hashed_ip: str, atomic: bool
+    ) -> tuple[str, list, list]:
+        url_id = url_instance.id
+        keys = [
+            f"url:{url_id}:visits",
+            f"url:{url_id}:unique_ips",
+            f"url:{url_id}:unique_visits",
+            f"url:{url_id}:last_accessed",
+        ]
+        args = [hashed_ip, timezone.now().isoformat()]
+        if not atomic:
+            return REDIRECT_COUNTERS_LUA, keys, args
+        burst_keys = self.protection_service._burst_keys(ip, url_instance.short_url)
+        burst_args = self.protection_service._sliding_window_args(thresholds)
+        return REDIRECT_SIDE_EFFECTS_LUA, burst_keys + keys, burst_args + args
@@ -1,16 +1,85 @@
+import atexit
+import hashlib
+import logging
+import os
 import string
 import random
+import threading
+from collections import deque
+
+from django.conf import settings
+from django.db import connections
+
+from api.url.models import Url
 from config.redis_utils import get_redis_client
 from config.settings_utils import get_short_code_pool_size, get_short_code_length
+from config.utils.feistel import FeistelPermutation
+from config.utils.lazy import ConfigAttribute, ProcessLocal
+
+logger = logging.getLogger(__name__)
+
+
+class CounterBlock:
+    """Codes of the counter block reserved by this process, handed out in order."""
+
+    def __init__(self) -> None:
+        self.codes = deque()
+        self.code_length = None
+        self.lock = threading.Lock()
+
+
+class LeasedCodes:
+    """Pool codes leased by this process, topped up in the background.
+
+    Codes still held when the process exits are returned to the pool.
+    """
+
+    def __init__(self) -> None:
+        self.codes = deque()
+        self.lock = threading.Lock()
+        self.refill_thread = None
+        self._pid = os.getpid()
+        atexit.register(self.release)
+
+    def release(self) -> None:
+        """Return the unused codes to the shared pool."""
+        # A forked child inherits the parent's exit handlers and a copy of
+        # its codes, which the parent may still hand out
+        if os.getpid() != self._pid:
+            return
+        with self.lock:
+            codes = list(self.codes)
+            self.codes.clear()
+        if not codes:
+            return
+        try:
+            get_redis_client().sadd(ShortCodeService.POOL_KEY, *codes)
+        except Exception as e:
+            logger.error(f"error happened while releasing short codes: {str(e)}")
 
 
 class ShortCodeService:
-    """Service for generating and managing short codes using Redis pool."""
+    """Service for generating and managing short codes.
+
+    ``SHORT_CODE_ALLOCATOR`` selects where codes come from: "pool" pops random
+    codes from a Redis set refilled in the background, "counter" numbers
+    codes with a Redis counter and maps each number through a keyed
+    permutation, so codes never repeat and need no refills. With
+    ``SHORT_CODE_LEASE_SIZE`` set, pool codes are leased in blocks per
+    process and served from memory.
+    """
 
     CHARS = string.ascii_letters + string.digits
     POOL_KEY = "shortcode:available_pool"
-    MIN_POOL_SIZE = get_short_code_pool_size()
-    CODE_LENGTH = get_short_code_length()
+    COUNTER_KEY = "shortcode:counter"
+    MIN_POOL_SIZE = ConfigAttribute(get_short_code_pool_size)
+    CODE_LENGTH = ConfigAttribute(get_short_code_length)
+
+    LEASE_LOW_WATER = 0.25
+
+    _counter_block = ProcessLocal(CounterBlock)
+    _leased = ProcessLocal(LeasedCodes)
+    _permutations = {}
 
     def __init__(self) -> None:
         """Initialize the ShortCodeService with Redis client."""
@@ -25,11 +94,16 @@ class ShortCodeService:
         return "".join(random.choices(self.CHARS, k=self.CODE_LENGTH))
 
     def get_code(self) -> str:
-        """Retrieve a short code from the pool or generate new one.
+        """Retrieve a short code from the configured allocator.
 
         Returns:
             str: A unique short code.
         """
+        if settings.SHORT_CODE_ALLOCATOR == "counter":
+            return self.get_counter_code()
+        if settings.SHORT_CODE_LEASE_SIZE > 0:
+            return self.get_leased_codes(1)[0]
+
         code = self.redis_client.spop(self.POOL_KEY)
         current_size = self.redis_client.scard(self.POOL_KEY)
         if current_size == 0:
@@ -39,6 +113,86 @@ class ShortCodeService:
             self.refill_pool()
         return code
 
+    def get_codes(self, count: int) -> list[str]:
+        """Retrieve several short codes at once from the configured allocator.
+
+        Args:
+            count (int): Number of codes needed.
+
+        Returns:
+            list[str]: ``count`` unique short codes.
+        """
+        if count <= 0:
+            return []
+        if settings.SHORT_CODE_ALLOCATOR == "counter":
+            return self.get_counter_codes(count)
+        if settings.SHORT_CODE_LEASE_SIZE > 0:
+            return self.get_leased_codes(count)
+
+        codes = self.redis_client.spop(self.POOL_KEY, count) or []
+        self._check_pool()
+        codes.extend(self.generate_code() for _ in range(count - len(codes)))
+        return codes
+
+    def _check_pool(self) -> None:
+        if self.redis_client.scard(self.POOL_KEY) < self.MIN_POOL_SIZE * 0.3:
+            self.refill_pool()
+
+    def get_leased_codes(self, count: int) -> list[str]:
+        """Take codes from this process's lease of the pool.
+
+        The lease is topped up in a background thread once it falls below
+        ``LEASE_LOW_WATER`` of ``SHORT_CODE_LEASE_SIZE``, which also refills
+        the shared pool, so the request path only pops from Redis when a
+        batch outgrows what is held.
+
+        Args:
+            count (int): Number of codes needed.
+
+        Returns:
+            list[str]: ``count`` unique short codes.
+        """
+        leased = self._leased
+        lease_size = settings.SHORT_CODE_LEASE_SIZE
+        with leased.lock:
+            if len(leased.codes) < count:
+                leased.codes.extend(
+                    self.redis_client.spop(
+                        self.POOL_KEY, max(lease_size, count - len(leased.codes))
+                    )
+                    or []
+                )
+            codes = [
+                leased.codes.popleft() for _ in range(min(count, len(leased.codes)))
+            ]
+            running_low = len(leased.codes) < lease_size * self.LEASE_LOW_WATER
+        # The shared pool ran dry
+        codes.extend(self.generate_code() for _ in range(count - len(codes)))
+        if running_low:
+            self._top_up_lease(leased, lease_size)
+        return codes
+
+    def _top_up_lease(self, leased: LeasedCodes, lease_size: int) -> None:
+        with leased.lock:
+            if leased.refill_thread is not None and leased.refill_thread.is_alive():
+                return
+            leased.refill_thread = threading.Thread(
+                target=self._refill_lease, args=(leased, lease_size), daemon=True
+            )
+            leased.refill_thread.start()
+
+    def _refill_lease(self, leased: LeasedCodes, lease_size: int) -> None:
+        try:
+            codes = self.redis_client.spop(self.POOL_KEY, lease_size) or []
+            with leased.lock:
+                leased.codes.extend(codes)
+            self._check_pool()
+        except Exception as e:
+            logger.error(f"error happened while leasing short codes: {str(e)}")
+        finally:
+            # Pool refills may read the configuration on this thread
+            connections.close_all()
+
     def refill_pool(self, target_size: int = None) -> int:
         """Refill the short code pool to the target size.
 
@@ -66,3 +220,106 @@ class ShortCodeService:
             self.redis_client.sadd(self.POOL_KEY, *batch)
             generated += len(batch)
         return generated
+
+    @classmethod
+    def permutation(cls, code_length: int) -> FeistelPermutation:
+        """Get the permutation of code numbers for a code length.
+
+        Args:
+            code_length (int): Number of characters per code.
+
+        Returns:
+            FeistelPermutation: Bijection of ``[0, 62 ** code_length)``.
+        """
+        permutation = cls._permutations.get(code_length)
+        if permutation is None:
+            secret = settings.SHORT_CODE_PERMUTATION_KEY or settings.SECRET_KEY
+            key = hashlib.blake2b(
+                secret.encode(), digest_size=32, person=b"shortcode"
+            ).digest()
+            permutation = FeistelPermutation(len(cls.CHARS) ** code_length, key)
+            cls._permutations[code_length] = permutation
+        return permutation
+
+    @classmethod
+    def encode_id(cls, code_id: int, code_length: int) -> str:
+        """Turn a counter value into its short code.
+
+        Args:
+            code_id (int): A counter value below ``62 ** code_length``.
+            code_length (int): Number of characters per code.
+
+        Returns:
+            str: The code, distinct for every counter value.
+        """
+        value = cls.permutation(code_length).permute(code_id)
+        base = len(cls.CHARS)
+        chars = []
+        for _ in range(code_length):
+            value, digit = divmod(value, base)
+            chars.append(cls.CHARS[digit])
+        return "".join(reversed(chars))
+
+    def reserve_counter_block(self, code_length: int) -> list[str]:
+        """Reserve the next block of counter values and encode them.
+
+        Codes already taken by custom aliases or pool codes are dropped, with
+        one query per block.
+
+        Args:
+            code_length (int): Number of characters per code.
+
+        Returns:
+            list[str]: Unused codes of the block.
+
+        Raises:
+            RuntimeError: If every code of this length has been issued.
+        """
+        block_size = settings.SHORT_CODE_COUNTER_BLOCK
+        while True:
+            end = self.redis_client.incrby(
+                f"{self.COUNTER_KEY}:{code_length}", block_size
+            )
+            start = end - block_size
+            domain_size = len(self.CHARS) ** code_length
+            if start >= domain_size:
+                raise RuntimeError(f"all {code_length} character codes are issued")
+            codes = [
+                self.encode_id(code_id, code_length)
+                for code_id in range(start, min(end, domain_size))
+            ]
+            taken = set(
+                Url.objects.filter(short_url__in=codes).values_list(
+                    "short_url", flat=True
+                )
+            )
+            codes = [code for code in codes if code not in taken]
+            if codes:
+                return codes
+
+    def get_counter_code(self) -> str:
+        """Take the next code of this process's counter block.
+
+        Returns:
+            str: A code no other process or earlier call was given.
+        """
+        return self.get_counter_codes(1)[0]
+
+    def get_counter_codes(self, count: int) -> list[str]:
+        """Take the next codes of this process's counter block.
+
+        Args:
+            count (int): Number of codes needed.
+
+        Returns:
+            list[str]: Codes no other process or earlier call was given.
+        """
+        block = self._counter_block
+        code_length = self.CODE_LENGTH
+        with block.lock:
+            if block.code_length != code_length:
+                block.codes.clear()
+                block.code_length = code_length
+            while len(block.codes) < count:
+                block.codes.extend(self.reserve_counter_block(code_length))
+            return [block.codes.popleft() for _ in range(count)]
@@ -0,0 +1,271 @@
+import hashlib
+import logging
+import math
+
+from django.conf import settings
+from django.utils import timezone
+from redis.exceptions import NoScriptError
+
+from api.url.models import Url
+from config.redis_utils import get_async_redis_client, get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# KEYS: bitmap. ARGV: bit offsets of one code.
+# A missing bitmap means the filter was never built, so everything may exist.
+BLOOM_CHECK_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 1
+end
+for i = 1, #ARGV do
+    if redis.call('GETBIT', KEYS[1], ARGV[i]) == 0 then
+        return 0
+    end
+end
+return 1
+"""
+
+# KEYS: live bitmap, live meta, building bitmap, building meta
+# ARGV: number of codes, then their bit offsets.
+# Codes are only added to filters that exist, so an unbuilt filter stays
+# empty (and therefore open) instead of rejecting everything it never saw.
+BLOOM_ADD_LUA = """
+for k = 1, 3, 2 do
+    if redis.call('EXISTS', KEYS[k]) == 1 then
+        for i = 2, #ARGV do
+            redis.call('SETBIT', KEYS[k], ARGV[i], 1)
+        end
+        redis.call('HINCRBY', KEYS[k + 1], 'items', ARGV[1])
+    end
+end
+return 1
+"""
+
+
+class UrlBloomFilterService:
+    """Redis bitmap Bloom filter of every existing short code.
+
+    Lets the redirect path reject unknown codes with one EVALSHA instead of a
+    Redis hash miss and a failed database lookup. A negative answer is exact;
+    a positive one may be false at roughly the configured error rate.
+
+    Bloom filters cannot forget members, so deletions are only counted as
+    stale entries and cleared by the periodic ``rebuild``. Until the filter
+    has been built every code is reported as possibly present.
+    """
+
+    KEY_PREFIX = "url_bloom"
+
+    _check_script = None
+    _add_script = None
+
+    def __init__(self) -> None:
+        """Initialize the UrlBloomFilterService with Redis client and sizing."""
+        self.redis_client = get_redis_client()
+        self.capacity = settings.URL_BLOOM_CAPACITY
+        self.error_rate = settings.URL_BLOOM_ERROR_RATE
+        self.size = self.optimal_size(self.capacity, self.error_rate)
+        self.hash_count = self.optimal_hash_count(self.size, self.capacity)
+        # Sizing is part of the key, so changing the settings can never make
+        # lookups read a bitmap built with different offsets
+        base = f"{self.KEY_PREFIX}:{self.size}:{self.hash_count}"
+        self.bits_key = f"{base}:bits"
+        self.meta_key = f"{base}:meta"
+        self.building_bits_key = f"{base}:building:bits"
+        self.building_meta_key = f"{base}:building:meta"
+
+    @staticmethod
+    def optimal_size(capacity: int, error_rate: float) -> int:
+        """Number of bits needed to hold ``capacity`` codes at ``error_rate``."""
+        return math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+
+    @staticmethod
+    def optimal_hash_count(size: int, capacity: int) -> int:
+        """Number of hash functions minimising false positives for the size."""
+        return max(1, round(size / capacity * math.log(2)))
+
+    def offsets(self, short_url: str) -> list[int]:
+        """Bit offsets for a code, using double hashing over one digest.
+
+        Args:
+            short_url (str): The short URL identifier.
+
+        Returns:
+            list[int]: ``hash_count`` offsets into the bitmap.
+        """
+        digest = hashlib.blake2b(short_url.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def _get_check_script(self):
+        if UrlBloomFilterService._check_script is None:
+            UrlBloomFilterService._check_script = self.redis_client.register_script(
+                BLOOM_CHECK_LUA
+            )
+        return UrlBloomFilterService._check_script
+
+    def _get_add_script(self):
+        if UrlBloomFilterService._add_script is None:
+            UrlBloomFilterService._add_script = self.redis_client.register_script(
+                BLOOM_ADD_LUA
+            )
+        return UrlBloomFilterService._add_script
+
+    def might_contain(self, short_url: str) -> bool:
+        """Check whether a short code may exist.
+
+        Args:
+            short_url (str): The short URL identifier.
+
+        Returns:
+            bool: False only if the code definitely does not exist.
+        """
+        if not settings.URL_BLOOM_FILTER_ENABLED:
+            return True
+        try:
+            return bool(
+                self._get_check_script()(
+                    keys=[self.bits_key], args=self.offsets(short_url)
+                )
+            )
+        except Exception as e:
+            logger.error(f"error happened while checking url bloom filter: {str(e)}")
+            return True
+
+    async def amight_contain(self, short_url: str) -> bool:
+        """Async variant of ``might_contain`` built on ``redis.asyncio``.
+
+        Args:
+            short_url (str): The short URL identifier.
+
+        Returns:
+            bool: False only if the code definitely does not exist.
+        """
+        if not settings.URL_BLOOM_FILTER_ENABLED:
+            return True
+        offsets = self.offsets(short_url)
+        redis_client = get_async_redis_client()
+        try:
+            try:
+                found = await redis_client.evalsha(
+                    self._get_check_script().sha, 1, self.bits_key, *offsets
+                )
+            except NoScriptError:
+                found = await redis_client.eval(
+                    BLOOM_CHECK_LUA, 1, self.bits_key, *offsets
+                )
+            return bool(found)
+        except Exception as e:
+            logger.error(f"error happened while checking url bloom filter: {str(e)}")
+            return True
+
+    def add(self, *short_urls: str) -> None:
+        """Record newly created short codes.
+
+        Args:
+            *short_urls (str): Short URL identifiers to add.
+        """
+        short_urls = [short_url for short_url in short_urls if short_url]
+        if not short_urls:
+            return
+        offsets = [o for short_url in short_urls for o in self.offsets(short_url)]
+        try:
+            self._get_add_script()(
+                keys=[
+                    self.bits_key,
+                    self.meta_key,
+                    self.building_bits_key,
+                    self.building_meta_key,
+                ],
+                args=[len(short_urls), *offsets],
+            )
+        except Exception as e:
+            logger.error(f"error happened while adding to url bloom filter: {str(e)}")
+
+    def remove(self, *short_urls: str) -> None:
+        """Record deleted short codes as stale until the next rebuild.
+
+        Args:
+            *short_urls (str): Short URL identifiers that were deleted.
+        """
+        short_urls = [short_url for short_url in short_urls if short_url]
+        if not short_urls:
+            return
+        try:
+            if self.redis_client.exists(self.bits_key):
+                self.redis_client.hincrby(self.meta_key, "stale_items", len(short_urls))
+        except Exception as e:
+            logger.error(f"error happened while updating url bloom filter: {str(e)}")
+
+    def rebuild(self, batch_size: int = 5000) -> int:
+        """Rebuild the filter from the database and swap it in atomically.
+
+        Codes created while the rebuild runs are added to the building
+        bitmap by ``add``, so none are lost when it replaces the live one.
+
+        Args:
+            batch_size (int, optional): Codes written per pipeline. Defaults to 5000.
+
+        Returns:
+            int: Number of codes loaded.
+        """
+        self.redis_client.delete(self.building_bits_key, self.building_meta_key)
+        # Allocate the whole bitmap up front so ``add`` sees it as existing
+        self.redis_client.setbit(self.building_bits_key, self.size - 1, 0)
+
+        loaded = 0
+        pipe = self.redis_client.pipeline(transaction=False)
+        for short_url in Url.objects.values_list("short_url", flat=True).iterator(
+            chunk_size=batch_size
+        ):
+            for offset in self.offsets(short_url):
+                pipe.setbit(self.building_bits_key, offset, 1)
+            loaded += 1
+            if loaded % batch_size == 0:
+                pipe.execute()
+        pipe.execute()
+
+        pipe = self.redis_client.pipeline()
+        pipe.hincrby(self.building_meta_key, "items", loaded)
+        pipe.hset(
+            self.building_meta_key,
+            mapping={"stale_items": 0, "built_at": timezone.now().isoformat()},
+        )
+        pipe.rename(self.building_bits_key, self.bits_key)
+        pipe.rename(self.building_meta_key, self.meta_key)
+        pipe.execute()
+        return loaded
+
+    def stats(self) -> dict:
+        """Report sizing, fill and the estimated false-positive rate.
+
+        Returns:
+            dict: Filter statistics for the admin panel.
+        """
+        pipe = self.redis_client.pipeline()
+        pipe.exists(self.bits_key)
+        pipe.bitcount(self.bits_key)
+        pipe.memory_usage(self.bits_key)
+        pipe.hgetall(self.meta_key)
+        built, bits_set, memory_bytes, meta = pipe.execute()
+
+        items = int(meta.get("items", 0))
+        fill_ratio = bits_set / self.size
+        return {
+            "enabled": settings.URL_BLOOM_FILTER_ENABLED,
+            "built": bool(built),
+            "built_at": meta.get("built_at"),
+            "capacity": self.capacity,
+            "target_error_rate": self.error_rate,
+            "size_bits": self.size,
+            "hash_count": self.hash_count,
+            "items": items,
+            "stale_items": int(meta.get("stale_items", 0)),
+            "bits_set": bits_set,
+            "fill_ratio": round(fill_ratio, 6),
+            # Measured from the bitmap itself, so it stays honest when the
+            # filter holds more codes than it was sized for
+            "estimated_false_positive_rate": fill_ratio**self.hash_count,
+            "memory_bytes": memory_bytes or 0,
+        }
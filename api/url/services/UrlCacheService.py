@@ -0,0 +1,354 @@
+import json
+import logging
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils import timezone
+
+from api.url.models import Url, UrlStatus
+from api.url.redirection.RuleSetCacheService import RuleSetCacheService
+from api.url.services.BurstThresholdService import BurstThresholdService
+from api.url.services.RedirectCachePolicyService import (
+    RedirectCachePolicy,
+    RedirectCachePolicyService,
+)
+from api.url.services.UrlBloomFilterService import UrlBloomFilterService
+from config.redis_utils import get_async_redis_client, get_redis_client
+from config.settings_utils import get_url_mapping_cache_timeout
+from config.utils.lru import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedUrl:
+    """Minimal view of a Url needed to serve a redirect."""
+
+    id: int
+    short_url: str
+    long_url: str
+    state: str
+    expiry_date: datetime | None
+    has_rules: bool
+    rules_version: int = 0
+    redirect_type: int = Url.RedirectType.FOUND
+    cache_max_age: int = 0
+    allow_cached_redirects: bool = False
+    # Overrides of the burst protection defaults, None when the defaults apply
+    burst_thresholds: dict | None = None
+    # Owner's role and its override version when the overrides were merged
+    owner_role: str = ""
+    role_version: int = 0
+
+    @property
+    def is_expired(self) -> bool:
+        return self.state == UrlStatus.State.EXPIRED
+
+    def is_stale(self, role_versions: dict[str, int]) -> bool:
+        """Whether the owner's role overrides changed since this was built."""
+        if not self.owner_role:
+            return False
+        return role_versions.get(self.owner_role, 0) != self.role_version
+
+    @property
+    def cache_policy(self) -> RedirectCachePolicy:
+        return RedirectCachePolicyService.policy_for(
+            redirect_type=self.redirect_type,
+            cache_max_age=self.cache_max_age,
+            allow_cached_redirects=self.allow_cached_redirects,
+            expiry_date=self.expiry_date,
+            has_rules=self.has_rules,
+        )
+
+    def to_hash(self) -> dict:
+        return {
+            "id": self.id,
+            "long_url": self.long_url,
+            "state": self.state,
+            "expiry_date": self.expiry_date.isoformat() if self.expiry_date else "",
+            "has_rules": int(self.has_rules),
+            "rules_version": self.rules_version,
+            "redirect_type": self.redirect_type,
+            "cache_max_age": self.cache_max_age,
+            "allow_cached_redirects": int(self.allow_cached_redirects),
+            "burst_thresholds": (
+                json.dumps(self.burst_thresholds) if self.burst_thresholds else ""
+            ),
+            "owner_role": self.owner_role,
+            "role_version": self.role_version,
+        }
+
+    @classmethod
+    def from_hash(cls, short_url: str, data: dict) -> "ResolvedUrl":
+        return cls(
+            id=int(data["id"]),
+            short_url=short_url,
+            long_url=data["long_url"],
+            state=data["state"],
+            expiry_date=(
+                datetime.fromisoformat(data["expiry_date"])
+                if data.get("expiry_date")
+                else None
+            ),
+            has_rules=data.get("has_rules") == "1",
+            rules_version=int(data.get("rules_version") or 0),
+            redirect_type=int(data.get("redirect_type") or Url.RedirectType.FOUND),
+            cache_max_age=int(data.get("cache_max_age") or 0),
+            allow_cached_redirects=data.get("allow_cached_redirects") == "1",
+            burst_thresholds=(
+                json.loads(data["burst_thresholds"])
+                if data.get("burst_thresholds")
+                else None
+            ),
+            owner_role=data.get("owner_role", ""),
+            role_version=int(data.get("role_version") or 0),
+        )
+
+
+class UrlCacheService:
+    """Two-tier cache resolving short codes to redirect targets.
+
+    Lookups hit a bounded per-process LRU first, then a shared Redis hash, and
+    only fall back to Postgres on a miss in both. Codes the Bloom filter has
+    never seen are rejected before either of the shared tiers. Writers must
+    call ``invalidate`` after changing anything stored in ``ResolvedUrl``.
+    """
+
+    KEY_PREFIX = "url_cache"
+
+    _local = LRUCache(
+        maxsize=settings.URL_CACHE_LOCAL_SIZE, ttl=settings.URL_CACHE_LOCAL_TTL
+    )
+
+    def __init__(self) -> None:
+        """Initialize the UrlCacheService with Redis client and Bloom filter."""
+        self.redis_client = get_redis_client()
+        self.bloom_filter = UrlBloomFilterService()
+
+    @classmethod
+    def _key(cls, short_url: str) -> str:
+        return f"{cls.KEY_PREFIX}:{short_url}"
+
+    def resolve(self, short_url: str) -> ResolvedUrl | None:
+        """Resolve a short code through the local, Redis and database tiers.
+
+        Args:
+            short_url (str): The short URL identifier.
+
+        Returns:
+            ResolvedUrl | None: The resolved URL, or None if it does not exist.
+        """
+        resolved = self._local.get(short_url)
+        if resolved is not None:
+            return resolved
+        if not self.bloom_filter.might_contain(short_url):
+            return None
+
+        resolved = self._get_shared(short_url)
+        if resolved is None:
+            resolved = self._load_and_share(short_url)
+            if resolved is None:
+                return None
+
+        self._local.set(short_url, resolved)
+        return resolved
+
+    async def aresolve(self, short_url: str) -> ResolvedUrl | None:
+        """Async variant of ``resolve`` reading the shared tier via ``redis.asyncio``.
+
+        Args:
+            short_url (str): The short URL identifier.
+
+        Returns:
+            ResolvedUrl | None: The resolved URL, or None if it does not exist.
+        """
+        resolved = self._local.get(short_url)
+        if resolved is not None:
+            return resolved
+        if not await self.bloom_filter.amight_contain(short_url):
+            return None
+
+        try:
+            pipe = get_async_redis_client().pipeline(transaction=False)
+            pipe.hgetall(self._key(short_url))
+            pipe.hgetall(BurstThresholdService.ROLE_VERSIONS_KEY)
+            data, role_versions = await pipe.execute()
+        except Exception as e:
+            logger.error(f"error happened while reading url cache: {str(e)}")
+            data = None
+        resolved = self._from_shared(short_url, data, role_versions) if data else None
+        if resolved is None:
+            resolved = await sync_to_async(self._load_and_share)(short_url)
+            if resolved is None:
+                return None
+
+        self._local.set(short_url, resolved)
+        return resolved
+
+    def invalidate(self, *short_urls: str) -> None:
+        """Drop cached entries for the given short codes from both tiers.
+
+        Args:
+            *short_urls (str): Short URL identifiers to invalidate.
+        """
+        short_urls = [short_url for short_url in short_urls if short_url]
+        if not short_urls:
+            return
+        for short_url in short_urls:
+            self._local.delete(short_url)
+        try:
+            self.redis_client.delete(*[self._key(s) for s in short_urls])
+        except Exception as e:
+            logger.error(f"error happened while invalidating url cache: {str(e)}")
+
+    @classmethod
+    def set_local_state(cls, short_url: str, state: str) -> None:
+        """Change the state of this process's cached entry without dropping it.
+
+        Args:
+            short_url (str): The short URL identifier.
+            state (str): The new ``UrlStatus.State``.
+        """
+        resolved = cls._local.get(short_url)
+        if resolved is not None and resolved.state != state:
+            cls._local.set(short_url, replace(resolved, state=state))
+
+    def _get_shared(self, short_url: str) -> ResolvedUrl | None:
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.hgetall(self._key(short_url))
+            pipe.hgetall(BurstThresholdService.ROLE_VERSIONS_KEY)
+            data, role_versions = pipe.execute()
+        except Exception as e:
+            logger.error(f"error happened while reading url cache: {str(e)}")
+            return None
+        if not data:
+            return None
+        return self._from_shared(short_url, data, role_versions)
+
+    @staticmethod
+    def _from_shared(
+        short_url: str, data: dict, role_versions: dict
+    ) -> ResolvedUrl | None:
+        # Entries merged from older role overrides count as misses, which
+        # also catches a worker writing one back after an invalidation
+        resolved = ResolvedUrl.from_hash(short_url, data)
+        if resolved.is_stale(BurstThresholdService.parse_role_versions(role_versions)):
+            return None
+        return resolved
+
+    def _load_and_share(self, short_url: str) -> ResolvedUrl | None:
+        resolved = self._load(short_url)
+        if resolved is not None:
+            self._set_shared(resolved)
+        return resolved
+
+    def warm(self, limit: int, days: int) -> dict:
+        """Preload the shared tier with the most visited recently used URLs.
+
+        Meant for after a deploy or a Redis flush, when every hot link would
+        otherwise miss at once. Resolved URLs are loaded in one query and
+        written in one pipeline; links with rules also get their rule set
+        cached. Per-process tiers of the web workers fill from Redis as usual.
+
+        Args:
+            limit (int): Maximum number of URLs to warm.
+            days (int): Only consider URLs visited within this many days.
+
+        Returns:
+            dict: Number of URLs and rule sets warmed and the duration in ms.
+        """
+        start = time.perf_counter()
+        since = timezone.now() - timedelta(days=days)
+        url_instances = (
+            self._queryset()
+            .filter(last_accessed__gte=since, url_status__isnull=False)
+            .order_by("-visits")[:limit]
+        )
+        role_versions = BurstThresholdService.role_versions()
+        resolved_urls = [
+            self._build(url_instance, role_versions) for url_instance in url_instances
+        ]
+
+        pipe = self.redis_client.pipeline(transaction=False)
+        for resolved in resolved_urls:
+            key = self._key(resolved.short_url)
+            pipe.hset(key, mapping=resolved.to_hash())
+            pipe.expire(key, self._shared_timeout(resolved))
+        pipe.execute()
+
+        rule_set_cache = RuleSetCacheService()
+        rule_sets = 0
+        for resolved in resolved_urls:
+            if resolved.has_rules:
+                rule_set_cache.get_rule_set(resolved.id, resolved.rules_version)
+                rule_sets += 1
+
+        return {
+            "warmed": len(resolved_urls),
+            "rule_sets": rule_sets,
+            "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+        }
+
+    @staticmethod
+    def _shared_timeout(resolved: ResolvedUrl) -> int:
+        timeout = int(get_url_mapping_cache_timeout())
+        if resolved.expiry_date:
+            seconds_left = int((resolved.expiry_date - timezone.now()).total_seconds())
+            timeout = max(1, min(timeout, seconds_left))
+        return timeout
+
+    def _set_shared(self, resolved: ResolvedUrl) -> None:
+        key = self._key(resolved.short_url)
+        try:
+            pipe = self.redis_client.pipeline()
+            pipe.hset(key, mapping=resolved.to_hash())
+            pipe.expire(key, self._shared_timeout(resolved))
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"error happened while writing url cache: {str(e)}")
+
+    @staticmethod
+    def _queryset():
+        return RedirectCachePolicyService.with_rule_flags(
+            Url.objects.select_related("url_status", "burst_threshold", "user")
+        )
+
+    def _load(self, short_url: str) -> ResolvedUrl | None:
+        try:
+            return self._build(self._queryset().get(short_url=short_url))
+        except (Url.DoesNotExist, UrlStatus.DoesNotExist):
+            return None
+
+    @staticmethod
+    def _build(
+        url_instance: Url, role_versions: dict[str, int] | None = None
+    ) -> ResolvedUrl:
+        if role_versions is None:
+            role_versions = BurstThresholdService.role_versions()
+        owner_role = url_instance.user.role if url_instance.user_id else ""
+        rules_version = (
+            RuleSetCacheService().get_version(url_instance.id)
+            if url_instance.has_rules
+            else 0
+        )
+        return ResolvedUrl(
+            id=url_instance.id,
+            short_url=url_instance.short_url,
+            long_url=url_instance.long_url,
+            state=url_instance.url_status.state,
+            expiry_date=url_instance.expiry_date,
+            has_rules=url_instance.has_rules,
+            rules_version=rules_version,
+            redirect_type=url_instance.redirect_type,
+            cache_max_age=url_instance.cache_max_age,
+            allow_cached_redirects=url_instance.allow_cached_redirects,
+            burst_thresholds=BurstThresholdService.effective_overrides(
+                url_instance, role_versions
+            ),
+            owner_role=owner_role,
+            role_version=role_versions.get(owner_role, 0),
+        )
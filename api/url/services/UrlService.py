@@ -1,5 +1,8 @@
 from api.url.models import Url, UrlStatus
+from api.url.services.RedirectCachePolicyService import RedirectCachePolicyService
 from api.url.services.ShortCodeService import ShortCodeService
+from api.url.services.UrlBloomFilterService import UrlBloomFilterService
+from api.url.services.UrlCacheService import UrlCacheService
 from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
 from django.contrib.auth import get_user_model
 from django.utils import timezone
@@ -9,6 +12,14 @@ User = get_user_model()
 
 
 class UrlService:
+    CACHE_POLICY_FIELDS = ("redirect_type", "cache_max_age", "allow_cached_redirects")
+
+    @staticmethod
+    def _cache_policy_fields(data: dict) -> dict:
+        return {
+            field: data[field] for field in UrlService.CACHE_POLICY_FIELDS if field in data
+        }
+
     @staticmethod
     def create_url(validated_data: dict) -> object:
         """Create a new URL instance with short code generation and status.
@@ -42,10 +53,12 @@ class UrlService:
             short_url=short_url,
             expiry_date=expiry_date,
             is_custom_alias=is_custom_alias,
+            **UrlService._cache_policy_fields(validated_data),
         )
         url.save()
         url_status = UrlStatus.objects.create(url=url)
         url_status.save()
+        UrlBloomFilterService().add(url.short_url)
         url_instance = Url.objects.select_related("url_status").get(id=url.id)
         return url_instance
 
@@ -62,11 +75,14 @@ class UrlService:
         """
         urls = []
         user_instance = User.objects.get(pk=user_id)
+        codes = iter(
+            ShortCodeService().get_codes(
+                sum(1 for url in validated_data if url["short_url"] is None)
+            )
+        )
         for url in validated_data:
             short_url = (
-                url["short_url"]
-                if url["short_url"] is not None
-                else ShortCodeService().get_code()
+                url["short_url"] if url["short_url"] is not None else next(codes)
             )
 
             is_custom_alias = (
@@ -80,12 +96,16 @@ class UrlService:
                     short_url=short_url,
                     expiry_date=expiry_date,
                     is_custom_alias=is_custom_alias,
+                    **UrlService._cache_policy_fields(url),
                 )
                 url_instance.save()
                 UrlStatus.objects.create(url=url_instance).save()
                 urls.append(url_instance)
             except Exception as e:
                 urls.append(str(e))
+        UrlBloomFilterService().add(
+            *[item.short_url for item in urls if isinstance(item, Url)]
+        )
         url_instances = list(
             Url.objects.filter(id__in=[item.id for item in urls]).select_related(
                 "url_status", "user"
@@ -99,16 +119,17 @@ class UrlService:
 
         Args:
             instance (Url): The URL instance to update.
-            validated_data (dict): Validated data containing fields to update (long_url, expiry_date).
+            validated_data (dict): Validated data containing fields to update (long_url, expiry_date and the redirect cache policy).
 
         Returns:
             Url: The updated URL instance.
         """
-        for field in ["long_url", "expiry_date"]:
+        for field in ["long_url", "expiry_date", *UrlService.CACHE_POLICY_FIELDS]:
             if field in validated_data:
                 setattr(instance, field, validated_data[field])
         instance.updated_at = timezone.now()
         instance.save()
+        UrlCacheService().invalidate(instance.short_url)
         return instance
 
     @staticmethod
@@ -133,8 +154,8 @@ class UrlService:
         Returns:
             Page: Paginated page object containing Url instances.
         """
-        queryset = Url.objects.select_related("url_status", "user").filter(
-            user__id=user_id
+        queryset = RedirectCachePolicyService.with_rule_flags(
+            Url.objects.select_related("url_status", "user").filter(user__id=user_id)
         )
         if query:
             queryset = queryset.filter(
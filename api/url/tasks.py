@@ -4,8 +4,12 @@ from typing import Dict, Any
 
 from api.analytics.models import Visit
 from api.admin_panel.fraud.models import FraudIncident
+from api.admin_panel.fraud.ThrottleViolationService import ThrottleViolationService
 from config.redis_utils import get_redis_client
+from api.url.services.BurstViolationService import BurstViolationService
 from api.url.services.ShortCodeService import ShortCodeService
+from api.url.services.UrlBloomFilterService import UrlBloomFilterService
+from api.url.services.UrlCacheService import UrlCacheService
 from config.celery import app
 from datetime import datetime
 from django.utils import timezone
@@ -54,7 +58,56 @@ def deactivate_expired_urls_task() -> None:
 
 @app.task()
 def maintain_shortcode_pool() -> None:
-    ShortCodeService().refill_pool()
+    # Counter allocated codes need no pool
+    if settings.SHORT_CODE_ALLOCATOR == "pool":
+        ShortCodeService().refill_pool()
+
+
+@app.task()
+def rebuild_url_bloom_filter() -> dict:
+    loaded = UrlBloomFilterService().rebuild()
+    return {
+        "status": "success",
+        "loaded": loaded,
+        "timestamp": timezone.now().isoformat(),
+    }
+
+
+@app.task()
+def warm_url_cache(limit: int | None = None, days: int | None = None) -> dict:
+    result = UrlCacheService().warm(
+        limit=limit or settings.URL_CACHE_WARM_SIZE,
+        days=days or settings.URL_CACHE_WARM_DAYS,
+    )
+    logger.info(
+        f"warmed {result['warmed']} urls and {result['rule_sets']} rule sets "
+        f"in {result['duration_ms']}ms"
+    )
+    return {
+        "status": "success",
+        **result,
+        "timestamp": timezone.now().isoformat(),
+    }
+
+
+@app.task()
+def process_burst_violations() -> dict:
+    result = BurstViolationService().process()
+    return {
+        "status": "success",
+        **result,
+        "timestamp": timezone.now().isoformat(),
+    }
+
+
+@app.task()
+def process_throttle_violations() -> dict:
+    result = ThrottleViolationService().process()
+    return {
+        "status": "success",
+        **result,
+        "timestamp": timezone.now().isoformat(),
+    }
 
 
 @app.task()
@@ -1,10 +1,11 @@
+from django.conf import settings
 from django.urls import path, include
 
+from api.url.fast_redirect import aredirect_view, redirect_view
 from api.url.views import (
     BatchShorten,
     GenerateQrcode,
     ListUrlsView,
-    Redirect,
     Shortener,
     SpecificUrl,
 )
@@ -12,7 +13,10 @@ from api.url.views import (
 urlpatterns = [
     path("shorten/", Shortener.as_view()),
     path("batch-shorten/", BatchShorten.as_view()),
-    path("redirect/<str:short_url>/", Redirect.as_view()),
+    path(
+        "redirect/<str:short_url>/",
+        aredirect_view if settings.REDIRECT_ASYNC else redirect_view,
+    ),
     path("qr/<str:short_url>/", GenerateQrcode.as_view()),
     path(
         "<str:short_url>/",
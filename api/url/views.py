@@ -2,10 +2,8 @@ from django.http import HttpResponse
 from rest_framework.views import Response, status
 from rest_framework.generics import GenericAPIView
 from config.utils.responses import SuccessResponse, ErrorResponse
-from api.analytics.utils import get_ip_address
 from api.throttling import IPRateThrottle, UserRateThrottle
 from api.url.models import Url, UrlStatus
-from django.shortcuts import redirect
 from api.url.serializers.UrlSerializer import (
     ResponseUrlSerializer,
     ShortenUrlSerializer,
@@ -14,14 +12,13 @@ from api.custom_auth.authentication import CookieJWTAuthentication
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.serializers import ValidationError
 from rest_framework.exceptions import PermissionDenied
-from api.url.services.BurstProtectionService import BurstProtectionService
+from api.url.services.UrlBloomFilterService import UrlBloomFilterService
+from api.url.services.UrlCacheService import UrlCacheService
 from api.url.services.UrlService import (
     UrlService,
 )
 from api.url.utils import generate_qrcode
 from .permissions import IsUrlOwner
-from api.analytics.service import AnalyticsService
-from .redirection.RedirectionService import RedirectionService
 
 # Create your views here.
 
@@ -148,6 +145,8 @@ class SpecificUrl(GenericAPIView):
                 )
             self.check_object_permissions(request, url_instance)
             url_instance.delete()
+            UrlCacheService().invalidate(short_url)
+            UrlBloomFilterService().remove(short_url)
             return SuccessResponse(
                 message="URL deleted successfully", status=status.HTTP_204_NO_CONTENT
             )
@@ -198,43 +197,6 @@ class ListUrlsView(GenericAPIView):
             )
 
 
-class Redirect(GenericAPIView):
-    def __init__(self, **kwargs):
-        self.protection_service = BurstProtectionService()
-        self.service = RedirectionService()
-        super().__init__(**kwargs)
-
-    def get(self, request, short_url):
-        analytic_service = AnalyticsService()
-        try:
-            ip = get_ip_address(request)
-            is_safe = self.protection_service.check_burst(ip, short_url)
-            if not is_safe:
-                return ErrorResponse(
-                    message="Too many requests on this URL",
-                    status=status.HTTP_429_TOO_MANY_REQUESTS,
-                )
-            url_instance = Url.objects.select_related("url_status").get(
-                short_url=short_url
-            )
-            if url_instance.url_status.state == url_instance.url_status.State.EXPIRED:
-                return ErrorResponse(
-                    message="URL is inactive or expired", status=status.HTTP_410_GONE
-                )
-
-            matched_rule = self.service.evaluate_redirection_rules(
-                request, url_instance
-            )
-            if matched_rule:
-                analytic_service.record_visit(request, url_instance)
-                return redirect(matched_rule.target_url)
-            else:
-                analytic_service.record_visit(request, url_instance)
-                return redirect(url_instance.long_url)
-        except Exception as e:
-            return ErrorResponse(message=str(e), status=status.HTTP_404_NOT_FOUND)
-
-
 class GenerateQrcode(GenericAPIView):
     throttle_classes = [IPRateThrottle, UserRateThrottle]
     authentication_classes = [CookieJWTAuthentication]
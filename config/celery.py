@@ -2,6 +2,7 @@ import os
 
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_ready
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
@@ -23,11 +24,34 @@ CELERY_BEAT_SCHEDULE = {
         "task": "api.url.tasks.process_analytics_buffer",
         "schedule": 30.0,
     },
+    "process-burst-violations": {
+        "task": "api.url.tasks.process_burst_violations",
+        "schedule": 10.0,
+    },
+    "process-throttle-violations": {
+        "task": "api.url.tasks.process_throttle_violations",
+        "schedule": 30.0,
+    },
+    "rebuild-url-bloom-filter-daily": {
+        "task": "api.url.tasks.rebuild_url_bloom_filter",
+        "schedule": crontab(hour=2, minute=0),
+    },
+    "warm-url-cache": {
+        "task": "api.url.tasks.warm_url_cache",
+        "schedule": crontab(minute="*/15"),
+    },
     "populate-link-rot-queue-weekly": {
         "task": "api.url.tasks.populate_link_rot_queue",
         "schedule": crontab(hour=1, minute=0, day_of_week=0),
     },
 }
 
+
+@worker_ready.connect
+def warm_url_cache_on_startup(sender, **kwargs):
+    # Refill the shared redirect cache after deploys and Redis restarts
+    sender.app.send_task("api.url.tasks.warm_url_cache")
+
+
 if __name__ == "__main__":
     app.start()
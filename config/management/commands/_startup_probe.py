@@ -0,0 +1,120 @@
+"""Import every project module in a fresh interpreter and report the cost.
+
+Run by the ``benchmark_startup`` command in a subprocess, so nothing is
+already imported. Prints one JSON document on the last line of stdout.
+"""
+
+import importlib
+import json
+import os
+import sys
+import time
+import traceback
+
+SKIPPED_PACKAGES = ("migrations", "tests", "management")
+
+current = "django.setup"
+touches = []
+timings = {}
+errors = {}
+
+
+def record_touch(kind: str) -> None:
+    # Keep the innermost project frame, it shows which line opened the connection
+    origin = None
+    for frame in traceback.extract_stack()[:-2]:
+        if frame.filename.startswith(os.getcwd()) and frame.filename != __file__:
+            origin = f"{os.path.relpath(frame.filename)}:{frame.lineno}"
+    touches.append({"kind": kind, "module": current, "origin": origin})
+
+
+def install_hooks() -> None:
+    import redis.connection
+    from django.db.backends.signals import connection_created
+
+    connection_class = getattr(
+        redis.connection, "AbstractConnection", redis.connection.Connection
+    )
+    connect = connection_class.connect
+
+    def tracked_connect(self, *args, **kwargs):
+        record_touch("redis")
+        return connect(self, *args, **kwargs)
+
+    connection_class.connect = tracked_connect
+    connection_created.connect(
+        lambda sender, **kwargs: record_touch("database"), weak=False
+    )
+
+
+def project_modules(app_config, app_names) -> list:
+    """List an app's modules from the filesystem, without importing any.
+
+    Modules of apps nested inside this one are left to those apps.
+    """
+    if not app_config.path.startswith(os.getcwd()):
+        return []
+    names = []
+    for directory, subdirectories, files in os.walk(app_config.path):
+        relative = os.path.relpath(directory, app_config.path)
+        parts = [] if relative == "." else relative.split(os.sep)
+        package = ".".join([app_config.name, *parts])
+        if (
+            any(part in SKIPPED_PACKAGES for part in parts)
+            or "__init__.py" not in files
+            or (package != app_config.name and package in app_names)
+        ):
+            subdirectories.clear()
+            continue
+        for file in sorted(files):
+            if file == "__init__.py":
+                names.append(package)
+            elif file.endswith(".py"):
+                names.append(f"{package}.{file[:-3]}")
+    return names
+
+
+def timed_import(name: str) -> float:
+    start = time.perf_counter()
+    try:
+        importlib.import_module(name)
+    except Exception as e:
+        errors[name] = f"{type(e).__name__}: {e}"
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    global current
+
+    sys.path.insert(0, os.getcwd())
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    os.environ.setdefault("DJANGO_CONFIGURATION", "Dev")
+    install_hooks()
+
+    start = time.perf_counter()
+    import configurations
+
+    configurations.setup()
+    timings["django.setup"] = (time.perf_counter() - start) * 1000
+
+    from django.apps import apps
+    from django.conf import settings
+
+    app_names = {app_config.name for app_config in apps.get_app_configs()}
+    for app_config in apps.get_app_configs():
+        modules = project_modules(app_config, app_names)
+        if not modules:
+            continue
+        timings[app_config.label] = 0.0
+        for name in modules:
+            current = name
+            timings[app_config.label] += timed_import(name)
+
+    current = settings.ROOT_URLCONF
+    timings["urls"] = timed_import(settings.ROOT_URLCONF)
+
+    print(json.dumps({"timings": timings, "touches": touches, "errors": errors}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+PROBE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_startup_probe.py")
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure how long importing each app takes in a fresh interpreter and "
+        "fail if any import opens a database or Redis connection"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=3,
+            help="Number of fresh interpreters to average over",
+        )
+
+    def handle(self, *args, **options):
+        runs = [self._probe() for _ in range(options["runs"])]
+
+        self.stdout.write(f"{'stage':<24} {'median':>10} {'max':>10}")
+        for stage in runs[0]["timings"]:
+            values = [run["timings"][stage] for run in runs]
+            self.stdout.write(
+                f"{stage:<24} "
+                f"{statistics.median(values):>8.1f}ms "
+                f"{max(values):>8.1f}ms"
+            )
+        total = [sum(run["timings"].values()) for run in runs]
+        self.stdout.write(f"{'total':<24} {statistics.median(total):>8.1f}ms")
+
+        for module, error in runs[0]["errors"].items():
+            self.stderr.write(f"could not import {module}: {error}")
+
+        touches = runs[0]["touches"]
+        if touches:
+            for touch in touches:
+                self.stderr.write(
+                    f"{touch['kind']} touched while importing {touch['module']}"
+                    f" ({touch['origin'] or 'outside the project'})"
+                )
+            raise CommandError(
+                f"{len(touches)} database or Redis connection(s) opened at import"
+            )
+        self.stdout.write(self.style.SUCCESS("No database or Redis access at import"))
+
+    def _probe(self) -> dict:
+        result = subprocess.run(
+            [sys.executable, PROBE],
+            cwd=settings.BASE_DIR,
+            env=os.environ.copy(),
+            capture_output=True,
+            text=True,
+        )
+        lines = result.stdout.strip().splitlines()
+        if result.returncode != 0 or not lines:
+            raise CommandError(f"startup probe failed:\n{result.stderr}")
+        return json.loads(lines[-1])
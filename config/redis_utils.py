@@ -1,10 +1,15 @@
+import asyncio
+import weakref
+from contextlib import contextmanager
 import redis
+import redis.asyncio as aioredis
 import logging
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
 _redis_client = None
+_async_redis_clients = weakref.WeakKeyDictionary()
 
 
 def get_redis_client():
@@ -35,6 +40,75 @@ def get_redis_client():
     return _redis_client
 
 
+def get_async_redis_client():
+    """Get the redis.asyncio client bound to the running event loop.
+
+    Async connections cannot be shared between event loops, so one pooled
+    client is kept per loop. ASGI servers run a single loop per worker. The
+    pool blocks instead of failing when every connection is checked out, so
+    bursts of concurrent clicks queue for a connection.
+
+    Returns:
+        redis.asyncio.Redis: Configured async Redis client instance.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_redis_clients.get(loop)
+    if client is None:
+        pool = aioredis.BlockingConnectionPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            password=settings.REDIS_PASSWORD,
+            decode_responses=True,
+            max_connections=100,
+            timeout=5,
+            retry_on_timeout=True,
+            socket_connect_timeout=5,
+            socket_timeout=5,
+            health_check_interval=30,
+        )
+        client = aioredis.Redis(connection_pool=pool)
+        _async_redis_clients[loop] = client
+        logger.info("Async Redis client initialized for event loop")
+    return client
+
+
+@contextmanager
+def scratch_redis(db: int):
+    """Point ``get_redis_client`` at a scratch database for the duration.
+
+    Benchmarks run the real services against it, so their keys and queued
+    payloads never mix with live data. The database is flushed on entry and
+    on exit. Services must be built inside the block.
+
+    Args:
+        db (int): Database number, different from ``REDIS_DB``.
+
+    Yields:
+        redis.Redis: Client of the scratch database.
+
+    Raises:
+        ValueError: If ``db`` is the live database.
+    """
+    from django.test import override_settings
+
+    global _redis_client
+    if db == settings.REDIS_DB:
+        raise ValueError(f"database {db} is REDIS_DB, pick a scratch database")
+    previous = _redis_client
+    _redis_client = None
+    try:
+        with override_settings(REDIS_DB=db):
+            client = get_redis_client()
+            client.flushdb()
+            try:
+                yield client
+            finally:
+                client.flushdb()
+    finally:
+        _redis_client = previous
+
+
 def check_redis_connection():
     """Check if Redis connection is healthy.
 
@@ -136,6 +136,106 @@ class Base(Configuration):
     REDIS_DB = env("REDIS_DB", default=0)
     REDIS_PASSWORD = env("REDIS_PASSWORD", default=None)
 
+    # Redirect resolution cache: per-worker LRU in front of a shared Redis hash
+
+    URL_CACHE_LOCAL_SIZE = env.int("URL_CACHE_LOCAL_SIZE", default=10000)
+    URL_CACHE_LOCAL_TTL = env.int("URL_CACHE_LOCAL_TTL", default=5)  # seconds
+    URL_CACHE_WARM_SIZE = env.int("URL_CACHE_WARM_SIZE", default=1000)
+    URL_CACHE_WARM_DAYS = env.int("URL_CACHE_WARM_DAYS", default=7)
+
+    # Record visit counters from a Lua script per redirect, run together with
+    # the burst check in one script when BURST_PROTECTION_ENGINE is "atomic"
+
+    REDIRECT_ATOMIC_SIDE_EFFECTS = env.bool(
+        "REDIRECT_ATOMIC_SIDE_EFFECTS", default=False
+    )
+
+    # Burst protection engine: "lock" (per link and IP lock), "atomic" (Lua script
+    # over exact click logs) or "bucket" (Lua script over fixed-size buckets)
+
+    BURST_PROTECTION_ENGINE = env("BURST_PROTECTION_ENGINE", default="lock")
+
+    # Per-worker token buckets per link and per IP shedding floods before Redis;
+    # a bucket holds this fraction of the short-term limit and refills at the
+    # limit's rate, keep it above 1 so only clicks already past the shared limit
+    # are shed. 0 disables the pre-filter
+
+    BURST_PREFILTER_FRACTION = env.float("BURST_PREFILTER_FRACTION", default=1.5)
+    BURST_PREFILTER_SIZE = env.int("BURST_PREFILTER_SIZE", default=10000)
+
+    # Queue burst violations for the process_burst_violations task instead of
+    # flagging the URL and logging an incident on the request path
+
+    BURST_FLAG_ASYNC = env.bool("BURST_FLAG_ASYNC", default=False)
+    BURST_VIOLATION_BATCH_SIZE = env.int("BURST_VIOLATION_BATCH_SIZE", default=500)
+    BURST_INCIDENT_WINDOW = env.int("BURST_INCIDENT_WINDOW", default=3600)
+
+    # API rate limiter: "sliding" (sorted set of request times) or "gcra" (one
+    # timestamp per key, checked and updated in a single Lua call)
+
+    RATE_LIMITER_ENGINE = env("RATE_LIMITER_ENGINE", default="sliding")
+
+    # Throttled requests are counted in Redis and logged by the
+    # process_throttle_violations task, one incident per client, endpoint and
+    # window of this many seconds
+
+    THROTTLE_INCIDENT_WINDOW = env.int("THROTTLE_INCIDENT_WINDOW", default=3600)
+    THROTTLE_VIOLATION_BATCH_SIZE = env.int(
+        "THROTTLE_VIOLATION_BATCH_SIZE", default=500
+    )
+
+    # Short code source: "pool" (random codes popped from a Redis set) or
+    # "counter" (Redis counter blocks mapped through a keyed permutation). The
+    # permutation key defaults to SECRET_KEY and must not change once codes
+    # are issued
+
+    SHORT_CODE_ALLOCATOR = env("SHORT_CODE_ALLOCATOR", default="pool")
+    SHORT_CODE_COUNTER_BLOCK = env.int("SHORT_CODE_COUNTER_BLOCK", default=1000)
+    SHORT_CODE_PERMUTATION_KEY = env("SHORT_CODE_PERMUTATION_KEY", default="")
+
+    # Pool codes leased per worker process at once and served from memory,
+    # 0 pops every code from Redis. Unused codes return to the pool when the
+    # process exits cleanly
+
+    SHORT_CODE_LEASE_SIZE = env.int("SHORT_CODE_LEASE_SIZE", default=0)
+
+    # Authenticated users are cached per access token in Redis for up to
+    # AUTH_PRINCIPAL_CACHE_TTL seconds and per worker for AUTH_PRINCIPAL_LOCAL_TTL;
+    # other workers see a ban or role change once their local entry expires
+
+    AUTH_PRINCIPAL_CACHE_TTL = env.int("AUTH_PRINCIPAL_CACHE_TTL", default=300)
+    AUTH_PRINCIPAL_LOCAL_TTL = env.int("AUTH_PRINCIPAL_LOCAL_TTL", default=5)
+    AUTH_PRINCIPAL_LOCAL_SIZE = env.int("AUTH_PRINCIPAL_LOCAL_SIZE", default=10000)
+
+    # System configuration is read from a per-process snapshot, refreshed when a
+    # change is published; versions are also compared this often in seconds in
+    # case a notification was missed
+
+    CONFIG_SNAPSHOT_RECHECK_INTERVAL = env.int(
+        "CONFIG_SNAPSHOT_RECHECK_INTERVAL", default=30
+    )
+
+    # Mount the async redirect view; only enable when served through config.asgi
+
+    REDIRECT_ASYNC = env.bool("REDIRECT_ASYNC", default=False)
+
+    # Bloom filter of existing short codes, used to reject unknown codes early
+
+    URL_BLOOM_FILTER_ENABLED = env.bool("URL_BLOOM_FILTER_ENABLED", default=True)
+    URL_BLOOM_CAPACITY = env.int("URL_BLOOM_CAPACITY", default=1000000)
+    URL_BLOOM_ERROR_RATE = env.float("URL_BLOOM_ERROR_RATE", default=0.001)
+
+    # Parsed user agents: per-worker LRU, optionally shared through Redis
+
+    USER_AGENT_CACHE_SIZE = env.int("USER_AGENT_CACHE_SIZE", default=5000)
+    USER_AGENT_CACHE_REDIS = env.bool("USER_AGENT_CACHE_REDIS", default=False)
+
+    # Memory-mapped IP to country table; geocoder is only used when it is missing
+
+    GEOIP_DB_PATH = env(
+        "GEOIP_DB_PATH", default=str(BASE_DIR / "data" / "ip_country.bin")
+    )
+
     CELERY_BROKER_URL = "redis://localhost:6379/0"
     CELERY_ACCEPT_CONTENT = ["json"]
     CELERY_TASK_SERIALIZER = "json"
@@ -1,11 +1,11 @@
 def get_throttle_rates():
     """Get throttle rates from config service, fallback to defaults"""
     try:
-        from api.admin_panel.system.ConfigService import ConfigService
+        from api.admin_panel.system.ConfigCacheService import ConfigCacheService
 
         return {
-            "ip": ConfigService.get_config("rate_limit_ip", "100/hour"),
-            "user": ConfigService.get_config("rate_limit_user", "1000/hour"),
+            "ip": ConfigCacheService.get("rate_limit_ip"),
+            "user": ConfigCacheService.get("rate_limit_user"),
         }
     except Exception:
         return {"ip": "100/hour", "user": "1000/hour"}
@@ -14,9 +14,9 @@ def get_throttle_rates():
 def get_jwt_access_token_minutes():
     """Get JWT access token lifetime in minutes from config service"""
     try:
-        from api.admin_panel.system.ConfigService import ConfigService
+        from api.admin_panel.system.ConfigCacheService import ConfigCacheService
 
-        return ConfigService.get_config("jwt_access_token_minutes", 5)
+        return ConfigCacheService.get("jwt_access_token_minutes")
     except Exception:
         return 5
 
@@ -24,9 +24,9 @@ def get_jwt_access_token_minutes():
 def get_short_code_length():
     """Get short code length from config service"""
     try:
-        from api.admin_panel.system.ConfigService import ConfigService
+        from api.admin_panel.system.ConfigCacheService import ConfigCacheService
 
-        return ConfigService.get_config("short_code_length", 8)
+        return ConfigCacheService.get("short_code_length")
     except Exception:
         return 8
 
@@ -34,9 +34,9 @@ def get_short_code_length():
 def get_short_code_pool_size():
     """Get short code pool size from config service"""
     try:
-        from api.admin_panel.system.ConfigService import ConfigService
+        from api.admin_panel.system.ConfigCacheService import ConfigCacheService
 
-        return ConfigService.get_config("short_code_pool_size", 10000)
+        return ConfigCacheService.get("short_code_pool_size")
     except Exception:
         return 10000
 
@@ -44,9 +44,9 @@ def get_short_code_pool_size():
 def get_analytics_track_ip():
     """Get whether to track IP addresses in analytics"""
     try:
-        from api.admin_panel.system.ConfigService import ConfigService
+        from api.admin_panel.system.ConfigCacheService import ConfigCacheService
 
-        return ConfigService.get_config("analytics_track_ip", True)
+        return ConfigCacheService.get("analytics_track_ip")
     except Exception:
         return True
 
@@ -54,9 +54,9 @@ def get_analytics_track_ip():
 def get_max_urls_per_user():
     """Get maximum URLs per user limit"""
     try:
-        from api.admin_panel.system.ConfigService import ConfigService
+        from api.admin_panel.system.ConfigCacheService import ConfigCacheService
 
-        return ConfigService.get_config("max_urls_per_user", 100)
+        return ConfigCacheService.get("max_urls_per_user")
     except Exception:
         return 100
 
@@ -64,8 +64,8 @@ def get_max_urls_per_user():
 def get_url_mapping_cache_timeout():
     """Get URL mapping cache timeout"""
     try:
-        from api.admin_panel.system.ConfigService import ConfigService
+        from api.admin_panel.system.ConfigCacheService import ConfigCacheService
 
-        return ConfigService.get_config("url_mapping_cache_timeout", 3600)
+        return ConfigCacheService.get("url_mapping_cache_timeout")
     except Exception:
         return 3600
@@ -0,0 +1,91 @@
+import hashlib
+
+
+class FeistelPermutation:
+    """Keyed bijection of the integers in ``[0, domain_size)``.
+
+    A balanced Feistel network scrambles numbers over the smallest even
+    number of bits covering the domain, and values landing outside the
+    domain are encrypted again (cycle walking) until they fall inside, which
+    keeps the mapping a permutation of the domain itself. Consecutive inputs
+    give unrelated-looking outputs, and the same key always gives the same
+    mapping.
+    """
+
+    def __init__(self, domain_size: int, key: bytes, rounds: int = 4) -> None:
+        """Initialize the permutation.
+
+        Args:
+            domain_size (int): Number of values permuted.
+            key (bytes): Secret selecting the permutation.
+            rounds (int, optional): Feistel rounds. Defaults to 4.
+        """
+        bits = max(2, (domain_size - 1).bit_length())
+        bits += bits % 2
+        self.domain_size = domain_size
+        self.half_bits = bits // 2
+        self.mask = (1 << self.half_bits) - 1
+        self._half_bytes = (self.half_bits + 7) // 8
+        digest_size = min(64, max(8, self._half_bytes))
+        # Copying a keyed hash is cheaper than keying a new one per round
+        self._round_hashes = [
+            hashlib.blake2b(
+                key=key[:64], digest_size=digest_size, person=f"round{i}".encode()
+            )
+            for i in range(rounds)
+        ]
+
+    def _round(self, index: int, value: int) -> int:
+        digest = self._round_hashes[index].copy()
+        digest.update(value.to_bytes(self._half_bytes, "big"))
+        return int.from_bytes(digest.digest(), "big") & self.mask
+
+    def _encrypt(self, value: int) -> int:
+        left, right = value >> self.half_bits, value & self.mask
+        for index in range(len(self._round_hashes)):
+            left, right = right, left ^ self._round(index, right)
+        return (left << self.half_bits) | right
+
+    def _decrypt(self, value: int) -> int:
+        left, right = value >> self.half_bits, value & self.mask
+        for index in reversed(range(len(self._round_hashes))):
+            left, right = right ^ self._round(index, left), left
+        return (left << self.half_bits) | right
+
+    def permute(self, value: int) -> int:
+        """Map a value to its image in the domain.
+
+        Args:
+            value (int): A value in ``[0, domain_size)``.
+
+        Returns:
+            int: The permuted value, also in ``[0, domain_size)``.
+
+        Raises:
+            ValueError: If the value is outside the domain.
+        """
+        if not 0 <= value < self.domain_size:
+            raise ValueError(f"{value} is outside the permutation domain")
+        value = self._encrypt(value)
+        while value >= self.domain_size:
+            value = self._encrypt(value)
+        return value
+
+    def invert(self, value: int) -> int:
+        """Map an image back to the value it was permuted from.
+
+        Args:
+            value (int): A value in ``[0, domain_size)``.
+
+        Returns:
+            int: The value whose image is ``value``.
+
+        Raises:
+            ValueError: If the value is outside the domain.
+        """
+        if not 0 <= value < self.domain_size:
+            raise ValueError(f"{value} is outside the permutation domain")
+        value = self._decrypt(value)
+        while value >= self.domain_size:
+            value = self._decrypt(value)
+        return value
@@ -0,0 +1,57 @@
+import os
+import threading
+
+
+class ConfigAttribute:
+    """Class attribute read from the system configuration on every access.
+
+    Nothing is read when the class is defined, so importing it never touches
+    the database, and configuration changes apply without a restart.
+    Assigning to the attribute on the class replaces the descriptor with a
+    fixed value.
+    """
+
+    def __init__(self, getter) -> None:
+        """Initialize the attribute.
+
+        Args:
+            getter (callable): Returns the current value, e.g. a helper of
+                ``config.settings_utils``.
+        """
+        self.getter = getter
+
+    def __get__(self, instance, owner=None):
+        return self.getter()
+
+
+class ProcessLocal:
+    """Class attribute built on first access, once per process.
+
+    A forked child builds its own value instead of inheriting the parent's,
+    so clients holding sockets or threads are never shared across workers.
+    """
+
+    def __init__(self, factory) -> None:
+        """Initialize the attribute.
+
+        Args:
+            factory (callable): Builds the value, called without arguments.
+        """
+        self.factory = factory
+        self._value = None
+        self._pid = None
+        self._lock = threading.Lock()
+        # A fork while another thread held the lock would leave it locked
+        os.register_at_fork(after_in_child=self._reset_lock)
+
+    def _reset_lock(self) -> None:
+        self._lock = threading.Lock()
+
+    def __get__(self, instance, owner=None):
+        pid = os.getpid()
+        if self._pid != pid:
+            with self._lock:
+                if self._pid != pid:
+                    self._value = self.factory()
+                    self._pid = pid
+        return self._value
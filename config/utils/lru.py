@@ -0,0 +1,100 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Thread-safe, size-bounded in-process LRU cache with optional expiry.
+
+    Entries are evicted least-recently-used first once ``maxsize`` is reached.
+    When ``ttl`` is set, entries older than ``ttl`` seconds are treated as misses.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize (int, optional): Maximum number of entries. Defaults to 1024.
+            ttl (float, optional): Default entry lifetime in seconds. Defaults to None.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default on miss or expiry.
+
+        Args:
+            key: Cache key.
+            default (any, optional): Value returned on miss. Defaults to None.
+
+        Returns:
+            any: The cached value or default.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl: float | None = None) -> None:
+        """Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key.
+            value (any): Value to store.
+            ttl (float, optional): Entry lifetime in seconds. Defaults to the cache ttl.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key) -> None:
+        """Remove a key if present.
+
+        Args:
+            key: Cache key.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry and reset hit/miss counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Return size and hit/miss counters.
+
+        Returns:
+            dict: Current size, maxsize, hits, misses and hit ratio.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,59 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class TokenBucketCache:
+    """Thread-safe, size-bounded set of in-process token buckets.
+
+    Each key gets its own bucket on first use. Buckets are evicted
+    least-recently-used first once ``maxsize`` is reached, which only
+    forgets how much of its burst an idle key had used.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Initialize the buckets.
+
+        Args:
+            maxsize (int, optional): Maximum number of buckets. Defaults to 1024.
+        """
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, key, capacity: float, refill_rate: float) -> bool:
+        """Take one token from a key's bucket.
+
+        Args:
+            key: Bucket key.
+            capacity (float): Maximum number of tokens, i.e. the allowed burst.
+            refill_rate (float): Tokens added per second.
+
+        Returns:
+            bool: True if a token was available, False if the bucket is empty.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                tokens = capacity
+                while self._data and len(self._data) >= self.maxsize:
+                    self._data.popitem(last=False)
+            else:
+                tokens, updated_at = entry
+                tokens = min(capacity, tokens + (now - updated_at) * refill_rate)
+                self._data.move_to_end(key)
+
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._data[key] = (tokens, now)
+            return allowed
+
+    def clear(self) -> None:
+        """Remove every bucket."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,18 +1,38 @@
 import pytest
 
+from api.admin_panel.system.ConfigCacheService import ConfigCacheService
+from api.custom_auth.PrincipalCacheService import PrincipalCacheService
 from api.throttling import RedisRateLimiter
 from unittest.mock import patch
 
+from api.url.services.BurstThresholdService import BurstThresholdService
 from api.url.services.ShortCodeService import ShortCodeService
+from api.url.redirection.RuleSetCacheService import RuleSetCacheService
+from api.url.services.BurstProtectionService import (
+    BurstProtectionService,
+    PreFilterStats,
+)
+from api.url.services.UrlCacheService import UrlCacheService
 
 
 @pytest.fixture(autouse=True)
 def clear_redis():
     limiter = RedisRateLimiter()
     limiter.redis_client.flushdb()
+    UrlCacheService._local.clear()
+    RuleSetCacheService._local.clear()
+    BurstProtectionService._prefilter.clear()
+    PreFilterStats.reset()
+    BurstThresholdService._roles.clear()
+    ConfigCacheService.clear()
+    PrincipalCacheService._local.clear()
     ShortCodeService().refill_pool(50)
     yield
     limiter.redis_client.flushdb()
+    UrlCacheService._local.clear()
+    RuleSetCacheService._local.clear()
+    ConfigCacheService.clear()
+    PrincipalCacheService._local.clear()
 
 
 @pytest.fixture
@@ -20,5 +40,8 @@ def disable_burst_protection():
     with patch(
         "api.url.services.BurstProtectionService.BurstProtectionService.check_burst",
         return_value=True,
+    ), patch(
+        "api.url.services.BurstProtectionService.BurstProtectionService.acheck_burst",
+        return_value=True,
     ):
         yield
@@ -1,12 +1,18 @@
 import pytest
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
 from datetime import datetime, timedelta, timezone
 from api.analytics.utils import hash_ip
 from api.url.models import Url, UrlStatus
 from api.analytics.models import Visit
 from api.url.services.UrlService import UrlService
+from api.admin_panel.user_management.UserManagementService import (
+    UserManagementService,
+)
 from api.url.serializers.UrlSerializer import ShortenUrlSerializer
 
 """
@@ -933,3 +939,243 @@ class TestAdminSearchUsersEndpoint:
         response = self.client.get(url)
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestAdminBurstThresholdsEndpoint:
+    """Test /api/admin/url/burst-thresholds/ endpoints"""
+
+    def setup_method(self):
+        self.client = APIClient()
+        self.admin_user = User.objects.create_user(
+            username="adminuser",
+            email="admin@example.com",
+            password="adminpass123",
+            role=User.Role.ADMIN,
+        )
+        self.client.force_authenticate(user=self.admin_user)
+        self.staff_user = User.objects.create_user(
+            username="staffuser",
+            email="staff@example.com",
+            password="staffpass123",
+            role=User.Role.STAFF,
+        )
+        self.url = Url.objects.create(
+            long_url="https://www.example.com/campaign",
+            short_url="campaign1",
+            user=self.staff_user,
+        )
+        UrlStatus.objects.create(url=self.url, state=UrlStatus.State.ACTIVE)
+
+    def test_url_override_reaches_cached_redirect_record(self):
+        """Test a URL override is merged over the defaults and cached"""
+        from api.url.services.UrlCacheService import UrlCacheService
+
+        UrlCacheService().resolve("campaign1")
+        url = f"/api/admin/url/burst-thresholds/url/{self.url.id}/"
+
+        response = self.client.put(
+            url, {"medium_term_limit": 50000, "short_term_limit": 10000}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.data["data"]
+        assert data["overrides"] == {
+            "short_term_limit": 10000,
+            "medium_term_limit": 50000,
+        }
+        assert data["effective"]["medium_term_limit"] == 50000
+        assert data["effective"]["long_term_limit"] == 1000
+        resolved = UrlCacheService().resolve("campaign1")
+        assert resolved.burst_thresholds == {
+            "short_term_limit": 10000,
+            "medium_term_limit": 50000,
+        }
+
+    def test_url_override_wins_over_role_override(self):
+        """Test role overrides apply to the owner's links unless the URL overrides"""
+        response = self.client.put(
+            "/api/admin/url/burst-thresholds/role/STAFF/",
+            {"short_term_limit": 100, "long_term_limit": 5000},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        self.client.put(
+            f"/api/admin/url/burst-thresholds/url/{self.url.id}/",
+            {"short_term_limit": 500},
+            format="json",
+        )
+
+        response = self.client.get(
+            f"/api/admin/url/burst-thresholds/url/{self.url.id}/"
+        )
+
+        effective = response.data["data"]["effective"]
+        assert effective["short_term_limit"] == 500
+        assert effective["long_term_limit"] == 5000
+        listing = self.client.get("/api/admin/url/burst-thresholds/").data["data"]
+        assert listing["roles"] == [
+            {"role": "STAFF", "short_term_limit": 100, "long_term_limit": 5000}
+        ]
+        assert listing["urls"][0]["short_url"] == "campaign1"
+
+    def test_role_override_replaces_stale_cached_records(self):
+        """Test records built from old role overrides are not served"""
+        from api.url.services.BurstThresholdService import BurstThresholdService
+        from api.url.services.UrlCacheService import UrlCacheService
+
+        cache_service = UrlCacheService()
+        stale = cache_service.resolve("campaign1")
+        stale_roles = BurstThresholdService._roles.get("roles")
+
+        response = self.client.put(
+            "/api/admin/url/burst-thresholds/role/STAFF/",
+            {"short_term_limit": 100},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        # Another worker still holding the old role overrides writes back
+        # the record it built before the change
+        BurstThresholdService._roles.set("roles", stale_roles)
+        cache_service._set_shared(stale)
+        UrlCacheService._local.clear()
+
+        resolved = cache_service.resolve("campaign1")
+
+        assert resolved.burst_thresholds == {"short_term_limit": 100}
+
+    def test_role_change_invalidates_owner_links(self):
+        """Test links follow their owner to the overrides of a new role"""
+        from api.url.services.UrlCacheService import UrlCacheService
+
+        self.client.put(
+            "/api/admin/url/burst-thresholds/role/USER/",
+            {"short_term_limit": 5},
+            format="json",
+        )
+        assert UrlCacheService().resolve("campaign1").burst_thresholds is None
+
+        self.staff_user.role = User.Role.USER
+        self.staff_user.save()
+
+        resolved = UrlCacheService().resolve("campaign1")
+
+        assert resolved.burst_thresholds == {"short_term_limit": 5}
+
+    def test_delete_resets_to_defaults(self):
+        """Test deleting an override makes the link inherit again"""
+        url = f"/api/admin/url/burst-thresholds/url/{self.url.id}/"
+        self.client.put(url, {"short_term_limit": 500}, format="json")
+
+        response = self.client.delete(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert self.client.get(url).data["data"]["overrides"] == {}
+
+    def test_invalid_values_rejected(self):
+        """Test limits and windows must be positive"""
+        response = self.client.put(
+            f"/api/admin/url/burst-thresholds/url/{self.url.id}/",
+            {"short_term_window": 0},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_unknown_role_and_url(self):
+        """Test unknown roles and URLs return 404"""
+        response = self.client.put(
+            "/api/admin/url/burst-thresholds/role/OWNER/",
+            {"short_term_limit": 5},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        response = self.client.get("/api/admin/url/burst-thresholds/url/999999/")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_staff_cannot_tune_thresholds(self):
+        """Test only admins can change burst thresholds"""
+        self.client.force_authenticate(user=self.staff_user)
+
+        response = self.client.put(
+            f"/api/admin/url/burst-thresholds/url/{self.url.id}/",
+            {"short_term_limit": 10**6},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestAdminPermissionQueries:
+    """Test admin permissions reuse the authenticated user"""
+
+    def setup_method(self):
+        self.client = APIClient()
+        self.admin_user = User.objects.create_user(
+            username="adminuser",
+            email="admin@example.com",
+            password="adminpass123",
+            role=User.Role.ADMIN,
+        )
+        self.client.cookies["access_token"] = str(AccessToken.for_user(self.admin_user))
+        self.url = "/api/admin/system/config/"
+
+    def _user_queries(self, queries):
+        table = User._meta.db_table
+        return [q["sql"] for q in queries if f'FROM "{table}"' in q["sql"]]
+
+    def test_user_loaded_once_per_request(self):
+        """Test only authentication reads the user, not the permission check"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(self._user_queries(queries.captured_queries)) == 1
+
+    def test_cached_principal_skips_user_query(self):
+        """Test later requests with the same token do not read the user"""
+        self.client.get(self.url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert self._user_queries(queries.captured_queries) == []
+
+    def test_deleted_admin_is_refused(self):
+        """Test deleting a user drops its cached principal"""
+        assert self.client.get(self.url).status_code == status.HTTP_200_OK
+
+        UserManagementService.bulk_user_deletion([self.admin_user.id])
+
+        response = self.client.get(self.url)
+
+        assert response.status_code in (
+            status.HTTP_401_UNAUTHORIZED,
+            status.HTTP_403_FORBIDDEN,
+        )
+
+    def test_role_change_applies_to_next_request(self):
+        """Test a demoted admin is refused on the very next request"""
+        assert self.client.get(self.url).status_code == status.HTTP_200_OK
+
+        self.admin_user.role = User.Role.USER
+        self.admin_user.save()
+
+        assert self.client.get(self.url).status_code == status.HTTP_403_FORBIDDEN
+
+    def test_banned_admin_is_refused(self):
+        """Test a banned admin's token stops working immediately"""
+        assert self.client.get(self.url).status_code == status.HTTP_200_OK
+
+        UserManagementService.toggle_ban_user(self.admin_user.id)
+
+        response = self.client.get(self.url)
+
+        assert response.status_code in (
+            status.HTTP_401_UNAUTHORIZED,
+            status.HTTP_403_FORBIDDEN,
+        )
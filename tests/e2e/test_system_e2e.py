@@ -625,3 +625,98 @@ class TestBatchCreateSystemConfigurationView:
         if response.status_code == status.HTTP_200_OK:
             assert "results" in response.data["data"]
             assert "errors" in response.data["data"]
+
+
+@pytest.mark.django_db
+class TestUrlBloomFilterStatsView:
+    """Test GET /api/admin/system/bloom-filter/ endpoint"""
+
+    def setup_method(self):
+        self.client = APIClient()
+        self.url = "/api/admin/system/bloom-filter/"
+        self.admin_user = User.objects.create_user(
+            username="adminuser",
+            email="admin@test.com",
+            password="adminpass123",
+            role=User.Role.ADMIN,
+        )
+        self.regular_user = User.objects.create_user(
+            username="regularuser",
+            email="user@test.com",
+            password="testpass123",
+            role=User.Role.USER,
+        )
+
+    def test_admin_gets_filter_stats(self):
+        """Test admins can read false-positive rate and memory use"""
+        self.client.force_authenticate(user=self.admin_user)
+
+        response = self.client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.data["data"]
+        assert "estimated_false_positive_rate" in data
+        assert "memory_bytes" in data
+        assert data["built"] is False
+
+    def test_regular_user_access_denied(self):
+        """Test regular users cannot read filter stats"""
+        self.client.force_authenticate(user=self.regular_user)
+
+        response = self.client.get(self.url)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestRuleContextStatsView:
+    """Test GET /api/admin/system/rule-context/ endpoint"""
+
+    def setup_method(self):
+        self.client = APIClient()
+        self.url = "/api/admin/system/rule-context/"
+        self.admin_user = User.objects.create_user(
+            username="adminuser",
+            email="admin@test.com",
+            password="adminpass123",
+            role=User.Role.ADMIN,
+        )
+
+    def test_admin_gets_lookup_counters(self):
+        """Test admins can read how many geo/UA lookups rules needed"""
+        self.client.force_authenticate(user=self.admin_user)
+
+        response = self.client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "geo_lookups" in response.data["data"]
+        assert "ua_lookups" in response.data["data"]
+
+
+@pytest.mark.django_db
+class TestBurstPreFilterStatsView:
+    """Test GET /api/admin/system/burst-prefilter/ endpoint"""
+
+    def setup_method(self):
+        self.client = APIClient()
+        self.url = "/api/admin/system/burst-prefilter/"
+        self.admin_user = User.objects.create_user(
+            username="adminuser",
+            email="admin@test.com",
+            password="adminpass123",
+            role=User.Role.ADMIN,
+        )
+
+    def test_admin_gets_shed_and_checked_counters(self):
+        """Test admins can read how many clicks were shed locally"""
+        from api.url.services.BurstProtectionService import PreFilterStats
+
+        PreFilterStats.record(shed=True)
+        PreFilterStats.record(shed=False)
+        PreFilterStats.record(shed=False)
+        self.client.force_authenticate(user=self.admin_user)
+
+        response = self.client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"] == {"shed": 1, "checked": 2}
@@ -76,6 +76,40 @@ class TestURLShortenEndpoint:
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
+    def test_shorten_url_with_cache_policy(self):
+        """Test opted-in caching is stored and its semantics are described"""
+        payload = {
+            "name": "cached",
+            "long_url": "https://www.example.com/cached",
+            "redirect_type": 307,
+            "cache_max_age": 600,
+            "allow_cached_redirects": True,
+        }
+
+        response = self.client.post(self.url, payload, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.data["data"]
+        assert data["redirect_type"] == 307
+        assert data["allow_cached_redirects"] is True
+        policy = data["cache_policy"]
+        assert policy["status"] == 307
+        assert policy["cache_control"] == "public, max-age=600"
+        assert "600 seconds" in policy["invalidation"]
+
+    def test_shorten_url_caching_requires_opt_in(self):
+        """Test permanent or cached redirects need the analytics trade-off flag"""
+        payload = {
+            "name": "permanent",
+            "long_url": "https://www.example.com/permanent",
+            "redirect_type": 301,
+        }
+
+        response = self.client.post(self.url, payload, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "allow_cached_redirects" in response.data["message"]
+
     def test_shorten_url_invalid_format(self):
         """Test Url shortening with invalid Url format"""
         payload = {"long_url": "not-a-valid-url"}
@@ -380,6 +414,114 @@ class TestURLRedirectEndpoint:
         self.url_obj.refresh_from_db()
         assert self.url_obj.visits == initial_visits + 3
 
+    def test_redirect_sets_rate_limit_headers(self):
+        """Test the plain redirect view still reports the IP rate limit"""
+        url = f"/api/url/redirect/{self.url_obj.short_url}/"
+
+        response = self.client.get(url)
+
+        assert response.status_code == status.HTTP_302_FOUND
+        assert "X-RateLimit-Limit" in response
+        assert "X-RateLimit-Remaining" in response
+
+    def test_redirect_rejects_post(self):
+        """Test redirect only answers safe methods"""
+        url = f"/api/url/redirect/{self.url_obj.short_url}/"
+
+        response = self.client.post(url)
+
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+
+    def test_redirect_uncached_by_default(self):
+        """Test links that did not opt in keep uncacheable 302 redirects"""
+        url = f"/api/url/redirect/{self.url_obj.short_url}/"
+
+        response = self.client.get(url)
+
+        assert response.status_code == status.HTTP_302_FOUND
+        assert "max-age" not in response.get("Cache-Control", "")
+
+    def test_redirect_applies_cache_policy(self):
+        """Test opted-in links send their status code and Cache-Control"""
+        cached = Url.objects.create(
+            long_url="https://www.example.com/cached",
+            short_url="cached123",
+            user=self.user,
+            redirect_type=Url.RedirectType.PERMANENT,
+            cache_max_age=3600,
+            allow_cached_redirects=True,
+        )
+        UrlStatus.objects.create(url=cached)
+
+        response = self.client.get(f"/api/url/redirect/{cached.short_url}/")
+
+        assert response.status_code == status.HTTP_301_MOVED_PERMANENTLY
+        assert response["Location"] == cached.long_url
+        assert response["Cache-Control"] == "public, max-age=3600"
+
+    def test_redirect_with_rules_varies_and_stays_private(self):
+        """Test links with rules are not permanent or shared-cacheable"""
+        from api.url.redirection.models import RedirectionRule
+
+        cached = Url.objects.create(
+            long_url="https://www.example.com/ruled",
+            short_url="ruled1234",
+            user=self.user,
+            redirect_type=Url.RedirectType.PERMANENT,
+            cache_max_age=600,
+            allow_cached_redirects=True,
+        )
+        UrlStatus.objects.create(url=cached)
+        RedirectionRule.objects.create(
+            name="Mobile",
+            url=cached,
+            conditions={"mobile": True},
+            target_url="https://m.example.com",
+        )
+
+        response = self.client.get(f"/api/url/redirect/{cached.short_url}/")
+
+        assert response.status_code == status.HTTP_302_FOUND
+        assert response["Cache-Control"] == "private, max-age=600"
+        assert "User-Agent" in response["Vary"]
+
+    def test_listing_cache_policies_queries_rules_once(self):
+        """Test listed cache policies do not query rules once per link"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from api.url.redirection.models import RedirectionRule
+
+        self.client.force_authenticate(user=self.user)
+
+        def list_queries():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get("/api/url/")
+            assert response.status_code == status.HTTP_200_OK
+            return len(queries), response.data["data"]["urls"]
+
+        baseline, _ = list_queries()
+        for index in range(3):
+            cached = Url.objects.create(
+                long_url=f"https://www.example.com/listed{index}",
+                short_url=f"listed{index}",
+                user=self.user,
+                cache_max_age=600,
+                allow_cached_redirects=True,
+            )
+            UrlStatus.objects.create(url=cached)
+            RedirectionRule.objects.create(
+                name="Mobile",
+                url=cached,
+                conditions={"mobile": True},
+                target_url="https://m.example.com",
+            )
+        query_count, urls = list_queries()
+
+        assert query_count == baseline
+        policies = {url["short_url"]: url["cache_policy"] for url in urls}
+        assert policies["listed0"]["cache_control"] == "private, max-age=600"
+        assert policies[self.url_obj.short_url]["cache_control"] is None
+
 
 @pytest.mark.django_db
 @pytest.mark.usefixtures("disable_burst_protection")
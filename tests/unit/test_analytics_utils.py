@@ -1,7 +1,19 @@
 import pytest
-from api.analytics.utils import convert_ip_to_location
+from unittest.mock import patch
+from django.test import override_settings
+from api.analytics import utils
+from api.analytics.utils import (
+    UNKNOWN_USER_AGENT,
+    ParsedUserAgent,
+    clear_user_agent_cache,
+    convert_ip_to_location,
+    parse_user_agent,
+    user_agent_cache_stats,
+)
 from config.redis_utils import get_redis_client
 
+FIREFOX_UA = "Mozilla/5.0 (X11; Linux x86_64; rv:120.0) Gecko/20100101 Firefox/120.0"
+
 
 @pytest.fixture(scope="function")
 def redis_client():
@@ -80,3 +92,57 @@ def test_geocoder_exception_handling(redis_client):
     assert cached == "Unknown"
     ttl = redis_client.ttl(key)
     assert ttl == 86400
+
+
+@pytest.fixture
+def user_agent_cache():
+    clear_user_agent_cache()
+    yield
+    clear_user_agent_cache()
+
+
+def test_parse_user_agent_returns_slots_record(user_agent_cache):
+    """Test parsed user agents are compact records with dict-style access"""
+    parsed = parse_user_agent(FIREFOX_UA)
+    assert isinstance(parsed, ParsedUserAgent)
+    assert parsed.browser == "firefox"
+    assert parsed["os"] == "linux"
+    assert parsed.is_mobile is False
+    assert not hasattr(parsed, "__dict__")
+
+
+def test_parse_user_agent_empty(user_agent_cache):
+    """Test empty user agents skip the cache and the parser"""
+    assert parse_user_agent("") is UNKNOWN_USER_AGENT
+    assert user_agent_cache_stats()["parsed"] == 0
+
+
+def test_parse_user_agent_is_cached(user_agent_cache):
+    """Test repeated user agents are parsed once"""
+    with patch.object(utils, "parse", wraps=utils.parse) as parse:
+        first = parse_user_agent(FIREFOX_UA)
+        second = parse_user_agent(FIREFOX_UA)
+
+    assert first is second
+    assert parse.call_count == 1
+    stats = user_agent_cache_stats()
+    assert stats["parsed"] == 1
+    assert stats["local"]["hits"] == 1
+    assert stats["local"]["misses"] == 1
+
+
+@override_settings(USER_AGENT_CACHE_REDIS=True)
+def test_parse_user_agent_shared_through_redis(redis_client, user_agent_cache):
+    """Test a worker with a cold LRU reuses another worker's parse"""
+    redis_client.delete(utils.USER_AGENT_CACHE_KEY)
+    parsed = parse_user_agent(FIREFOX_UA)
+    clear_user_agent_cache()
+
+    with patch.object(utils, "parse") as parse:
+        shared = parse_user_agent(FIREFOX_UA)
+
+    parse.assert_not_called()
+    assert shared == parsed
+    assert user_agent_cache_stats()["redis_hits"] == 1
+    assert redis_client.ttl(utils.USER_AGENT_CACHE_KEY) > 0
+    redis_client.delete(utils.USER_AGENT_CACHE_KEY)
@@ -0,0 +1,79 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.test import AsyncRequestFactory, TestCase
+from rest_framework_simplejwt.tokens import AccessToken
+from api.url.fast_redirect import aredirect_view
+from api.url.models import Url, UrlStatus
+from api.url.services.BurstProtectionService import BurstProtectionService
+from api.url.services.UrlCacheService import UrlCacheService
+from config.redis_utils import get_redis_client
+
+
+class AsyncRedirectTest(TestCase):
+    """Test suite for the redis.asyncio redirect flow"""
+
+    def setUp(self):
+        self.redis_client = get_redis_client()
+        self.redis_client.flushdb()
+        UrlCacheService._local.clear()
+        self.factory = AsyncRequestFactory()
+
+        self.url = Url.objects.create(
+            short_url="async123", long_url="https://example.com/async"
+        )
+        UrlStatus.objects.create(url=self.url, state=UrlStatus.State.ACTIVE)
+
+    def tearDown(self):
+        self.redis_client.flushdb()
+        UrlCacheService._local.clear()
+
+    def _request(self, short_url, ip="192.168.1.1"):
+        request = self.factory.get(
+            f"/api/url/redirect/{short_url}/",
+            REMOTE_ADDR=ip,
+            HTTP_USER_AGENT="Mozilla/5.0 (X11; Linux x86_64) Firefox/120.0",
+        )
+        request.user = AnonymousUser()
+        return request
+
+    async def test_redirect_records_visit(self):
+        """Test the async view redirects and buffers the visit"""
+        response = await aredirect_view(self._request("async123"), "async123")
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response["Location"], "https://example.com/async")
+        self.assertEqual(self.redis_client.get(f"url:{self.url.id}:visits"), "1")
+        self.assertEqual(self.redis_client.llen("analytics:visits"), 1)
+        self.assertEqual(self.redis_client.zcard("rate_limit:throttle_ip:192.168.1.1"), 1)
+
+    async def test_authenticated_visitor_throttled_per_user(self):
+        """Test a valid access token moves the visitor to the user rate limit"""
+        user = await get_user_model().objects.acreate_user(
+            username="visitor", password="testpass"
+        )
+        request = self._request("async123")
+        request.COOKIES["access_token"] = str(AccessToken.for_user(user))
+
+        response = await aredirect_view(request, "async123")
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            self.redis_client.zcard(f"rate_limit:throttle_user:{user.pk}"), 1
+        )
+        self.assertFalse(self.redis_client.exists("rate_limit:throttle_ip:192.168.1.1"))
+
+    async def test_redirect_unknown_code(self):
+        """Test the async view returns 404 for unknown codes"""
+        response = await aredirect_view(self._request("missing"), "missing")
+
+        self.assertEqual(response.status_code, 404)
+
+    async def test_async_burst_matches_sync_limits(self):
+        """Test acheck_burst blocks once the short-term limit is reached"""
+        service = BurstProtectionService()
+        service.default_thresholds["short_term_limit"] = 3
+
+        results = [await service.acheck_burst("10.0.0.1", "async123") for _ in range(4)]
+
+        self.assertEqual(results, [True, True, True, False])
+        self.assertEqual(self.redis_client.zcard("burst_protection:url:async123"), 3)
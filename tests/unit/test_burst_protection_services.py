@@ -2,7 +2,10 @@ from django.test import TestCase
 from unittest.mock import Mock, patch, MagicMock
 import redis
 from django.utils import timezone
-from api.url.services.BurstProtectionService import BurstProtectionService
+from api.url.services.BurstProtectionService import (
+    BurstProtectionService,
+    PreFilterStats,
+)
 from api.url.models import Url, UrlStatus
 
 
@@ -584,3 +587,213 @@ class BurstProtectionIntegrationTest(TestCase):
 
         result = self.service.check_burst(self.test_ip, self.test_short_url)
         self.assertIsInstance(result, bool)
+
+    # ==================== Test Atomic Engine ====================
+
+    def test_atomic_engine_blocks_at_limit(self):
+        """Test the Lua engine enforces the short-term limit and flags the url"""
+        self.service.default_thresholds["short_term_limit"] = 3
+
+        with self.settings(BURST_PROTECTION_ENGINE="atomic"):
+            results = [
+                self.service.check_burst(self.test_ip, self.test_short_url)
+                for _ in range(4)
+            ]
+
+        self.assertEqual(results, [True, True, True, False])
+        url_key = f"burst_protection:url:{self.test_short_url}"
+        self.assertEqual(self.service.redis_client.zcard(url_key), 3)
+        self.assertGreater(self.service.redis_client.ttl(url_key), 0)
+        self.assertFalse(self.service.redis_client.keys("burst_protection:lock:*"))
+        self.url_status.refresh_from_db()
+        self.assertEqual(self.url_status.state, UrlStatus.State.FLAGGED)
+
+    def test_atomic_engine_concurrent_clicks_one_link(self):
+        """Test many threads on one link admit exactly the limit, with no lock"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        limit = 25
+        self.service.default_thresholds["short_term_limit"] = limit
+
+        with patch.object(self.service, "_flag_url") as mock_flag:
+            with ThreadPoolExecutor(max_workers=32) as executor:
+                results = list(
+                    executor.map(
+                        lambda _: self.service.check_burst_atomic(
+                            self.test_ip, self.test_short_url
+                        ),
+                        range(200),
+                    )
+                )
+
+        self.assertEqual(results.count(True), limit)
+        self.assertEqual(
+            self.service.redis_client.zcard(
+                f"burst_protection:url:{self.test_short_url}"
+            ),
+            limit,
+        )
+        self.assertEqual(mock_flag.call_count, 200 - limit)
+
+    def test_atomic_engine_fails_open(self):
+        """Test Redis errors do not turn visitors away"""
+        with patch.object(
+            self.service,
+            "_get_script",
+            side_effect=redis.ConnectionError("down"),
+        ):
+            self.assertTrue(
+                self.service.check_burst_atomic(self.test_ip, self.test_short_url)
+            )
+
+    # ==================== Test Bucket Engine ====================
+
+    def test_bucket_engine_blocks_at_limit(self):
+        """Test the bucketed engine enforces the short-term limit and flags the url"""
+        self.service.default_thresholds["short_term_limit"] = 3
+
+        with self.settings(BURST_PROTECTION_ENGINE="bucket"):
+            results = [
+                self.service.check_burst(self.test_ip, self.test_short_url)
+                for _ in range(4)
+            ]
+
+        self.assertEqual(results, [True, True, True, False])
+        self.assertFalse(self.service.redis_client.keys("burst_protection:url:*"))
+        self.url_status.refresh_from_db()
+        self.assertEqual(self.url_status.state, UrlStatus.State.FLAGGED)
+
+    def test_bucket_engine_memory_is_bounded(self):
+        """Test two hours of clicks keep at most one field per bucket"""
+        start = float(int(self.test_timestamp))
+        for second in range(0, 7200, 5):
+            self.assertTrue(
+                self.service.check_burst_buckets(
+                    self.test_ip, self.test_short_url, timestamp=start + second
+                )
+            )
+
+        url_key, ip_key = self.service._bucket_keys(self.test_ip, self.test_short_url)
+        max_fields = sum(
+            self.service.default_thresholds[f"{term}_term_window"] // width + 1
+            for term, width in zip(
+                ("short", "medium", "long"), self.service.BUCKET_WIDTHS
+            )
+        )
+        self.assertLessEqual(self.service.redis_client.hlen(url_key), max_fields)
+        self.assertLessEqual(self.service.redis_client.hlen(ip_key), max_fields)
+        self.assertGreater(self.service.redis_client.ttl(ip_key), 0)
+
+    def test_bucket_engine_weights_partly_expired_bucket(self):
+        """Test clicks in the oldest bucket count by its overlap with the window"""
+        self.service.default_thresholds["short_term_limit"] = 10
+        start = float(int(self.test_timestamp))
+
+        with patch.object(self.service, "_flag_url"):
+            for _ in range(10):
+                self.service.check_burst_buckets(
+                    self.test_ip, self.test_short_url, timestamp=start
+                )
+            # The full bucket is still entirely inside the window
+            self.assertFalse(
+                self.service.check_burst_buckets(
+                    self.test_ip, self.test_short_url, timestamp=start + 9.9
+                )
+            )
+            # Half the bucket has left the window, so it counts as 5 clicks
+            results = [
+                self.service.check_burst_buckets(
+                    self.test_ip, self.test_short_url, timestamp=start + 10.5
+                )
+                for _ in range(6)
+            ]
+
+        self.assertEqual(results, [True] * 5 + [False])
+
+    # ==================== Test Pre-filter ====================
+
+    def test_prefilter_sheds_flood_without_redis(self):
+        """Test clicks past the local bucket are rejected without a Redis call"""
+        self.service.default_thresholds["short_term_limit"] = 4
+        # Slow refill, so the bucket stays empty however slow the test runs
+        self.service.default_thresholds["short_term_window"] = 3600
+
+        with self.settings(
+            BURST_PROTECTION_ENGINE="atomic", BURST_PREFILTER_FRACTION=1.5
+        ):
+            results = [
+                self.service.check_burst(self.test_ip, self.test_short_url)
+                for _ in range(6)
+            ]
+            with patch.object(self.service, "check_burst_atomic") as mock_check:
+                shed = [
+                    self.service.check_burst(self.test_ip, self.test_short_url)
+                    for _ in range(10)
+                ]
+
+        # Redis rejected and flagged the link before the local bucket emptied
+        self.assertEqual(results, [True] * 4 + [False] * 2)
+        self.url_status.refresh_from_db()
+        self.assertEqual(self.url_status.state, UrlStatus.State.FLAGGED)
+        self.assertEqual(shed, [False] * 10)
+        mock_check.assert_not_called()
+        self.assertEqual(PreFilterStats.stats(), {"shed": 10, "checked": 6})
+
+    def test_prefilter_keys_by_ip_and_link(self):
+        """Test a flood is shed whether it comes from one IP or many"""
+        self.service.default_thresholds["short_term_limit"] = 2
+        self.service.default_thresholds["short_term_window"] = 3600
+
+        with self.settings(BURST_PREFILTER_FRACTION=1.5):
+            # One link flooded from many IPs
+            for i in range(3):
+                self.assertTrue(
+                    self.service._prefilter_allows(f"10.0.0.{i}", self.test_short_url)
+                )
+            self.assertFalse(
+                self.service._prefilter_allows("10.0.0.9", self.test_short_url)
+            )
+            # One IP flooding many links
+            for i in range(3):
+                self.assertTrue(
+                    self.service._prefilter_allows(self.test_ip, f"other{i}")
+                )
+            self.assertFalse(self.service._prefilter_allows(self.test_ip, "other9"))
+            # Other visitors of other links are untouched
+            self.assertTrue(self.service._prefilter_allows("10.0.1.1", "other0"))
+
+    def test_prefilter_disabled(self):
+        """Test a fraction of 0 sends every click to Redis"""
+        with self.settings(BURST_PREFILTER_FRACTION=0):
+            for _ in range(50):
+                self.assertTrue(
+                    self.service._prefilter_allows(self.test_ip, self.test_short_url)
+                )
+        self.assertEqual(len(BurstProtectionService._prefilter), 0)
+
+    # ==================== Test Threshold Overrides ====================
+
+    def test_overrides_raise_limit_for_one_link(self):
+        """Test a link's overrides replace the defaults for its clicks only"""
+        self.service.default_thresholds["short_term_limit"] = 3
+
+        with self.settings(BURST_PROTECTION_ENGINE="atomic"):
+            results = [
+                self.service.check_burst(
+                    self.test_ip, self.test_short_url, {"short_term_limit": 5}
+                )
+                for _ in range(6)
+            ]
+
+        self.assertEqual(results, [True] * 5 + [False])
+        self.assertEqual(self.service.default_thresholds["short_term_limit"], 3)
+
+    def test_thresholds_for_merges_over_defaults(self):
+        """Test missing override fields fall back to the defaults"""
+        thresholds = self.service.thresholds_for({"long_term_limit": 50000})
+
+        self.assertEqual(thresholds["long_term_limit"], 50000)
+        self.assertEqual(thresholds["short_term_limit"], 10)
+        self.assertIs(
+            self.service.thresholds_for(None), self.service.default_thresholds
+        )
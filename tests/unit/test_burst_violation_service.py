@@ -0,0 +1,117 @@
+from django.test import TestCase
+
+from api.admin_panel.fraud.models import FraudIncident
+from api.url.models import Url, UrlStatus
+from api.url.services.BurstProtectionService import BurstProtectionService
+from api.url.services.BurstViolationService import BurstViolationService
+from api.url.services.UrlCacheService import UrlCacheService
+
+
+class BurstViolationServiceTest(TestCase):
+    """Test suite for BurstViolationService"""
+
+    def setUp(self):
+        self.service = BurstViolationService()
+        self.service.redis_client.flushdb()
+        UrlCacheService._local.clear()
+
+        self.url = Url.objects.create(
+            short_url="attacked1", long_url="https://example.com/attacked"
+        )
+        self.url_status = UrlStatus.objects.create(
+            url=self.url, state=UrlStatus.State.ACTIVE
+        )
+
+    def tearDown(self):
+        self.service.redis_client.flushdb()
+        UrlCacheService._local.clear()
+
+    def test_record_only_touches_redis(self):
+        """Test queuing a violation writes nothing to the database"""
+        with self.assertNumQueries(0):
+            for i in range(20):
+                self.service.record("attacked1", f"10.0.0.{i}")
+
+        self.url_status.refresh_from_db()
+        self.assertEqual(self.url_status.state, UrlStatus.State.ACTIVE)
+        self.assertEqual(
+            self.service.redis_client.smembers(BurstViolationService.PENDING_KEY),
+            {"attacked1"},
+        )
+        self.assertEqual(
+            self.service.redis_client.hget("burst_violations:attacked1", "hits"), "20"
+        )
+
+    def test_record_flips_cached_state(self):
+        """Test the cached URL reads as flagged before the worker runs"""
+        cache_service = UrlCacheService()
+        cache_service.resolve("attacked1")
+
+        self.service.record("attacked1", "10.0.0.1")
+
+        self.assertEqual(
+            cache_service.resolve("attacked1").state, UrlStatus.State.FLAGGED
+        )
+        UrlCacheService._local.clear()
+        self.assertEqual(
+            cache_service.resolve("attacked1").state, UrlStatus.State.FLAGGED
+        )
+
+    def test_record_does_not_create_cache_entry(self):
+        """Test an uncached URL is not given a partial cache hash"""
+        self.service.record("attacked1", "10.0.0.1")
+
+        self.assertFalse(self.service.redis_client.exists("url_cache:attacked1"))
+
+    def test_process_coalesces_per_url(self):
+        """Test many violations give one transition and one incident with a hit count"""
+        for i in range(25):
+            self.service.record("attacked1", f"10.0.0.{i}")
+
+        result = self.service.process()
+
+        self.assertEqual(result, {"urls": 1, "flagged": 1, "hits": 25})
+        self.url_status.refresh_from_db()
+        self.assertEqual(self.url_status.state, UrlStatus.State.FLAGGED)
+        incident = FraudIncident.objects.get(url=self.url, incident_type="burst")
+        self.assertEqual(incident.details["hits"], 25)
+        self.assertEqual(incident.details["ip"], "10.0.0.0")
+        self.assertEqual(incident.details["last_ip"], "10.0.0.24")
+        self.assertFalse(self.service.redis_client.exists("burst_violations:attacked1"))
+
+    def test_process_extends_open_incident(self):
+        """Test later violations add to the URL's recent incident"""
+        for _ in range(3):
+            self.service.record("attacked1", "10.0.0.1")
+        self.service.process()
+        for _ in range(4):
+            self.service.record("attacked1", "10.0.0.2")
+
+        result = self.service.process()
+
+        self.assertEqual(result["flagged"], 0)
+        incident = FraudIncident.objects.get(url=self.url, incident_type="burst")
+        self.assertEqual(incident.details["hits"], 7)
+        self.assertEqual(incident.details["last_ip"], "10.0.0.2")
+
+    def test_process_empty_queue(self):
+        """Test the worker is a no-op without violations"""
+        with self.assertNumQueries(0):
+            result = self.service.process()
+
+        self.assertEqual(result, {"urls": 0, "flagged": 0, "hits": 0})
+
+    def test_async_flagging_keeps_database_off_the_click_path(self):
+        """Test a blocked click only queues the violation when enabled"""
+        protection = BurstProtectionService()
+        protection.default_thresholds["short_term_limit"] = 2
+
+        with self.settings(BURST_FLAG_ASYNC=True, BURST_PROTECTION_ENGINE="atomic"):
+            for _ in range(2):
+                protection.check_burst("10.0.0.1", "attacked1")
+            with self.assertNumQueries(0):
+                self.assertFalse(protection.check_burst("10.0.0.1", "attacked1"))
+
+        self.assertFalse(FraudIncident.objects.exists())
+        self.service.process()
+        self.assertEqual(FraudIncident.objects.count(), 1)
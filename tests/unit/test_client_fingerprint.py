@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory, TestCase, override_settings
+from api.analytics import fingerprint
+from api.analytics.fingerprint import get_fingerprint
+from api.url.fast_redirect import redirect_view
+from api.url.models import Url, UrlStatus
+from api.url.redirection.models import RedirectionRule
+from api.url.redirection.RuleSetCacheService import RuleSetCacheService
+from api.url.services.UrlCacheService import UrlCacheService
+from config.redis_utils import get_redis_client
+
+
+class ClientFingerprintTest(TestCase):
+    """Test suite for the per-request client fingerprint"""
+
+    def setUp(self):
+        self.redis_client = get_redis_client()
+        self.redis_client.flushdb()
+        UrlCacheService._local.clear()
+        RuleSetCacheService._local.clear()
+        self.factory = RequestFactory()
+
+        self.url = Url.objects.create(
+            short_url="finger12", long_url="https://example.com/finger"
+        )
+        UrlStatus.objects.create(url=self.url, state=UrlStatus.State.ACTIVE)
+        # Reaches both the geolocation and the user agent conditions
+        RedirectionRule.objects.create(
+            name="US desktop",
+            url=self.url,
+            conditions={"country": ["US"], "mobile": False},
+            target_url="https://example.com/us",
+        )
+
+    def tearDown(self):
+        self.redis_client.flushdb()
+        UrlCacheService._local.clear()
+        RuleSetCacheService._local.clear()
+
+    def _request(self):
+        request = self.factory.get(
+            "/api/url/redirect/finger12/",
+            REMOTE_ADDR="8.8.8.8",
+            HTTP_USER_AGENT="curl/7.68.0",
+        )
+        request.user = AnonymousUser()
+        return request
+
+    def _assert_each_step_runs_once(self):
+        with patch.object(
+            fingerprint, "get_ip_address", wraps=fingerprint.get_ip_address
+        ) as get_ip, patch.object(
+            fingerprint, "hash_ip", wraps=fingerprint.hash_ip
+        ) as hash_ip, patch.object(
+            fingerprint, "parse_user_agent", wraps=fingerprint.parse_user_agent
+        ) as parse_ua, patch.object(
+            fingerprint, "convert_ip_to_location", return_value="US"
+        ) as geo:
+            response = redirect_view(self._request(), "finger12")
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response["Location"], "https://example.com/us")
+        self.assertEqual(get_ip.call_count, 1)
+        self.assertEqual(hash_ip.call_count, 1)
+        self.assertEqual(parse_ua.call_count, 1)
+        self.assertEqual(geo.call_count, 1)
+
+        fraud = self.redis_client.lrange("analytics:fraud", 0, -1)
+        self.assertEqual(len(fraud), 1)
+        self.assertIn("8.8.8.8", fraud[0])
+
+    def test_redirect_derives_each_attribute_once(self):
+        """Test burst, rules, analytics and fraud share one fingerprint"""
+        self._assert_each_step_runs_once()
+
+    @override_settings(REDIRECT_ATOMIC_SIDE_EFFECTS=True)
+    def test_atomic_redirect_derives_each_attribute_once(self):
+        """Test the single-script redirect path shares the fingerprint too"""
+        self._assert_each_step_runs_once()
+
+    def test_fingerprint_is_attached_to_request(self):
+        """Test repeated lookups return the same instance"""
+        request = self._request()
+
+        self.assertIs(get_fingerprint(request), get_fingerprint(request))
+        self.assertEqual(get_fingerprint(request).suspicious_ua_pattern, "scripting")
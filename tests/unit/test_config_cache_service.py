@@ -0,0 +1,73 @@
+from django.test import TestCase
+
+from api.admin_panel.system.ConfigCacheService import ConfigCacheService
+from api.admin_panel.system.ConfigService import ConfigService
+from api.admin_panel.system.models import SystemConfiguration
+from config.settings_utils import get_analytics_track_ip, get_throttle_rates
+
+
+class ConfigCacheServiceTest(TestCase):
+    """Test suite for ConfigCacheService"""
+
+    def setUp(self):
+        ConfigCacheService.clear()
+        SystemConfiguration.objects.create(key="rate_limit_ip", value="20/minute")
+        SystemConfiguration.objects.create(key="short_code_length", value="10")
+        SystemConfiguration.objects.create(key="analytics_track_ip", value="false")
+
+    def tearDown(self):
+        ConfigCacheService.clear()
+
+    def test_loads_typed_snapshot_in_one_query(self):
+        """Test every key is read in one query and converted to its type"""
+        with self.assertNumQueries(1):
+            self.assertEqual(ConfigCacheService.get("rate_limit_ip"), "20/minute")
+            self.assertEqual(ConfigCacheService.get("short_code_length"), 10)
+            self.assertIs(ConfigCacheService.get("analytics_track_ip"), False)
+            self.assertEqual(ConfigCacheService.get("max_urls_per_user"), 100)
+
+        with self.assertNumQueries(0):
+            for _ in range(100):
+                get_throttle_rates()
+                get_analytics_track_ip()
+
+    def test_invalid_value_falls_back_to_default(self):
+        """Test a value that does not match the schema type is ignored"""
+        SystemConfiguration.objects.create(key="max_urls_per_user", value="many")
+
+        self.assertEqual(ConfigCacheService.get("max_urls_per_user"), 100)
+
+    def test_set_config_refreshes_snapshot(self):
+        """Test writes through ConfigService are visible on the next read"""
+        self.assertEqual(ConfigCacheService.get("short_code_length"), 10)
+
+        ConfigService.set_config("short_code_length", "12")
+        self.assertEqual(ConfigCacheService.get("short_code_length"), 12)
+
+        ConfigService.batch_set_configs({"rate_limit_user": "50/minute"})
+        self.assertEqual(get_throttle_rates()["user"], "50/minute")
+
+    def test_published_version_marks_snapshot_stale(self):
+        """Test a change published by another process triggers a reload"""
+        ConfigCacheService.get("rate_limit_ip")
+        SystemConfiguration.objects.filter(key="rate_limit_ip").update(
+            value="5/minute"
+        )
+
+        ConfigCacheService._handle_message({"data": ConfigCacheService._version})
+        self.assertEqual(ConfigCacheService.get("rate_limit_ip"), "20/minute")
+
+        ConfigCacheService._publish()
+        ConfigCacheService._handle_message({"data": ConfigCacheService._version + 1})
+        self.assertEqual(ConfigCacheService.get("rate_limit_ip"), "5/minute")
+
+    def test_version_recheck_catches_missed_messages(self):
+        """Test a version bump is noticed even without a message"""
+        ConfigCacheService.get("rate_limit_ip")
+        SystemConfiguration.objects.filter(key="rate_limit_ip").update(
+            value="5/minute"
+        )
+        ConfigCacheService._publish()
+
+        ConfigCacheService._next_check = 0.0
+        self.assertEqual(ConfigCacheService.get("rate_limit_ip"), "5/minute")
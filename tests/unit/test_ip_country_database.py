@@ -0,0 +1,72 @@
+import os
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from api.analytics.geoip import IpCountryDatabase, reset_ip_country_database
+from api.analytics.utils import convert_ip_to_location
+
+FIXTURE = Path(__file__).resolve().parent.parent / "fixtures" / "ip_country_sample.csv"
+
+
+class IpCountryDatabaseTest(SimpleTestCase):
+    """Test suite for the memory-mapped IP to country database"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "ip_country.bin")
+        self.output = StringIO()
+        call_command(
+            "import_ip_country_db", str(FIXTURE), output=self.db_path, stdout=self.output
+        )
+        self.database = IpCountryDatabase(self.db_path)
+        reset_ip_country_database()
+
+    def tearDown(self):
+        self.database.close()
+        reset_ip_country_database()
+        self.tmp_dir.cleanup()
+
+    def test_import_reports_ranges(self):
+        """Test the import skips the header and unknown rows and drops overlaps"""
+        message = self.output.getvalue()
+        self.assertIn("6 IPv4 and 2 IPv6 ranges", message)
+        self.assertIn("2 rows skipped", message)
+        self.assertIn("1 overlapping ranges dropped", message)
+        self.assertEqual(len(self.database), 8)
+
+    def test_ipv4_lookup(self):
+        """Test IPv4 lookups at range edges, inside ranges and in gaps"""
+        self.assertEqual(self.database.lookup("1.0.0.0"), "AU")
+        self.assertEqual(self.database.lookup("1.0.0.255"), "AU")
+        self.assertEqual(self.database.lookup("1.0.2.7"), "CN")
+        self.assertEqual(self.database.lookup("1.0.20.3"), "JP")
+        self.assertEqual(self.database.lookup("8.8.8.8"), "US")
+        self.assertIsNone(self.database.lookup("8.8.9.1"))
+        self.assertIsNone(self.database.lookup("0.0.0.1"))
+        self.assertIsNone(self.database.lookup("10.1.1.1"))
+
+    def test_ipv6_lookup(self):
+        """Test IPv6 and IPv4-mapped lookups"""
+        self.assertEqual(self.database.lookup("2001:4860:4860::8888"), "US")
+        self.assertEqual(self.database.lookup("2a03:2880::1"), "IE")
+        self.assertEqual(self.database.lookup("::ffff:81.2.69.160"), "GB")
+        self.assertIsNone(self.database.lookup("ffff::1"))
+
+    def test_invalid_address(self):
+        """Test malformed input returns None"""
+        self.assertIsNone(self.database.lookup("not-an-ip"))
+
+    def test_convert_ip_to_location_uses_database(self):
+        """Test geolocation never reaches geocoder or Redis with a local database"""
+        with override_settings(GEOIP_DB_PATH=self.db_path), patch(
+            "api.analytics.utils.geocoder.ip"
+        ) as geocode, patch("api.analytics.utils.get_redis_client") as redis:
+            self.assertEqual(convert_ip_to_location("81.2.69.160"), "GB")
+            self.assertEqual(convert_ip_to_location("192.0.2.1"), "Unknown")
+
+        geocode.assert_not_called()
+        redis.assert_not_called()
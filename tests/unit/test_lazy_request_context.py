@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+from django.test import RequestFactory, SimpleTestCase
+from api.analytics.utils import ParsedUserAgent
+from api.url.redirection.compiler import compile_rules
+from api.url.redirection.context import ContextLookupStats, LazyRequestContext
+
+
+class LazyRequestContextTest(SimpleTestCase):
+    """Test suite for on-demand rule evaluation context"""
+
+    def setUp(self):
+        ContextLookupStats.reset()
+        self.request = RequestFactory().get(
+            "/api/url/redirect/abc/",
+            REMOTE_ADDR="8.8.8.8",
+            HTTP_USER_AGENT="Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X)",
+            HTTP_REFERER="https://twitter.com/post",
+            HTTP_ACCEPT_LANGUAGE="en-US,en;q=0.9",
+        )
+
+    def tearDown(self):
+        ContextLookupStats.reset()
+
+    @patch("api.analytics.fingerprint.parse_user_agent")
+    @patch("api.analytics.fingerprint.convert_ip_to_location")
+    def test_referer_rule_skips_geo_and_ua(self, geo, parse_ua):
+        """Test rules on cheap dimensions never touch geo or UA parsing"""
+        rule_set = compile_rules(
+            [
+                {
+                    "id": 1,
+                    "name": "Twitter",
+                    "target_url": "https://example.com/t",
+                    "priority": 0,
+                    "conditions": {"referer": ["twitter.com"], "language": ["en"]},
+                }
+            ]
+        )
+        context = LazyRequestContext(self.request)
+
+        self.assertIsNotNone(rule_set.match(context))
+        geo.assert_not_called()
+        parse_ua.assert_not_called()
+
+    @patch("api.analytics.fingerprint.parse_user_agent")
+    @patch("api.analytics.fingerprint.convert_ip_to_location")
+    def test_values_are_memoized(self, geo, parse_ua):
+        """Test each expensive lookup runs at most once per request"""
+        geo.return_value = "us"
+        parse_ua.return_value = ParsedUserAgent("ios", "mobile safari", "iphone", True)
+        context = LazyRequestContext(self.request)
+
+        for _ in range(3):
+            self.assertEqual(context.get("country"), "US")
+            self.assertEqual(context.get("device_type"), "mobile")
+            self.assertEqual(context.get("browser"), "mobile safari")
+
+        geo.assert_called_once()
+        parse_ua.assert_called_once()
+
+    @patch("api.analytics.fingerprint.parse_user_agent")
+    @patch("api.analytics.fingerprint.convert_ip_to_location")
+    def test_stats_count_lookups(self, geo, parse_ua):
+        """Test the counters record the lookups evaluations needed"""
+        geo.return_value = "US"
+        lazy = LazyRequestContext(self.request)
+        lazy.get("referer")
+        ContextLookupStats.record(lazy)
+        eager = LazyRequestContext(self.request)
+        eager.get("country")
+        ContextLookupStats.record(eager)
+
+        with patch("api.url.redirection.context.get_redis_client") as redis:
+            redis.return_value.hgetall.return_value = {}
+            stats = ContextLookupStats.stats()
+
+        self.assertEqual(stats["evaluations"], 2)
+        self.assertEqual(stats["geo_lookups"], 1)
+        self.assertEqual(stats["ua_lookups"], 0)
+        self.assertNotIn("geo_avoided", stats)
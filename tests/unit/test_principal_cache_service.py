@@ -0,0 +1,59 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from api.custom_auth.PrincipalCacheService import PrincipalCacheService
+
+User = get_user_model()
+
+
+class PrincipalCacheServiceTest(TestCase):
+    """Test suite for PrincipalCacheService"""
+
+    def setUp(self):
+        self.service = PrincipalCacheService()
+        self.service.redis_client.flushdb()
+        PrincipalCacheService._local.clear()
+        self.user = User.objects.create_user(
+            username="dashboard",
+            email="dashboard@test.com",
+            password="pass123",
+            first_name="Dash",
+            role=User.Role.STAFF,
+        )
+
+    def tearDown(self):
+        self.service.redis_client.flushdb()
+        PrincipalCacheService._local.clear()
+
+    def test_cached_principal_behaves_like_user(self):
+        """Test a cached principal is a user instance with the cached fields"""
+        self.service.set(self.user, "jti-1", ttl=60)
+        PrincipalCacheService._local.clear()
+
+        with self.assertNumQueries(0):
+            principal = self.service.get(self.user.id, "jti-1")
+            self.assertEqual(principal, self.user)
+            self.assertEqual(principal.role, User.Role.STAFF)
+            self.assertTrue(principal.is_authenticated)
+            self.assertTrue(principal.is_active)
+
+        # Fields that are not cached load on first access
+        with self.assertNumQueries(1):
+            self.assertEqual(principal.first_name, "Dash")
+
+    def test_entries_are_per_token(self):
+        """Test another token of the same user is a miss"""
+        self.service.set(self.user, "jti-1", ttl=60)
+
+        self.assertIsNone(self.service.get(self.user.id, "jti-2"))
+
+    def test_saving_user_invalidates_every_token(self):
+        """Test a role change drops the cached principals of all tokens"""
+        self.service.set(self.user, "jti-1", ttl=60)
+        self.service.set(self.user, "jti-2", ttl=60)
+
+        self.user.role = User.Role.USER
+        self.user.save()
+
+        self.assertIsNone(self.service.get(self.user.id, "jti-1"))
+        self.assertIsNone(self.service.get(self.user.id, "jti-2"))
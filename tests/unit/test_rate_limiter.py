@@ -0,0 +1,65 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.test import TestCase, override_settings
+
+from api.throttling import RedisRateLimiter
+
+
+@override_settings(RATE_LIMITER_ENGINE="gcra")
+class GcraRateLimiterTest(TestCase):
+    """Test suite for the GCRA engine of RedisRateLimiter"""
+
+    def setUp(self):
+        self.limiter = RedisRateLimiter()
+        self.limiter.redis_client.flushdb()
+
+    def tearDown(self):
+        self.limiter.redis_client.flushdb()
+
+    def test_allows_burst_up_to_limit(self):
+        """Test a fresh key admits exactly the limit, then rejects"""
+        results = [self.limiter.is_allowed("gcra:burst", 10, 60) for _ in range(12)]
+
+        self.assertEqual(
+            [allowed for allowed, _ in results], [True] * 10 + [False] * 2
+        )
+        self.assertEqual(
+            [metadata["remaining"] for _, metadata in results[:10]],
+            list(range(9, -1, -1)),
+        )
+
+    def test_concurrent_requests_never_exceed_limit(self):
+        """Test concurrent callers on one key admit exactly the limit"""
+
+        def attempt(_):
+            return self.limiter.is_allowed("gcra:race", 50, 60)[0]
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            allowed = sum(executor.map(attempt, range(200)))
+
+        self.assertEqual(allowed, 50)
+
+    def test_reset_reports_next_admission_when_denied(self):
+        """Test a denied request resets after one emission interval"""
+        for _ in range(10):
+            self.limiter.is_allowed("gcra:reset", 10, 60)
+
+        before = time.time()
+        allowed, metadata = self.limiter.is_allowed("gcra:reset", 10, 60)
+
+        self.assertFalse(allowed)
+        self.assertEqual(metadata["limit"], 10)
+        self.assertEqual(metadata["remaining"], 0)
+        # One request frees up every 6 seconds
+        self.assertLessEqual(metadata["reset"], before + 7)
+        self.assertGreaterEqual(metadata["reset"], before + 5)
+
+    def test_stores_one_timestamp_per_key(self):
+        """Test the key holds a single value that expires with the allowance"""
+        for _ in range(5):
+            self.limiter.is_allowed("gcra:memory", 10, 60)
+
+        redis_client = self.limiter.redis_client
+        self.assertEqual(redis_client.type("rate_limit:gcra:gcra:memory"), "string")
+        self.assertLessEqual(redis_client.pttl("rate_limit:gcra:gcra:memory"), 30000)
@@ -0,0 +1,206 @@
+import json
+from unittest.mock import patch
+
+from django.test import TestCase, RequestFactory, override_settings
+from api.analytics.fingerprint import get_fingerprint
+from api.url.models import Url, UrlStatus
+from api.url.services.BurstProtectionService import BurstProtectionService
+from api.url.services.RedirectPipelineService import RedirectPipelineService
+from api.admin_panel.fraud.models import FraudIncident
+
+
+@override_settings(BURST_PROTECTION_ENGINE="atomic")
+class RedirectPipelineServiceTest(TestCase):
+    """Test suite for RedirectPipelineService"""
+
+    def setUp(self):
+        self.service = RedirectPipelineService()
+        self.redis_client = self.service.redis_client
+        self.redis_client.flushdb()
+        BurstProtectionService._prefilter.clear()
+        self.factory = RequestFactory()
+        self.test_ip = "192.168.1.1"
+
+        self.url = Url.objects.create(
+            short_url="pipe123", long_url="https://example.com/pipeline"
+        )
+        self.url_status = UrlStatus.objects.create(
+            url=self.url, state=UrlStatus.State.ACTIVE
+        )
+
+    def tearDown(self):
+        self.redis_client.flushdb()
+        BurstProtectionService._prefilter.clear()
+
+    def _request(self):
+        return self.factory.get(
+            "/api/url/redirect/pipe123/",
+            REMOTE_ADDR=self.test_ip,
+            HTTP_USER_AGENT="Mozilla/5.0 (X11; Linux x86_64) Firefox/120.0",
+        )
+
+    def test_allowed_click_records_everything(self):
+        """Test that one script call tracks the burst and buffers the visit"""
+        allowed = self.service.process_click(self._request(), self.test_ip, self.url)
+
+        self.assertTrue(allowed)
+        self.assertEqual(self.redis_client.zcard("burst_protection:url:pipe123"), 1)
+        self.assertEqual(
+            self.redis_client.zcard(f"burst_protection:ip:{self.test_ip}"), 1
+        )
+        self.assertEqual(self.redis_client.get(f"url:{self.url.id}:visits"), "1")
+        self.assertEqual(
+            self.redis_client.get(f"url:{self.url.id}:unique_visits"), "1"
+        )
+        self.assertTrue(self.redis_client.exists(f"url:{self.url.id}:last_accessed"))
+
+        visit = json.loads(self.redis_client.lpop("analytics:visits"))
+        self.assertEqual(visit["url_id"], self.url.id)
+        self.assertTrue(visit["new_visitor"])
+
+    def test_returning_visitor_not_counted_as_unique(self):
+        """Test that a second click from the same IP is not a new visitor"""
+        self.service.process_click(self._request(), self.test_ip, self.url)
+        self.service.process_click(self._request(), self.test_ip, self.url)
+
+        self.assertEqual(self.redis_client.get(f"url:{self.url.id}:visits"), "2")
+        self.assertEqual(
+            self.redis_client.get(f"url:{self.url.id}:unique_visits"), "1"
+        )
+        self.redis_client.lpop("analytics:visits")
+        visit = json.loads(self.redis_client.lpop("analytics:visits"))
+        self.assertFalse(visit["new_visitor"])
+
+    def test_burst_blocks_and_flags(self):
+        """Test that exceeding a window denies the click and flags the URL"""
+        self.service.protection_service.default_thresholds["short_term_limit"] = 2
+
+        for _ in range(2):
+            self.assertTrue(
+                self.service.process_click(self._request(), self.test_ip, self.url)
+            )
+        allowed = self.service.process_click(self._request(), self.test_ip, self.url)
+
+        self.assertFalse(allowed)
+        self.assertEqual(self.redis_client.get(f"url:{self.url.id}:visits"), "2")
+        self.url_status.refresh_from_db()
+        self.assertEqual(self.url_status.state, UrlStatus.State.FLAGGED)
+        self.assertTrue(FraudIncident.objects.filter(url=self.url).exists())
+
+    def test_blocked_click_skips_visit_enrichment(self):
+        """Test that a denied click is not geolocated or parsed"""
+        self.service.protection_service.default_thresholds["short_term_limit"] = 1
+        self.service.process_click(self._request(), self.test_ip, self.url)
+        self.redis_client.delete("analytics:visits")
+
+        request = self._request()
+        allowed = self.service.process_click(request, self.test_ip, self.url)
+
+        self.assertFalse(allowed)
+        fingerprint = get_fingerprint(request)
+        self.assertFalse(fingerprint.country_resolved)
+        self.assertFalse(fingerprint.user_agent_parsed)
+        self.assertEqual(self.redis_client.llen("analytics:visits"), 0)
+
+    def test_redis_errors_let_clicks_through(self):
+        """Test that a failing script fails open instead of rejecting"""
+        with patch.object(
+            RedirectPipelineService, "_get_script", side_effect=ConnectionError
+        ):
+            allowed = self.service.process_click(
+                self._request(), self.test_ip, self.url
+            )
+
+        self.assertTrue(allowed)
+
+    def test_flagging_errors_do_not_escape(self):
+        """Test that a failure while flagging still just rejects the click"""
+        self.service.protection_service.default_thresholds["short_term_limit"] = 1
+        self.service.process_click(self._request(), self.test_ip, self.url)
+
+        with self.settings(BURST_PREFILTER_FRACTION=0), patch.object(
+            self.service.protection_service, "flag", side_effect=RuntimeError
+        ):
+            allowed = self.service.process_click(
+                self._request(), self.test_ip, self.url
+            )
+
+        self.assertFalse(allowed)
+
+    def test_simultaneous_clicks_counted_and_keys_expire(self):
+        """Test same-instant clicks stay distinct and burst keys get a TTL"""
+        from django.utils import timezone
+
+        now = timezone.now()
+        with patch(
+            "api.url.services.BurstProtectionService.timezone.now", return_value=now
+        ):
+            self.service.process_click(self._request(), self.test_ip, self.url)
+            self.service.process_click(self._request(), "10.0.0.2", self.url)
+
+        self.assertEqual(self.redis_client.zcard("burst_protection:url:pipe123"), 2)
+        self.assertGreater(self.redis_client.ttl("burst_protection:url:pipe123"), 0)
+        self.assertGreater(
+            self.redis_client.ttl(f"burst_protection:ip:{self.test_ip}"), 0
+        )
+
+    def test_prefilter_sheds_flood_without_redis(self):
+        """Test clicks past the local buckets never reach the script"""
+        thresholds = self.service.protection_service.default_thresholds
+        thresholds["short_term_limit"] = 2
+        thresholds["short_term_window"] = 3600
+
+        with self.settings(BURST_PREFILTER_FRACTION=1.5):
+            results = [
+                self.service.process_click(self._request(), self.test_ip, self.url)
+                for _ in range(3)
+            ]
+            with patch.object(RedirectPipelineService, "_get_script") as mock_script:
+                shed = self.service.process_click(
+                    self._request(), self.test_ip, self.url
+                )
+
+        self.assertEqual(results, [True, True, False])
+        self.assertFalse(shed)
+        mock_script.assert_not_called()
+
+    def test_link_overrides_apply(self):
+        """Test the resolved link's thresholds replace the defaults"""
+        self.url.burst_thresholds = {"short_term_limit": 1}
+
+        self.assertTrue(
+            self.service.process_click(self._request(), self.test_ip, self.url)
+        )
+        self.assertFalse(
+            self.service.process_click(self._request(), self.test_ip, self.url)
+        )
+
+    @override_settings(BURST_PROTECTION_ENGINE="lock", BURST_PREFILTER_FRACTION=0)
+    def test_other_engines_check_before_counting(self):
+        """Test the configured engine decides and the counters follow it"""
+        self.service.protection_service.default_thresholds["short_term_limit"] = 1
+
+        allowed = self.service.process_click(self._request(), self.test_ip, self.url)
+        blocked = self.service.process_click(self._request(), self.test_ip, self.url)
+
+        self.assertTrue(allowed)
+        self.assertFalse(blocked)
+        self.assertEqual(self.redis_client.zcard("burst_protection:url:pipe123"), 1)
+        self.assertEqual(self.redis_client.get(f"url:{self.url.id}:visits"), "1")
+        self.assertEqual(self.redis_client.llen("analytics:visits"), 1)
+
+    @override_settings(BURST_PROTECTION_ENGINE="lock", BURST_PREFILTER_FRACTION=0)
+    async def test_async_other_engines_check_before_counting(self):
+        """Test the async path also defers to the configured engine"""
+        self.service.protection_service.default_thresholds["short_term_limit"] = 1
+
+        allowed = await self.service.aprocess_click(
+            self._request(), self.test_ip, self.url
+        )
+        blocked = await self.service.aprocess_click(
+            self._request(), self.test_ip, self.url
+        )
+
+        self.assertTrue(allowed)
+        self.assertFalse(blocked)
+        self.assertEqual(self.redis_client.get(f"url:{self.url.id}:visits"), "1")
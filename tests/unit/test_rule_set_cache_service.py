@@ -0,0 +1,120 @@
+from django.test import SimpleTestCase, TestCase
+from api.url.models import Url, UrlStatus
+from api.url.redirection.compiler import compile_rules
+from api.url.redirection.models import RedirectionRule
+from api.url.redirection.RedirectionService import RedirectionService
+from api.url.redirection.RuleSetCacheService import RuleSetCacheService
+from api.url.services.UrlCacheService import UrlCacheService
+
+
+def _row(id, conditions, priority=0):
+    return {
+        "id": id,
+        "name": f"rule {id}",
+        "target_url": f"https://example.com/{id}",
+        "priority": priority,
+        "conditions": conditions,
+    }
+
+
+class RuleCompilerTest(SimpleTestCase):
+    """Test suite for the redirection rule compiler"""
+
+    def test_country_and_language_sets(self):
+        """Test list conditions match by membership"""
+        rule_set = compile_rules([_row(1, {"country": ["US", "CA"], "language": ["en"]})])
+
+        self.assertIsNotNone(rule_set.match({"country": "CA", "language": "en"}))
+        self.assertIsNone(rule_set.match({"country": "FR", "language": "en"}))
+        self.assertIsNone(rule_set.match({"country": None, "language": "en"}))
+
+    def test_referer_patterns(self):
+        """Test referer patterns match as escaped substrings"""
+        rule_set = compile_rules([_row(1, {"referer": ["twitter.com", "t.co"]})])
+
+        self.assertIsNotNone(rule_set.match({"referer": "https://t.co/abc"}))
+        self.assertIsNone(rule_set.match({"referer": "https://tXco.example"}))
+        self.assertIsNone(compile_rules([_row(1, {"referer": []})]).match({"referer": "x"}))
+
+    def test_time_range_intervals(self):
+        """Test same-day and overnight minute-of-day intervals"""
+        day = compile_rules([_row(1, {"time_range": {"start": "09:00", "end": "17:00"}})])
+        night = compile_rules([_row(1, {"time_range": {"start": "22:00", "end": "06:00"}})])
+
+        self.assertIsNotNone(day.match({"time_range": "09:00"}))
+        self.assertIsNone(day.match({"time_range": "17:01"}))
+        self.assertIsNotNone(night.match({"time_range": "23:30"}))
+        self.assertIsNotNone(night.match({"time_range": "05:59"}))
+        self.assertIsNone(night.match({"time_range": "12:00"}))
+
+    def test_first_matching_rule_wins(self):
+        """Test rules are evaluated in the given order"""
+        rule_set = compile_rules(
+            [_row(1, {"mobile": True}), _row(2, {}), _row(3, {"mobile": True})]
+        )
+
+        self.assertEqual(rule_set.match({"mobile": True}).id, 1)
+        self.assertEqual(rule_set.match({"mobile": False}).id, 2)
+
+    def test_unknown_condition_never_matches(self):
+        """Test unsupported keys fail closed like the interpreter did"""
+        rule_set = compile_rules([_row(1, {"planet": "mars"})])
+
+        self.assertIsNone(rule_set.match({"planet": "mars"}))
+
+
+class RuleSetCacheServiceTest(TestCase):
+    """Test suite for RuleSetCacheService"""
+
+    def setUp(self):
+        self.service = RuleSetCacheService()
+        self.service.redis_client.flushdb()
+        RuleSetCacheService._local.clear()
+        UrlCacheService._local.clear()
+
+        self.url = Url.objects.create(
+            short_url="rules123", long_url="https://example.com/rules"
+        )
+        UrlStatus.objects.create(url=self.url, state=UrlStatus.State.ACTIVE)
+        self.rule = RedirectionRule.objects.create(
+            name="Mobile",
+            url=self.url,
+            conditions={"mobile": True},
+            target_url="https://m.example.com",
+        )
+
+    def tearDown(self):
+        self.service.redis_client.flushdb()
+        RuleSetCacheService._local.clear()
+        UrlCacheService._local.clear()
+
+    def test_compiled_rule_set_is_cached(self):
+        """Test repeated lookups of one version do not query"""
+        self.service.get_rule_set(self.url.id, 0)
+
+        with self.assertNumQueries(0):
+            rule_set = self.service.get_rule_set(self.url.id, 0)
+        self.assertEqual(rule_set.rules[0].target_url, "https://m.example.com")
+
+    def test_update_bumps_version(self):
+        """Test rule changes move the URL to a new compiled rule set"""
+        self.assertEqual(UrlCacheService().resolve("rules123").rules_version, 0)
+        self.service.get_rule_set(self.url.id, 0)
+
+        RedirectionService.update_rule(self.rule, {"target_url": "https://new.example.com"})
+
+        resolved = UrlCacheService().resolve("rules123")
+        self.assertEqual(resolved.rules_version, 1)
+        rule_set = self.service.get_rule_set(self.url.id, resolved.rules_version)
+        self.assertEqual(rule_set.rules[0].target_url, "https://new.example.com")
+
+    def test_rule_less_url_skips_lookup(self):
+        """Test the has-rules marker short-circuits evaluation"""
+        self.rule.delete()
+        UrlCacheService().invalidate("rules123")
+        resolved = UrlCacheService().resolve("rules123")
+
+        with self.assertNumQueries(0):
+            self.assertIsNone(
+                RedirectionService().evaluate_redirection_rules(None, resolved)
+            )
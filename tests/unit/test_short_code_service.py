@@ -0,0 +1,174 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from api.admin_panel.system.ConfigService import ConfigService
+from api.throttling import BaseRedisThrottle, RedisRateLimiter
+from api.url.models import Url
+from api.url.services.ShortCodeService import ShortCodeService
+
+
+class ShortCodeServiceConfigTest(TestCase):
+    """Test suite for the lazily read ShortCodeService settings"""
+
+    def test_code_length_follows_configuration(self):
+        """Test the code length is read when used, not when imported"""
+        self.assertEqual(len(ShortCodeService().generate_code()), 8)
+
+        ConfigService.set_config("short_code_length", "12")
+
+        self.assertEqual(ShortCodeService.CODE_LENGTH, 12)
+        self.assertEqual(len(ShortCodeService().generate_code()), 12)
+
+    def test_throttle_limiter_is_shared_within_process(self):
+        """Test the throttle limiter is built once per process"""
+        limiter = BaseRedisThrottle.redis_limiter
+
+        self.assertIsInstance(limiter, RedisRateLimiter)
+        self.assertIs(BaseRedisThrottle().redis_limiter, limiter)
+
+
+class CounterAllocatorTest(TestCase):
+    """Test suite for the counter based short code allocator"""
+
+    def setUp(self):
+        self.service = ShortCodeService()
+        self.service.redis_client.delete(f"{ShortCodeService.COUNTER_KEY}:8")
+        ShortCodeService._counter_block.codes.clear()
+
+    def tearDown(self):
+        ShortCodeService._counter_block.codes.clear()
+
+    def test_permutation_is_bijective_over_full_domain(self):
+        """Test every 2 character code is produced exactly once"""
+        domain_size = 62**2
+        codes = {ShortCodeService.encode_id(i, 2) for i in range(domain_size)}
+
+        self.assertEqual(len(codes), domain_size)
+        permutation = ShortCodeService.permutation(2)
+        for code_id in range(domain_size):
+            self.assertEqual(
+                permutation.invert(permutation.permute(code_id)), code_id
+            )
+
+    def test_consecutive_ids_give_scattered_codes(self):
+        """Test consecutive ids give distinct codes without shared prefixes"""
+        count = 10_000
+        codes = [ShortCodeService.encode_id(i, 8) for i in range(count)]
+
+        self.assertEqual(len(set(codes)), count)
+        self.assertTrue(all(len(code) == 8 for code in codes))
+        shared_prefix = sum(1 for a, b in zip(codes, codes[1:]) if a[:3] == b[:3])
+        self.assertLess(shared_prefix, count // 100)
+
+    @override_settings(SHORT_CODE_ALLOCATOR="counter", SHORT_CODE_COUNTER_BLOCK=100)
+    def test_get_code_draws_from_counter_blocks(self):
+        """Test codes come from reserved blocks and skip existing links"""
+        taken = ShortCodeService.encode_id(1, 8)
+        Url.objects.create(short_url=taken, long_url="https://example.com/taken")
+
+        codes = [self.service.get_code() for _ in range(250)]
+
+        self.assertEqual(len(set(codes)), 250)
+        self.assertNotIn(taken, codes)
+        self.assertEqual(
+            int(self.service.redis_client.get(f"{ShortCodeService.COUNTER_KEY}:8")),
+            300,
+        )
+        self.assertEqual(self.service.redis_client.scard(ShortCodeService.POOL_KEY), 50)
+
+    @override_settings(SHORT_CODE_ALLOCATOR="counter", SHORT_CODE_COUNTER_BLOCK=100)
+    def test_get_codes_spans_counter_blocks(self):
+        """Test a batch larger than a block reserves as many blocks as needed"""
+        codes = self.service.get_codes(250)
+
+        self.assertEqual(len(set(codes)), 250)
+        self.assertEqual(
+            int(self.service.redis_client.get(f"{ShortCodeService.COUNTER_KEY}:8")),
+            300,
+        )
+
+
+@override_settings(SHORT_CODE_ALLOCATOR="pool", SHORT_CODE_LEASE_SIZE=20)
+@patch.object(ShortCodeService, "MIN_POOL_SIZE", 10)
+class LeasedCodesTest(TestCase):
+    """Test suite for short codes leased from the pool per process"""
+
+    def setUp(self):
+        self.service = ShortCodeService()
+        self.service.redis_client.delete(ShortCodeService.POOL_KEY)
+        self.service.refill_pool(100)
+        ShortCodeService._leased.codes.clear()
+
+    def tearDown(self):
+        self.wait_for_top_up()
+        ShortCodeService._leased.codes.clear()
+
+    def wait_for_top_up(self):
+        thread = ShortCodeService._leased.refill_thread
+        if thread is not None:
+            thread.join()
+
+    def pool_size(self):
+        return self.service.redis_client.scard(ShortCodeService.POOL_KEY)
+
+    def test_codes_are_served_from_lease(self):
+        """Test one lease serves many codes and is topped up when low"""
+        codes = [self.service.get_code() for _ in range(15)]
+
+        self.assertEqual(self.pool_size(), 80)
+        self.assertEqual(len(ShortCodeService._leased.codes), 5)
+
+        codes.append(self.service.get_code())
+        self.wait_for_top_up()
+
+        self.assertEqual(self.pool_size(), 60)
+        self.assertEqual(len(ShortCodeService._leased.codes), 24)
+        self.assertEqual(len(set(codes)), 16)
+        pool = self.service.redis_client.smembers(ShortCodeService.POOL_KEY)
+        self.assertFalse(pool & set(codes))
+
+    def test_pool_refill_runs_off_the_request_path(self):
+        """Test leasing on a request never refills the pool inline"""
+        self.service.redis_client.delete(ShortCodeService.POOL_KEY)
+        self.service.refill_pool(20)
+
+        with patch.object(ShortCodeService, "refill_pool") as mock_refill:
+            codes = [self.service.get_code() for _ in range(15)]
+            mock_refill.assert_not_called()
+            self.assertEqual(self.pool_size(), 0)
+
+            # Falling below the low water mark hands the refill to a thread
+            codes.append(self.service.get_code())
+            self.wait_for_top_up()
+            mock_refill.assert_called_once()
+        self.assertEqual(len(set(codes)), 16)
+
+    def test_batch_larger_than_lease(self):
+        """Test a batch leases what it needs with a single pop"""
+        codes = self.service.get_codes(50)
+
+        self.assertEqual(len(set(codes)), 50)
+        self.wait_for_top_up()
+        self.assertEqual(self.pool_size(), 30)
+        self.assertEqual(len(ShortCodeService._leased.codes), 20)
+
+    def test_release_returns_unused_codes(self):
+        """Test unused leased codes go back to the pool"""
+        code = self.service.get_code()
+
+        ShortCodeService._leased.release()
+
+        self.assertEqual(self.pool_size(), 99)
+        self.assertFalse(
+            self.service.redis_client.sismember(ShortCodeService.POOL_KEY, code)
+        )
+
+    @override_settings(SHORT_CODE_LEASE_SIZE=0)
+    def test_get_codes_without_lease_pops_once(self):
+        """Test a batch takes its codes straight from the pool"""
+        codes = self.service.get_codes(60)
+
+        self.assertEqual(len(set(codes)), 60)
+        self.assertEqual(self.pool_size(), 40)
+        self.assertEqual(len(ShortCodeService._leased.codes), 0)
@@ -0,0 +1,86 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory, TestCase
+
+from api.admin_panel.fraud.models import FraudIncident
+from api.admin_panel.fraud.ThrottleViolationService import ThrottleViolationService
+
+User = get_user_model()
+
+
+class ThrottleViolationServiceTest(TestCase):
+    """Test suite for ThrottleViolationService"""
+
+    def setUp(self):
+        self.service = ThrottleViolationService()
+        self.service.redis_client.flushdb()
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(
+            username="throttled", email="throttled@test.com", password="pass123"
+        )
+
+    def tearDown(self):
+        self.service.redis_client.flushdb()
+
+    def _request(self, path="/api/url/shorten/", ip="10.0.0.1", user=None):
+        request = self.factory.post(path, REMOTE_ADDR=ip)
+        request.user = user or AnonymousUser()
+        return request
+
+    def test_record_only_touches_redis(self):
+        """Test counting violations writes nothing to the database"""
+        with self.assertNumQueries(0):
+            for _ in range(500):
+                self.service.record(self._request(), "100/hour")
+
+        self.assertEqual(FraudIncident.objects.count(), 0)
+        self.assertEqual(
+            self.service.redis_client.scard(ThrottleViolationService.PENDING_KEY), 1
+        )
+
+    def test_process_logs_one_incident_per_window(self):
+        """Test repeated violations become one incident carrying the count"""
+        for _ in range(300):
+            self.service.record(self._request(), "100/hour")
+
+        result = self.service.process()
+
+        self.assertEqual(result, {"windows": 1, "created": 1, "hits": 300})
+        incident = FraudIncident.objects.get(incident_type="throttle")
+        self.assertEqual(incident.severity, "medium")
+        self.assertEqual(incident.details["hits"], 300)
+        self.assertEqual(incident.details["ip"], "10.0.0.1")
+        self.assertEqual(incident.details["endpoint"], "/api/url/shorten/")
+        self.assertLessEqual(
+            incident.details["first_seen"], incident.details["last_seen"]
+        )
+
+    def test_later_flush_extends_incident_of_same_window(self):
+        """Test violations drained twice in one window share an incident"""
+        for _ in range(10):
+            self.service.record(self._request(ip="10.0.0.2"), "100/hour")
+        self.service.process()
+        for _ in range(5):
+            self.service.record(self._request(ip="10.0.0.2"), "100/hour")
+
+        result = self.service.process()
+
+        self.assertEqual(result["created"], 0)
+        incident = FraudIncident.objects.get(incident_type="throttle")
+        self.assertEqual(incident.details["hits"], 15)
+
+    def test_clients_and_endpoints_are_kept_apart(self):
+        """Test each client and endpoint gets its own incident"""
+        self.service.record(self._request(ip="10.0.0.3"), "100/hour")
+        self.service.record(self._request(ip="10.0.0.4"), "100/hour")
+        self.service.record(self._request(path="/api/url/list/"), "100/hour")
+        for ip in ("10.0.0.5", "10.0.0.6"):
+            self.service.record(self._request(ip=ip, user=self.user), "1000/hour")
+
+        self.service.process()
+
+        self.assertEqual(FraudIncident.objects.count(), 4)
+        incident = FraudIncident.objects.get(user=self.user)
+        self.assertEqual(incident.details["hits"], 2)
+        self.assertEqual(incident.details["user_id"], self.user.id)
+        self.assertEqual(incident.details["last_ip"], "10.0.0.6")
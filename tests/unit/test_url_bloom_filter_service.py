@@ -0,0 +1,79 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from api.url.models import Url, UrlStatus
+from api.url.services.UrlBloomFilterService import UrlBloomFilterService
+from api.url.services.UrlCacheService import UrlCacheService
+from api.url.services.UrlService import UrlService
+
+User = get_user_model()
+
+
+class UrlBloomFilterServiceTest(TestCase):
+    """Test suite for UrlBloomFilterService"""
+
+    def setUp(self):
+        self.service = UrlBloomFilterService()
+        self.redis_client = self.service.redis_client
+        self.redis_client.flushdb()
+        UrlCacheService._local.clear()
+
+        self.url = Url.objects.create(
+            short_url="bloom123", long_url="https://example.com/bloom"
+        )
+        UrlStatus.objects.create(url=self.url, state=UrlStatus.State.ACTIVE)
+
+    def tearDown(self):
+        self.redis_client.flushdb()
+        UrlCacheService._local.clear()
+
+    def test_unbuilt_filter_lets_everything_through(self):
+        """Test that a missing filter never rejects a code"""
+        self.assertTrue(self.service.might_contain("anything"))
+
+    def test_rebuild_loads_existing_codes(self):
+        """Test that rebuild loads every stored short code"""
+        loaded = self.service.rebuild()
+
+        self.assertEqual(loaded, 1)
+        self.assertTrue(self.service.might_contain("bloom123"))
+        self.assertFalse(self.service.might_contain("nope-not-here"))
+
+    def test_unknown_code_skips_cache_and_database(self):
+        """Test that resolve rejects filtered codes without queries"""
+        self.service.rebuild()
+
+        with self.assertNumQueries(0):
+            self.assertIsNone(UrlCacheService().resolve("nope-not-here"))
+
+    def test_created_urls_are_added(self):
+        """Test that new URLs become visible without a rebuild"""
+        self.service.rebuild()
+        user = User.objects.create_user(
+            username="bloomuser", email="bloom@example.com", password="testpass123"
+        )
+
+        UrlService.create_url(
+            {
+                "user": user.id,
+                "name": None,
+                "long_url": "https://example.com/new",
+                "short_url": "fresh123",
+            }
+        )
+
+        self.assertTrue(self.service.might_contain("fresh123"))
+        self.assertEqual(self.service.stats()["items"], 2)
+
+    def test_stats_report_size_and_error_rate(self):
+        """Test that stats expose memory, fill and false-positive estimate"""
+        self.service.rebuild()
+        self.service.remove("bloom123")
+
+        stats = self.service.stats()
+
+        self.assertTrue(stats["built"])
+        self.assertEqual(stats["items"], 1)
+        self.assertEqual(stats["stale_items"], 1)
+        self.assertEqual(stats["bits_set"], self.service.hash_count)
+        self.assertGreater(stats["memory_bytes"], self.service.size // 8 - 1)
+        self.assertLess(stats["estimated_false_positive_rate"], 0.001)
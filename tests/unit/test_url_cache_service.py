@@ -0,0 +1,133 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from api.admin_panel.user_management.UserManagementService import (
+    UserManagementService,
+)
+from api.url.models import Url, UrlStatus
+from api.url.redirection.models import RedirectionRule
+from api.url.services.UrlCacheService import UrlCacheService
+from api.url.services.UrlService import UrlService
+
+User = get_user_model()
+
+
+class UrlCacheServiceTest(TestCase):
+    """Test suite for UrlCacheService"""
+
+    def setUp(self):
+        self.service = UrlCacheService()
+        self.service.redis_client.flushdb()
+        UrlCacheService._local.clear()
+
+        self.url = Url.objects.create(
+            short_url="cache123", long_url="https://example.com/cached"
+        )
+        self.url_status = UrlStatus.objects.create(
+            url=self.url, state=UrlStatus.State.ACTIVE
+        )
+
+    def tearDown(self):
+        self.service.redis_client.flushdb()
+        UrlCacheService._local.clear()
+
+    def test_resolve_populates_shared_tier(self):
+        """Test that a database hit is written to the Redis hash"""
+        resolved = self.service.resolve("cache123")
+
+        self.assertEqual(resolved.long_url, "https://example.com/cached")
+        self.assertEqual(resolved.state, UrlStatus.State.ACTIVE)
+        self.assertFalse(resolved.has_rules)
+        cached = self.service.redis_client.hgetall("url_cache:cache123")
+        self.assertEqual(cached["long_url"], "https://example.com/cached")
+        self.assertGreater(self.service.redis_client.ttl("url_cache:cache123"), 0)
+
+    def test_hot_link_resolves_without_queries(self):
+        """Test that repeated resolution is served from cache"""
+        self.service.resolve("cache123")
+
+        with self.assertNumQueries(0):
+            resolved = self.service.resolve("cache123")
+        self.assertEqual(resolved.id, self.url.id)
+
+    def test_shared_tier_serves_other_workers(self):
+        """Test that an empty local tier falls back to Redis, not Postgres"""
+        self.service.resolve("cache123")
+        UrlCacheService._local.clear()
+
+        with self.assertNumQueries(0):
+            resolved = self.service.resolve("cache123")
+        self.assertEqual(resolved.long_url, "https://example.com/cached")
+
+    def test_resolve_unknown_code(self):
+        """Test that unknown codes resolve to None and are not cached"""
+        self.assertIsNone(self.service.resolve("missing"))
+        self.assertFalse(self.service.redis_client.exists("url_cache:missing"))
+
+    def test_has_rules_flag(self):
+        """Test that active redirection rules are reflected in the cache"""
+        RedirectionRule.objects.create(
+            name="Mobile",
+            url=self.url,
+            conditions={"device_type": "mobile"},
+            target_url="https://m.example.com",
+        )
+
+        self.assertTrue(self.service.resolve("cache123").has_rules)
+
+    def test_update_url_invalidates(self):
+        """Test that UrlService.update_url drops the stale entry"""
+        self.service.resolve("cache123")
+
+        UrlService.update_url(self.url, {"long_url": "https://example.com/new"})
+
+        self.assertFalse(self.service.redis_client.exists("url_cache:cache123"))
+        self.assertEqual(
+            self.service.resolve("cache123").long_url, "https://example.com/new"
+        )
+
+    def test_deleting_owner_invalidates_links(self):
+        """Test that links removed with their owner stop resolving"""
+        owner = User.objects.create_user(
+            username="owner", email="owner@test.com", password="pass123"
+        )
+        self.url.user = owner
+        self.url.save()
+        self.service.resolve("cache123")
+
+        UserManagementService.bulk_user_deletion([owner.id])
+
+        self.assertFalse(self.service.redis_client.exists("url_cache:cache123"))
+        self.assertIsNone(self.service.resolve("cache123"))
+
+    def test_warm_preloads_recently_visited_urls(self):
+        """Test the warmer fills the shared tier so redirects skip Postgres"""
+        from datetime import timedelta
+        from django.utils import timezone
+
+        Url.objects.filter(id=self.url.id).update(
+            visits=50, last_accessed=timezone.now()
+        )
+        stale = Url.objects.create(
+            short_url="stale123",
+            long_url="https://example.com/stale",
+            visits=500,
+            last_accessed=timezone.now() - timedelta(days=30),
+        )
+        UrlStatus.objects.create(url=stale, state=UrlStatus.State.ACTIVE)
+        RedirectionRule.objects.create(
+            name="Mobile",
+            url=self.url,
+            conditions={"mobile": True},
+            target_url="https://m.example.com",
+        )
+
+        result = self.service.warm(limit=10, days=7)
+
+        self.assertEqual(result["warmed"], 1)
+        self.assertEqual(result["rule_sets"], 1)
+        self.assertIn("duration_ms", result)
+        self.assertFalse(self.service.redis_client.exists("url_cache:stale123"))
+        with self.assertNumQueries(0):
+            resolved = self.service.resolve("cache123")
+        self.assertTrue(resolved.has_rules)
+        self.assertTrue(self.service.redis_client.exists(f"url_rules:{self.url.id}:0"))